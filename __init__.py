@@ -66,7 +66,7 @@ if "bpy" in locals():
     from importlib import reload
 
     # Our own libraries
-    libs = [updateChecker, decorator, decoratorworker]
+    libs = [updateChecker, decoratorlog, profiling, propertyindex, propertyvalue, valuetemplate, scopefilter, decoratorengine, propertysnapshot, propertyresolver, propertystats, autoextend, decoratorhandlers, decoratorworker, decorator, api]
     
     for lib in libs:        
         try:
@@ -79,8 +79,21 @@ if "bpy" in locals():
 # Library imports -----------------------------------------------------------------------------------------------------------------
 import bpy
 from . import updateChecker
-from . import decorator
+from . import decoratorlog
+from . import profiling
+from . import propertyindex
+from . import propertyvalue
+from . import valuetemplate
+from . import scopefilter
+from . import decoratorengine
+from . import propertysnapshot
+from . import propertyresolver
+from . import propertystats
+from . import autoextend
+from . import decoratorhandlers
 from . import decoratorworker
+from . import decorator
+from . import api
 
 # Properties ######################################################################################################################
 
@@ -88,12 +101,29 @@ classes = [
     updateChecker.T1nkerDecoratorUpdateInfo,
     updateChecker.T1NKER_OT_DecoratorUpdateChecker,
     decorator.T1nkerDecoratorAddonPreferences,
+    decorator.DecoratorPropertySpec,
     decorator.DecoratorSettings,    
+    decorator.DECORATOR_UL_PropertySpecs,
+    decorator.DECORATOR_UL_AutoExtendRules,
     decorator.DecoratorPanel,
     decorator.OBJECT_OT_DecoratorAdd,
     decorator.OBJECT_OT_DecoratorExtend,
     decorator.OBJECT_OT_DecoratorReset,
-    decorator.OBJECT_OT_DecoratorRemove
+    decorator.OBJECT_OT_DecoratorRemove,
+    decorator.OBJECT_OT_DecoratorRename,
+    decorator.OBJECT_OT_DecoratorBatchAddItem,
+    decorator.OBJECT_OT_DecoratorBatchRemoveItem,
+    decorator.OBJECT_OT_DecoratorBatchApply,
+    decorator.OBJECT_OT_DecoratorAutoExtendAddRule,
+    decorator.OBJECT_OT_DecoratorAutoExtendRemoveRule,
+    decorator.OBJECT_OT_DecoratorAutoExtendApply,
+    decorator.OBJECT_OT_DecoratorApplyTested,
+    decorator.OBJECT_OT_DecoratorRevertLast,
+    decorator.OBJECT_OT_DecoratorModal,
+    decorator.OBJECT_OT_DecoratorExportSnapshot,
+    decorator.OBJECT_OT_DecoratorImportSnapshot,
+    decorator.OBJECT_OT_DecoratorImportValues,
+    decorator.OBJECT_OT_DecoratorSaveProfile
 ]
 """
 List of classes that need to be registered by Blender
@@ -116,6 +146,16 @@ def register():
         bpy.utils.register_class(c)
     
     bpy.types.Scene.decoratorSettings = bpy.props.PointerProperty(type=decorator.DecoratorSettings)
+    
+    # Apply the undo preference, which can only be read now that preferences are registered
+    try:
+        decorator.setLightweightUndo(bpy.context.preferences.addons[__package__].preferences.useLightweightUndo)
+    except:
+        # Don't panic, operators stay with Blender's undo
+        pass
+    
+    # Keep cached information current
+    decoratorhandlers.register()
 
 
 # Unregister the add-on -----------------------------------------------------------------------------------------------------------
@@ -124,6 +164,20 @@ def unregister():
     Unregister everything that have been registered upon disabling the add-on.
     """
     
+    # Remove handlers
+    try:
+        decoratorhandlers.unregister()
+    except:
+        # Don't panic, they were not added either
+        pass
+    
+    # Stop publishing update checks
+    try:
+        updateChecker.unregister()
+    except:
+        # Don't panic, the timer was not registered either
+        pass
+    
     # Delete settings
     
     try:
@@ -0,0 +1,425 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains the public Python API of the add-on for scripts, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+#
+# USAGE ***************************************************************************************************************************
+# The API works on any collection of objects, such as `bpy.data.objects` or `bpy.context.selected_objects`, without operators,
+# undo steps, update checks or scene settings. In Blender, the statistics, the inherited values and the property index of the
+# add-on are kept current with the changes made:
+#
+#   import importlib
+#   api = importlib.import_module("<add-on module name>.api")
+#
+#   result = api.apply(bpy.context.selected_objects, "Hide at Lod Level", 2, "Add")
+#   print(result.changes, result.added, result.set, result.removed)
+#
+#   preview = api.apply(bpy.data.objects, "LOD", None, "Remove", dryRun=True)
+#   api.applyPlan(preview.plan)
+#
+#   api.apply(bpy.data.objects, "Asset Id", api.template("{collection}_{name}"), "Add")  # computed for each object
+#   api.apply(bpy.data.objects, "LOD", "Lod Level", "Rename", onConflict="Overwrite")  # values kept, moved to the new name
+#
+#   api.apply(bpy.data.objects, "LOD", mode="Remove", where=lambda value: value == 3)  # only where LOD is 3
+#
+#   lod = api.resolve(bpy.context.active_object, "LOD", default=0)  # set on the object, a parent or a collection
+#
+# *********************************************************************************************************************************
+
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+from .decoratorengine import DecoratorEngine, DecoratorWorkerModes, PropertySpec, ChangePlan, ChangeKinds, RenameConflicts
+from .propertyindex import PropertyIndex
+from .propertyresolver import PropertyResolver
+from .propertyvalue import ValueTypes, parseValue
+from .valuetemplate import ValueTemplate
+
+# Result of an operation ##########################################################################################################
+class OperationResult(NamedTuple):
+    """
+    Result of an operation run through the API.
+    """
+
+    plan: ChangePlan
+    """
+    The changes decided. Apply it later with `applyPlan` if it was a dry run.
+    """
+
+    applied: int
+    """
+    Number of changes made, 0 for dry runs.
+    """
+
+    isDryRun: bool
+    """
+    Whether nothing has been changed.
+    """
+
+    @property
+    def changes(self) -> int:
+        """
+        Number of changes made, or that would have been made in a dry run.
+        """
+        return len(self.plan)
+
+    @property
+    def added(self) -> int:
+        """
+        Number of properties added.
+        """
+        return self.plan.counts()[ChangeKinds.Add]
+
+    @property
+    def set(self) -> int:
+        """
+        Number of property values changed.
+        """
+        return self.plan.counts()[ChangeKinds.Set]
+
+    @property
+    def removed(self) -> int:
+        """
+        Number of properties removed.
+        """
+        return self.plan.counts()[ChangeKinds.Remove]
+
+    @property
+    def objectsScanned(self) -> int:
+        """
+        Number of objects processed.
+        """
+        return self.plan.objectsScanned
+
+    @property
+    def changedObjects(self) -> list:
+        """
+        Objects changed (or to be changed), each listed once.
+        """
+        # Objects may not be hashable (like plain dictionaries), so tell them apart by identity
+        objects = {}
+        for change in self.plan.changes:
+            objects.setdefault(id(change.object), change.object)
+
+        return list(objects.values())
+
+
+# Functions #######################################################################################################################
+
+# Make a property operation -------------------------------------------------------------------------------------------------------
+def spec(
+        propertyName: str,
+        propertyValue: Any = None,
+        mode: Union[DecoratorWorkerModes, str] = DecoratorWorkerModes.Add,
+        valueType: Union[ValueTypes, str, None] = None,
+        onConflict: Union[RenameConflicts, str] = RenameConflicts.Skip,
+        where: Optional[Callable[[Any], bool]] = None) -> PropertySpec:
+    """
+    Make a property operation for `applyBatch`.
+
+    Args:
+        propertyName (str): Name of the property.
+        propertyValue (Any, optional): Value to set, or the new name when renaming. Defaults to None (only valid for removal).
+        mode (Union[DecoratorWorkerModes, str], optional): The operation, as a `DecoratorWorkerModes` value or its name 
+        ("Add", "Extend", "Reset", "Remove" or "Rename"). Defaults to DecoratorWorkerModes.Add.
+        valueType (Union[ValueTypes, str, None], optional): If specified, `propertyValue` is text to convert to this type, 
+        as in the panel. Defaults to None, meaning `propertyValue` is used as is.
+        onConflict (Union[RenameConflicts, str], optional): When renaming, what to do with objects already having a property
+        of the new name, as a `RenameConflicts` value or its name ("Skip", "Overwrite" or "KeepExisting"). Defaults to 
+        RenameConflicts.Skip.
+        where (Callable[[Any], bool], optional): When resetting or removing, tells which current values to reset or remove,
+        such as `scopefilter.compileValueCondition(ValueConditions.Equals, "3")`. Defaults to None, meaning any value.
+
+    Raises:
+        ValueError: If the mode, the type or the conflict policy is unknown, the value cannot be converted, or the value 
+        is missing.
+
+    Returns:
+        PropertySpec: The property operation.
+    """
+    try:
+        action = mode if isinstance(mode, DecoratorWorkerModes) else DecoratorWorkerModes[mode]
+    except KeyError:
+        raise ValueError(f"Unknown mode '{mode}', use one of {', '.join(m.name for m in DecoratorWorkerModes)}")
+
+    if action == DecoratorWorkerModes.Remove:
+        return PropertySpec(propertyName, None, action, condition=where)
+
+    if action == DecoratorWorkerModes.Rename:
+        try:
+            policy = onConflict if isinstance(onConflict, RenameConflicts) else RenameConflicts[onConflict]
+        except KeyError:
+            raise ValueError(f"Unknown conflict policy '{onConflict}', use one of {', '.join(p.name for p in RenameConflicts)}")
+
+        if not isinstance(propertyValue, str) or propertyValue == "":
+            raise ValueError(f"A new name is needed to rename property {propertyName}")
+
+        return PropertySpec(propertyName, propertyValue, action, policy)
+
+    if valueType is not None and not isinstance(propertyValue, ValueTemplate):
+        try:
+            valueType = valueType if isinstance(valueType, ValueTypes) else ValueTypes[valueType]
+        except KeyError:
+            raise ValueError(f"Unknown value type '{valueType}', use one of {', '.join(t.name for t in ValueTypes)}")
+
+        propertyValue = parseValue(str(propertyValue), valueType)
+
+    if propertyValue is None:
+        raise ValueError(f"A value is needed to {action.name.lower()} property {propertyName}")
+
+    return PropertySpec(propertyName, propertyValue, action, condition=where)
+
+# Make a value template -----------------------------------------------------------------------------------------------------------
+def template(text: str, valueType: Union[ValueTypes, str] = ValueTypes.String) -> ValueTemplate:
+    """
+    Make a value computed for each object from a template such as `{collection}_{name}` or `LOD{index:02d}`, to pass as a
+    property value. The template is parsed once here, and only the fields of `valuetemplate.templateFields` can be used.
+
+    Args:
+        text (str): The template.
+        valueType (Union[ValueTypes, str], optional): The type to convert the text rendered for each object to, as a 
+        `ValueTypes` value or its name. Defaults to ValueTypes.String.
+
+    Raises:
+        ValueError: If the type is unknown, or the template is not valid.
+
+    Returns:
+        ValueTemplate: The template.
+    """
+    try:
+        valueType = valueType if isinstance(valueType, ValueTypes) else ValueTypes[valueType]
+    except KeyError:
+        raise ValueError(f"Unknown value type '{valueType}', use one of {', '.join(t.name for t in ValueTypes)}")
+
+    return ValueTemplate(text, valueType)
+
+# Apply an operation --------------------------------------------------------------------------------------------------------------
+def apply(
+        objects: Iterable,
+        propertyName: str,
+        propertyValue: Any = None,
+        mode: Union[DecoratorWorkerModes, str] = DecoratorWorkerModes.Add,
+        dryRun: bool = False,
+        valueType: Union[ValueTypes, str, None] = None,
+        index: PropertyIndex = None,
+        onConflict: Union[RenameConflicts, str] = RenameConflicts.Skip,
+        where: Optional[Callable[[Any], bool]] = None) -> OperationResult:
+    """
+    Add, extend, reset, remove or rename a custom property of objects.
+
+    Args:
+        objects (Iterable): The objects to process.
+        propertyName (str): Name of the property.
+        propertyValue (Any, optional): Value to set, or the new name when renaming. Defaults to None (only valid for removal).
+        mode (Union[DecoratorWorkerModes, str], optional): The operation, as a `DecoratorWorkerModes` value or its name. 
+        Defaults to DecoratorWorkerModes.Add.
+        dryRun (bool, optional): Whether to only plan changes without making them. Defaults to False.
+        valueType (Union[ValueTypes, str, None], optional): Type to convert `propertyValue` to from text. Defaults to None.
+        index (PropertyIndex, optional): Index of property names to keep current while changing objects. Defaults to the 
+        index of the add-on when running in Blender.
+        onConflict (Union[RenameConflicts, str], optional): When renaming, what to do with objects already having a property
+        of the new name. Defaults to RenameConflicts.Skip.
+        where (Callable[[Any], bool], optional): When resetting or removing, tells which current values to reset or remove.
+        Defaults to None, meaning any value.
+
+    Raises:
+        ValueError: If the mode, the type or the conflict policy is unknown, the value cannot be converted, or the value 
+        is missing.
+
+    Returns:
+        OperationResult: What has been (or would be) changed.
+    """
+    return applyBatch(objects, [spec(propertyName, propertyValue, mode, valueType, onConflict, where)], dryRun=dryRun, index=index)
+
+# Apply many operations -----------------------------------------------------------------------------------------------------------
+def applyBatch(objects: Iterable, specs: Iterable[PropertySpec], dryRun: bool = False, index: PropertyIndex = None) -> OperationResult:
+    """
+    Apply many property operations to objects in a single pass. Make operations with `spec`.
+
+    Args:
+        objects (Iterable): The objects to process.
+        specs (Iterable[PropertySpec]): The property operations, applied to each object in this order.
+        dryRun (bool, optional): Whether to only plan changes without making them. Defaults to False.
+        index (PropertyIndex, optional): Index of property names to keep current while changing objects. Defaults to the 
+        index of the add-on when running in Blender.
+
+    Returns:
+        OperationResult: What has been (or would be) changed.
+    """
+    engine = DecoratorEngine(isTestOnly=dryRun, index=index or _addonIndex())
+    plan = engine.plan(objects, specs)
+
+    applied = 0 if dryRun else engine.apply(plan)
+
+    if applied > 0:
+        _propertiesChanged(plan.changes, engine.index)
+
+    return OperationResult(plan, applied, dryRun)
+
+# Apply a plan of a dry run -------------------------------------------------------------------------------------------------------
+def applyPlan(plan: ChangePlan, index: PropertyIndex = None) -> OperationResult:
+    """
+    Apply the plan of a dry run. Changes are skipped for properties changed since the plan was made.
+
+    Args:
+        plan (ChangePlan): The plan, such as `OperationResult.plan` of a dry run.
+        index (PropertyIndex, optional): Index of property names to keep current while changing objects. Defaults to the 
+        index of the add-on when running in Blender.
+
+    Returns:
+        OperationResult: What has been changed.
+    """
+    engine = DecoratorEngine(index=index or _addonIndex())
+    applied = engine.apply(plan, verify=True)
+
+    if applied > 0:
+        _propertiesChanged(plan.changes, engine.index)
+
+    return OperationResult(plan, applied, False)
+
+# Resolve an inherited value ------------------------------------------------------------------------------------------------------
+def resolve(object: Any, propertyName: str, default: Any = None, resolver: PropertyResolver = None) -> Any:
+    """
+    Get the effective value of a property of an object, which may be set on the object, a parent object, or a collection the
+    object is in (see `propertyresolver.PropertyResolver` for the order).
+
+    Args:
+        object (Any): The object.
+        propertyName (str): Name of the property.
+        default (Any, optional): The value to return if the property is not set anywhere. Defaults to None.
+        resolver (PropertyResolver, optional): The resolver to use. Defaults to the resolver of the add-on when running in 
+        Blender, which memoizes values of collections until they change.
+
+    Returns:
+        Any: The effective value, or `default`.
+    """
+    return (resolver or _addonResolver()).resolve(object, propertyName, default)
+
+# Get all inherited values --------------------------------------------------------------------------------------------------------
+def effectiveProperties(object: Any, resolver: PropertyResolver = None) -> dict[str, Any]:
+    """
+    Get the effective values of all properties of an object, including ones set on parent objects and collections.
+
+    Args:
+        object (Any): The object.
+        resolver (PropertyResolver, optional): The resolver to use. Defaults to the resolver of the add-on when running in 
+        Blender.
+
+    Returns:
+        dict[str, Any]: The effective values by property name.
+    """
+    return (resolver or _addonResolver()).effectiveProperties(object)
+
+# Forget inherited values ---------------------------------------------------------------------------------------------------------
+def invalidateInherited():
+    """
+    Make the resolver of the add-on forget values of collections it remembers. Call this after changing properties of 
+    collections directly, not through the add-on.
+    """
+    _addonResolver().invalidate()
+
+# Private functions ###############################################################################################################
+
+# Get the index of the add-on -----------------------------------------------------------------------------------------------------
+def _addonIndex() -> PropertyIndex:
+    """
+    Get the property index the add-on keeps for the current file, so that changes made through the API don't make it stale.
+    The index is not built here if not yet built, as it would cost a scan of all objects.
+
+    Returns:
+        PropertyIndex: The index, or `None` when not running in Blender.
+    """
+    try:
+        from . import decoratorhandlers
+    except ImportError:
+        # Not running in Blender
+        return None
+
+    return decoratorhandlers.getPropertyIndex(build=False)
+
+# Tell the add-on about changes ---------------------------------------------------------------------------------------------------
+def _propertiesChanged(changes: list, index: PropertyIndex):
+    """
+    Keep the statistics, the resolver and the index of the add-on current after changing properties, as the operators do.
+    Nothing is done when not running in Blender.
+
+    Args:
+        changes (list[PlannedChange]): The changes made.
+        index (PropertyIndex): The index kept current while making the changes, or `None`.
+    """
+    try:
+        from . import decoratorhandlers
+    except ImportError:
+        # Not running in Blender
+        return
+
+    addonIndex = decoratorhandlers.getPropertyIndex(build=False)
+
+    if index is not addonIndex and addonIndex.isValid:
+        # Changes have been recorded in another index, if any
+        for change in changes:
+            try:
+                addonIndex.refresh(change.object)
+            except ReferenceError:
+                # The object has been deleted since planning
+                addonIndex.discard(change.object)
+
+    decoratorhandlers.propertiesChanged(changes)
+
+# Get the resolver of the add-on --------------------------------------------------------------------------------------------------
+def _addonResolver() -> PropertyResolver:
+    """
+    Get the property resolver the add-on keeps for the current file, so that memoized values of collections are shared.
+
+    Returns:
+        PropertyResolver: The resolver of the add-on, or a new one without collection hierarchy when not running in Blender.
+    """
+    try:
+        from . import decoratorhandlers
+    except ImportError:
+        # Not running in Blender
+        return PropertyResolver()
+
+    return decoratorhandlers.getPropertyResolver()
@@ -0,0 +1,290 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains the bpy-independent logic to extend objects created after enabling auto-extend rules.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from typing import Any, Callable, Iterable, NamedTuple
+from .decoratorengine import ChangePlan, DecoratorEngine, DecoratorWorkerModes, PropertySpec
+from .propertyindex import PropertyIndex
+from .propertyvalue import ValueTypes, parseValue
+from .valuetemplate import ValueTemplate, isTemplate
+
+# A rule of auto-extension ########################################################################################################
+class AutoExtendRule(NamedTuple):
+    """
+    A property to add to each new object if it doesn't have it, as specified on the panel.
+    """
+
+    propertyName: str
+    """
+    Name of the property.
+    """
+
+    propertyValue: str
+    """
+    Value of the property as text.
+    """
+
+    propertyType: str
+    """
+    Name of the type of the value, one of the names of `propertyvalue.ValueTypes`.
+    """
+
+    isValueTemplate: bool = False
+    """
+    Whether the value is a template computed for each object, such as `{collection}_{name}`.
+    """
+
+# Set of objects already seen #####################################################################################################
+class SeenObjects:
+    """
+    Set of objects already seen, identified by small non-negative integers unique in the session, such as `session_uid` of
+    Blender objects. Identifiers are given out in increasing order, so a bitmap takes one bit per identifier ever given out 
+    instead of a hash table entry per object, and adding or checking an object takes constant time.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        """
+        Make an empty set.
+        """
+
+        self.count = 0
+        """
+        Number of objects in the set.
+        """
+
+        self._bits = bytearray()
+
+    # Public functions ============================================================================================================
+
+    # Number of objects -----------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.count
+
+    # Tell if an object has been seen ---------------------------------------------------------------------------------------------
+    def __contains__(self, uid: int) -> bool:
+        byte = uid >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (uid & 7)))
+
+    # Add an object ---------------------------------------------------------------------------------------------------------------
+    def add(self, uid: int) -> bool:
+        """
+        Add an object to the set.
+
+        Args:
+            uid (int): Identifier of the object.
+
+        Returns:
+            bool: `True` if the object has not been seen before, `False` if it has.
+        """
+        byte = uid >> 3
+        bit = 1 << (uid & 7)
+
+        if byte >= len(self._bits):
+            # Grow geometrically so that adding objects one by one doesn't copy the bitmap each time
+            self._bits.extend(bytes(max(byte + 1, 2 * len(self._bits)) - len(self._bits)))
+        elif self._bits[byte] & bit:
+            return False
+
+        self._bits[byte] |= bit
+        self.count += 1
+
+        return True
+
+    # Forget all objects ----------------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Forget all objects, for example when a file is loaded.
+        """
+        self._bits = bytearray()
+        self.count = 0
+
+    # Size of the bitmap ----------------------------------------------------------------------------------------------------------
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes taken by the bitmap.
+        """
+        return len(self._bits)
+
+# Extend new objects ##############################################################################################################
+class AutoExtender:
+    """
+    Applies Extend operations to objects not seen before, to make sure objects created while it's enabled get the properties
+    of the rules. Call `extendNew` with the objects reported as added or changed, which skips objects already seen, so that 
+    the cost is proportional to the number of objects reported, not to the number of objects in the file.
+    
+    Objects can be any mapping-like objects with a small non-negative integer identifier unique in the session.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, uidOf: Callable[[Any], int] = None, index: PropertyIndex = None):
+        """
+        Make an instance.
+
+        Args:
+            uidOf (Callable[[Any], int], optional): Gets the identifier of an object. Defaults to reading `session_uid`, as named
+            in Blender.
+            index (PropertyIndex, optional): Index of property names to keep current when adding properties. Defaults to None.
+        """
+
+        self.uidOf = uidOf or (lambda object: object.session_uid)
+        """
+        Gets the identifier of an object.
+        """
+
+        self.seen = SeenObjects()
+        """
+        Objects already seen.
+        """
+
+        self.engine = DecoratorEngine(index=index)
+        """
+        Engine to plan and apply changes with.
+        """
+
+        self._rules: tuple[AutoExtendRule, ...] = ()
+        self._specs: list[PropertySpec] = []
+
+    # Public functions ============================================================================================================
+
+    # Set the rules ---------------------------------------------------------------------------------------------------------------
+    def setRules(self, rules: Iterable[AutoExtendRule]) -> list[PropertySpec]:
+        """
+        Set the rules to apply, converting values to their types only if the rules have changed since the last call, so it's 
+        cheap to call each time before extending objects. Rules without a property name are ignored.
+
+        Args:
+            rules (Iterable[AutoExtendRule]): The rules.
+
+        Raises:
+            ValueError: If a value cannot be converted to its type, or is not a valid template. The rules are left unchanged.
+
+        Returns:
+            list[PropertySpec]: The property operations of the rules.
+        """
+        rules = tuple(rule for rule in rules if rule.propertyName)
+
+        if rules != self._rules:
+            self._specs = [self._makeSpec(rule) for rule in rules]
+            self._rules = rules
+
+        return self._specs
+
+    # Extend objects not seen before ----------------------------------------------------------------------------------------------
+    def extendNew(self, objects: Iterable) -> ChangePlan:
+        """
+        Apply the rules to objects not seen before, and mark them seen. Without rules, objects are not marked, so that rules 
+        added later are applied to them.
+
+        Args:
+            objects (Iterable): The objects reported as added or changed.
+
+        Returns:
+            ChangePlan: The changes made.
+        """
+        if not self._specs:
+            return ChangePlan(self._specs)
+
+        return self.extend([object for object in objects if self.seen.add(self.uidOf(object))])
+
+    # Extend objects --------------------------------------------------------------------------------------------------------------
+    def extend(self, objects: Iterable) -> ChangePlan:
+        """
+        Apply the rules to objects whether seen or not, and mark them seen. Use it to apply the rules to all objects when enabling
+        them or loading a file. Without rules, objects are not marked, so that rules added later are applied to them.
+
+        Args:
+            objects (Iterable): The objects.
+
+        Returns:
+            ChangePlan: The changes made.
+        """
+        if not self._specs:
+            return ChangePlan(self._specs)
+
+        objects = list(objects)
+
+        for object in objects:
+            self.seen.add(self.uidOf(object))
+
+        if not objects:
+            return ChangePlan(self._specs)
+
+        plan = self.engine.plan(objects, self._specs)
+        self.engine.apply(plan)
+
+        return plan
+
+    # Private functions ===========================================================================================================
+
+    # Make a property operation from a rule ---------------------------------------------------------------------------------------
+    @staticmethod
+    def _makeSpec(rule: AutoExtendRule) -> PropertySpec:
+        """
+        Make an Extend operation from a rule.
+
+        Args:
+            rule (AutoExtendRule): The rule.
+
+        Raises:
+            ValueError: If the value cannot be converted to the type, or is not a valid template.
+
+        Returns:
+            PropertySpec: The property operation.
+        """
+        if rule.isValueTemplate and isTemplate(rule.propertyValue):
+            value = ValueTemplate(rule.propertyValue, ValueTypes[rule.propertyType])
+        else:
+            value = parseValue(rule.propertyValue, ValueTypes[rule.propertyType])
+
+        return PropertySpec(rule.propertyName, value, DecoratorWorkerModes.Extend)
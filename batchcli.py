@@ -0,0 +1,418 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains the command-line batch mode processing many .blend files in background Blender processes.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+#
+# USAGE ***************************************************************************************************************************
+# Run this file with any Python 3.10+ interpreter (Blender's bundled one is fine):
+#
+#   python batchcli.py --mode Add --name "Hide at Lod Level" --value 2 --type Int "assets/**/*.blend"
+#   python batchcli.py --spec-file operations.json --jobs 8 --memory-limit 4096 assets/*.blend
+#
+# Each file is opened in a background Blender process (`blender -b`), processed and saved. At most `--jobs` processes run at a
+# time. Run with --help to learn all options.
+#
+# *********************************************************************************************************************************
+
+# This module is also imported by background Blender processes, where it runs as part of the add-on package. Only the standard
+# library is imported at module level, so that the launcher part runs without Blender and the add-on package.
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+# Constants #######################################################################################################################
+
+resultMarker = "T1NKER_COPM_RESULT "
+"""
+Prefix of the output line through which background Blender processes report results to the launcher.
+"""
+
+modes = ["Add", "Extend", "Reset", "Remove", "Rename"]
+"""
+Names of operations, as named in `decoratorengine.DecoratorWorkerModes`.
+"""
+
+valueTypes = ["String", "Int", "Float", "Bool", "IntArray", "FloatArray"]
+"""
+Names of value types, as named in `propertyvalue.ValueTypes`.
+"""
+
+conflictPolicies = ["Skip", "Overwrite", "KeepExisting"]
+"""
+Names of what to do when renaming and the new name is taken, as named in `decoratorengine.RenameConflicts`.
+"""
+
+_packageAlias = "t1nker_custom_object_property_manager"
+"""
+Name to import the add-on package as in background Blender processes, as the folder name may not be a valid module name.
+"""
+
+# Functions: launcher #############################################################################################################
+
+# Parse command-line arguments ----------------------------------------------------------------------------------------------------
+def parseArguments(argv: list[str]) -> argparse.Namespace:
+    """
+    Parse command-line arguments of the launcher.
+
+    Args:
+        argv (list[str]): The arguments without the program name.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="batchcli.py",
+        description="Apply T1nk-R Custom Object Property Manager operations to many .blend files in background Blender processes.")
+
+    parser.add_argument("files", nargs="+", help="The .blend files to process. Glob patterns such as 'assets/**/*.blend' are expanded.")
+
+    operation = parser.add_argument_group("operation (single)")
+    operation.add_argument("--mode", choices=modes, help="The operation to perform.")
+    operation.add_argument("--name", help="Name of the property.")
+    operation.add_argument("--value", default="", help="Value of the property (not used when removing), or its new name when renaming.")
+    operation.add_argument("--type", default="String", choices=valueTypes, help="Type of the value.")
+    operation.add_argument("--template", action="store_true", help="Compute the value for each object from fields such as {collection}_{name}.")
+    operation.add_argument("--on-conflict", default="Skip", choices=conflictPolicies, help="When renaming, what to do with objects already having a property of the new name (default: Skip).")
+
+    parser.add_argument("--spec-file", help="JSON file with a list of operations, each an object with mode, name, value, type, template and onConflict keys. Applied in a single pass.")
+    parser.add_argument("--dry-run", action="store_true", help="Don't change or save anything, just report what would be changed.")
+    parser.add_argument("--verbose", action="store_true", help="Log per-object details.")
+
+    pool = parser.add_argument_group("process pool")
+    pool.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or 'blender').")
+    pool.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Maximum number of Blender processes running at a time (default: number of CPUs).")
+    pool.add_argument("--threads", type=int, default=1, help="Threads each Blender process may use (default: 1).")
+    pool.add_argument("--memory-limit", type=int, default=0, help="Kill a Blender process using more memory than this (MB, Linux only, refused elsewhere, default: no limit).")
+    pool.add_argument("--timeout", type=float, default=0, help="Kill a Blender process running longer than this (seconds, default: no limit).")
+    pool.add_argument("--report", help="Write per-file results to this JSON file.")
+
+    arguments = parser.parse_args(argv)
+
+    if arguments.spec_file is None and (arguments.mode is None or arguments.name is None):
+        parser.error("specify either --spec-file, or --mode and --name")
+
+    if arguments.jobs < 1:
+        parser.error("--jobs shall be at least 1")
+
+    if arguments.memory_limit and not sys.platform.startswith("linux"):
+        parser.error("--memory-limit is only supported on Linux")
+
+    return arguments
+
+# Collect operations --------------------------------------------------------------------------------------------------------------
+def loadSpecs(arguments: argparse.Namespace) -> list[dict]:
+    """
+    Collect the operations to apply from the arguments.
+
+    Args:
+        arguments (argparse.Namespace): The parsed arguments.
+
+    Raises:
+        ValueError: If the spec file is not a list of operations, or an operation has an unknown mode, type or conflict policy.
+
+    Returns:
+        list[dict]: The operations, each with mode, name, value, type, template and onConflict keys.
+    """
+    if arguments.spec_file is None:
+        return [{"mode": arguments.mode, "name": arguments.name, "value": arguments.value, "type": arguments.type, "template": arguments.template, "onConflict": arguments.on_conflict}]
+
+    with open(arguments.spec_file, encoding="utf-8") as specFile:
+        specs = json.load(specFile)
+
+    if not isinstance(specs, list) or not all(isinstance(spec, dict) and "mode" in spec and "name" in spec for spec in specs):
+        raise ValueError(f"{arguments.spec_file} shall contain a list of objects with at least mode and name keys")
+
+    specs = [
+        {"mode": spec["mode"], "name": spec["name"], "value": str(spec.get("value", "")), "type": spec.get("type", "String"), "template": bool(spec.get("template", False)),
+         "onConflict": spec.get("onConflict", "Skip")}
+        for spec in specs
+    ]
+
+    # Catch typos here, not in each Blender process
+    for number, spec in enumerate(specs, start=1):
+        for key, names in (("mode", modes), ("type", valueTypes), ("onConflict", conflictPolicies)):
+            if spec[key] not in names:
+                raise ValueError(f"{arguments.spec_file}: operation {number} has an unknown {key} '{spec[key]}', use one of {', '.join(names)}")
+
+    return specs
+
+# Expand file patterns ------------------------------------------------------------------------------------------------------------
+def expandFiles(patterns: list[str]) -> list[str]:
+    """
+    Expand glob patterns to a list of files, keeping the order and dropping duplicates.
+
+    Args:
+        patterns (list[str]): File names or glob patterns.
+
+    Returns:
+        list[str]: The files.
+    """
+    files = {}
+
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+
+        for file in matches:
+            files.setdefault(os.path.abspath(file), None)
+
+    return list(files)
+
+# Process a file in a Blender process ---------------------------------------------------------------------------------------------
+def processFile(file: str, specs: list[dict], arguments: argparse.Namespace) -> dict:
+    """
+    Open a file in a background Blender process, apply the operations and save it.
+
+    Args:
+        file (str): The .blend file to process.
+        specs (list[dict]): The operations to apply.
+        arguments (argparse.Namespace): The parsed arguments.
+
+    Returns:
+        dict: Results of processing the file, with file, status, seconds and either the counts reported by Blender or error.
+    """
+    started = time.perf_counter()
+    addonFolder = os.path.dirname(os.path.abspath(__file__))
+
+    # Import the add-on package under an alias, then run the batch mode with the arguments after --
+    script = \
+        "import importlib.util, sys\n" \
+        f"spec = importlib.util.spec_from_file_location({_packageAlias!r}, {os.path.join(addonFolder, '__init__.py')!r}, submodule_search_locations=[{addonFolder!r}])\n" \
+        "package = importlib.util.module_from_spec(spec)\n" \
+        f"sys.modules[{_packageAlias!r}] = package\n" \
+        "spec.loader.exec_module(package)\n" \
+        f"from {_packageAlias} import batchcli\n" \
+        "batchcli.runInBlender(sys.argv[sys.argv.index('--') + 1:])\n"
+
+    command = [
+        arguments.blender, "--background", "--factory-startup", "--threads", str(arguments.threads), file,
+        "--python-exit-code", "1", "--python-expr", script,
+        "--", json.dumps({"specs": specs, "dryRun": arguments.dry_run, "verbose": arguments.verbose})
+    ]
+
+    result = {"file": file}
+
+    # Write output to a file instead of a pipe, so that the process never blocks on a full pipe while being watched
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="replace") as output:
+        try:
+            process = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT)
+        except OSError as ex:
+            return {**result, "status": "failed", "error": f"Cannot start Blender: {ex}", "seconds": 0.0}
+
+        error = _watch(process, arguments.memory_limit, arguments.timeout)
+
+        output.seek(0)
+        lines = output.read().splitlines()
+
+    result["seconds"] = round(time.perf_counter() - started, 3)
+
+    reported = [line[len(resultMarker):] for line in lines if line.startswith(resultMarker)]
+
+    if error is None and process.returncode == 0 and reported:
+        return {**result, "status": "ok", **json.loads(reported[-1])}
+
+    if error is None:
+        error = f"Blender exited with code {process.returncode}: " + " | ".join(lines[-5:])
+
+    return {**result, "status": "failed", "error": error}
+
+# Run the launcher ----------------------------------------------------------------------------------------------------------------
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Process all files specified on the command line with a pool of Blender processes, and print a summary.
+
+    Args:
+        argv (list[str], optional): Command-line arguments without the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 0 if all files have been processed successfully, 1 otherwise.
+    """
+    arguments = parseArguments(sys.argv[1:] if argv is None else argv)
+
+    try:
+        specs = loadSpecs(arguments)
+    except (OSError, ValueError) as ex:
+        print(f"Cannot load operations: {ex}", file=sys.stderr)
+        return 1
+
+    files = expandFiles(arguments.files)
+
+    if not files:
+        print("No files to process", file=sys.stderr)
+        return 1
+
+    print(f"Processing {len(files)} files with up to {min(arguments.jobs, len(files))} Blender processes...")
+
+    results = []
+
+    with ThreadPoolExecutor(max_workers=min(arguments.jobs, len(files))) as pool:
+        for result in pool.map(lambda file: processFile(file, specs, arguments), files):
+            results.append(result)
+
+            if result["status"] == "ok":
+                print(f"OK     {result['file']}: {result['changes']} changes on {result['objects']} objects ({result['seconds']} s)")
+            else:
+                print(f"FAILED {result['file']}: {result['error']} ({result['seconds']} s)")
+
+    failed = sum(1 for result in results if result["status"] != "ok")
+
+    print(f"Finished, {len(results) - failed} files processed, {failed} failed, {sum(result.get('changes', 0) for result in results)} changes" + (" would have been made" if arguments.dry_run else " made"))
+
+    if arguments.report:
+        with open(arguments.report, "w", encoding="utf-8") as reportFile:
+            json.dump(results, reportFile, indent=2)
+
+    return 1 if failed else 0
+
+# Functions: background Blender process ###########################################################################################
+
+# Process the open file -----------------------------------------------------------------------------------------------------------
+def runInBlender(argv: list[str]):
+    """
+    Apply operations to all objects of the file open in Blender, save the file, and print the results for the launcher. This 
+    runs in the background Blender processes started by the launcher, as part of the add-on package.
+
+    Args:
+        argv (list[str]): Arguments after `--`, a single JSON document with specs, dryRun and verbose keys.
+    """
+    import bpy
+    from . import api
+    from . import decoratorlog
+    from .decoratorengine import DecoratorEngine, ChangeKinds
+    from .valuetemplate import isTemplate
+
+    options = json.loads(argv[0])
+
+    # Values are converted as in the panel, values without fields are constants even if marked as templates
+    specs = [
+        api.spec(
+            spec["name"], api.template(spec["value"], spec["type"]) if spec["template"] and isTemplate(spec["value"]) else spec["value"],
+            spec["mode"], valueType=spec["type"], onConflict=spec["onConflict"])
+        for spec in options["specs"]
+    ]
+
+    with decoratorlog.operationLog(isVerbose=options["verbose"]) as logger:
+        engine = DecoratorEngine(isTestOnly=options["dryRun"], logger=logger)
+        plan = engine.plan(bpy.data.objects, specs)
+
+        if not options["dryRun"] and len(plan) > 0:
+            engine.apply(plan)
+            bpy.ops.wm.save_mainfile()
+
+    counts = plan.counts()
+
+    print(resultMarker + json.dumps({
+        "changes": len(plan),
+        "objects": plan.objectsScanned,
+        "added": counts[ChangeKinds.Add],
+        "set": counts[ChangeKinds.Set],
+        "removed": counts[ChangeKinds.Remove],
+    }), flush=True)
+
+# Private functions ###############################################################################################################
+
+# Watch a Blender process ---------------------------------------------------------------------------------------------------------
+def _watch(process: subprocess.Popen, memoryLimit: int, timeout: float) -> Optional[str]:
+    """
+    Wait for a process to finish, and kill it if it uses too much memory or runs too long.
+
+    Args:
+        process (subprocess.Popen): The process.
+        memoryLimit (int): Memory limit in MB, 0 for no limit.
+        timeout (float): Time limit in seconds, 0 for no limit.
+
+    Returns:
+        Optional[str]: The reason for killing the process, or `None` if it finished by itself.
+    """
+    started = time.monotonic()
+
+    while True:
+        try:
+            process.wait(timeout=0.5)
+            return None
+        except subprocess.TimeoutExpired:
+            pass
+
+        reason = None
+
+        if timeout and time.monotonic() - started > timeout:
+            reason = f"Timed out after {timeout} seconds"
+        elif memoryLimit and _residentMemoryMB(process.pid) > memoryLimit:
+            reason = f"Used more than {memoryLimit} MB of memory"
+
+        if reason is not None:
+            process.kill()
+            process.wait()
+            return reason
+
+# Get memory usage of a process ---------------------------------------------------------------------------------------------------
+def _residentMemoryMB(pid: int) -> float:
+    """
+    Get the resident memory of a process. Only supported on Linux, returns 0 elsewhere.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        float: The resident memory in MB.
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0.0
+
+# Run the launcher ################################################################################################################
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,485 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module benchmarks operations on synthetic scenes, with or without Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+# This module runs as a standalone script. Without Blender, objects are simulated by lightweight stand-ins and the Blender
+# independent modules of the add-on are imported without its __init__.py. With --blender, the same scenarios run in background
+# Blender processes on real objects. Only the standard library is imported at module level.
+#
+# Usage: python benchmark.py [--sizes 1000,10000,100000] [--save results.json] [--baseline results.json] [--blender PATH]
+
+import argparse
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+import types
+from typing import Any, Callable, Optional
+
+# Constants #######################################################################################################################
+
+resultMarker = "T1NKER_COPM_BENCHMARK "
+"""
+Prefix of the output line through which background Blender processes report results to the launcher.
+"""
+
+modes = ["Add", "Extend", "Reset", "Remove"]
+"""
+Operation modes benchmarked, named after the values of `decoratorengine.DecoratorWorkerModes`.
+"""
+
+propertyName = "Benchmark LOD"
+"""
+Name of the property operations are benchmarked with.
+"""
+
+_packageAlias = "t1nker_custom_object_property_manager"
+"""
+Name to import the add-on package as, as the folder name may not be a valid module name.
+"""
+
+# Stand-in of Blender objects #####################################################################################################
+class SyntheticObject(dict):
+    """
+    Lightweight stand-in of a Blender object: a mapping of custom properties with a name, compared and hashed by identity like
+    Blender objects are.
+    """
+    __slots__ = ("name",)
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, name: str):
+        """
+        Make an object without properties.
+
+        Args:
+            name (str): Name of the object.
+        """
+        super().__init__()
+        self.name = name
+
+
+# Functions: launcher #############################################################################################################
+
+# Parse command-line arguments ----------------------------------------------------------------------------------------------------
+def parseArguments(argv: list[str]) -> argparse.Namespace:
+    """
+    Parse command-line arguments of the benchmark.
+
+    Args:
+        argv (list[str]): The arguments without the program name.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="benchmark.py", description="Benchmark T1nk-R Custom Object Property Manager operations on synthetic scenes.")
+
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated numbers of objects (default: 1000,10000,100000, add 1000000 for huge scenes).")
+    parser.add_argument("--densities", default="0,0.1,1", help="Comma-separated shares of objects already having the property (default: 0,0.1,1).")
+    parser.add_argument("--extra-properties", type=int, default=8, help="Other properties of each object (default: 8).")
+    parser.add_argument("--modes", default=",".join(modes), help=f"Comma-separated operation modes (default: {','.join(modes)}).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs of each scenario, the fastest counts (default: 3).")
+    parser.add_argument("--no-memory", action="store_true", help="Don't measure peak memory, which takes an extra run of each scenario. Memory is never measured with --blender, as Blender allocates properties where it cannot be traced.")
+    parser.add_argument("--save", help="Write results to this JSON file, to be used as a baseline later.")
+    parser.add_argument("--baseline", help="Compare results with this JSON file written by --save, and fail on regressions.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown or memory growth compared to the baseline (default: 0.25, that is 25%%).")
+    parser.add_argument("--blender", help="Run scenarios in background Blender processes on real objects, using this Blender executable.")
+
+    arguments = parser.parse_args(argv)
+
+    try:
+        arguments.sizes = [int(size) for size in arguments.sizes.split(",")]
+        arguments.densities = [float(density) for density in arguments.densities.split(",")]
+    except ValueError as ex:
+        parser.error(f"invalid number: {ex}")
+
+    arguments.modes = [mode.strip() for mode in arguments.modes.split(",")]
+
+    if any(mode not in modes for mode in arguments.modes):
+        parser.error(f"modes shall be some of {', '.join(modes)}")
+
+    return arguments
+
+# Run a scenario ------------------------------------------------------------------------------------------------------------------
+def runScenario(objects: list, mode: str, withMemory: bool, repeat: int = 1) -> dict:
+    """
+    Plan and apply an operation on all objects the way the add-on does, using the property index, and measure it. Only planning
+    and applying are measured: the index is built before, and the original properties are restored after the measurement.
+
+    Args:
+        objects (list): The mapping-like objects.
+        mode (str): The operation mode, one of `modes`.
+        withMemory (bool): Whether to measure peak memory of planning and applying in an extra run. Only memory allocated by
+        Python is traced, so don't use it on Blender objects, whose properties are allocated by Blender.
+        repeat (int, optional): Runs to measure time in, the fastest counts. Defaults to 1.
+
+    Returns:
+        dict: Seconds, objectsPerSecond, changes, and peakMB if measured.
+    """
+    package = _loadPackage()
+    engineModule = sys.modules[f"{package}.decoratorengine"]
+    indexModule = sys.modules[f"{package}.propertyindex"]
+
+    spec = engineModule.PropertySpec(propertyName, 2, engineModule.DecoratorWorkerModes[mode])
+    inScope = lambda object: True
+
+    def run(measure: Callable[[Callable[[], Any]], Any]) -> int:
+        # The index is kept current by the add-on, building it is not part of an operation
+        index = indexModule.PropertyIndex()
+        index.build(objects)
+
+        engine = engineModule.DecoratorEngine(index=index)
+
+        def operation():
+            plan = engine.plan(objects, [spec], inScope=inScope)
+            engine.apply(plan)
+            return plan
+
+        plan = measure(operation)
+
+        # Restore the scene for the next run
+        engine.revert(plan.changes)
+
+        return len(plan)
+
+    best = None
+    changes = 0
+
+    def measureTime(operation: Callable[[], Any]) -> Any:
+        nonlocal best
+        gc.collect()
+        started = time.perf_counter()
+        outcome = operation()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+        return outcome
+
+    for _ in range(max(1, repeat)):
+        changes = run(measureTime)
+
+    result = {"seconds": round(best, 6), "objectsPerSecond": round(len(objects) / best) if best > 0 else None, "changes": changes}
+
+    if withMemory:
+        peak = 0
+
+        def measureMemory(operation: Callable[[], Any]) -> Any:
+            nonlocal peak
+            gc.collect()
+            tracemalloc.start()
+            outcome = operation()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return outcome
+
+        run(measureMemory)
+        result["peakMB"] = round(peak / 2**20, 3)
+
+    return result
+
+# Make synthetic objects ----------------------------------------------------------------------------------------------------------
+def makeObjects(size: int, density: float, extraProperties: int, factory=SyntheticObject) -> list:
+    """
+    Make objects with properties. Every object has `extraProperties` other properties, and a share of `density` of them has
+    the benchmarked property, spread evenly.
+
+    Args:
+        size (int): Number of objects.
+        density (float): Share of objects having the benchmarked property, between 0 and 1.
+        extraProperties (int): Number of other properties of each object.
+        factory (Callable, optional): Makes an object from a name. Defaults to `SyntheticObject`.
+
+    Returns:
+        list: The objects.
+    """
+    objects = []
+    having = 0
+
+    for i in range(size):
+        object = factory(f"Object.{i:07d}")
+
+        for p in range(extraProperties):
+            object[f"Property {p}"] = p
+
+        # Spread objects having the property evenly
+        if (i + 1) * density >= having + 1:
+            object[propertyName] = 1
+            having = having + 1
+
+        objects.append(object)
+
+    return objects
+
+# Compare with a baseline ---------------------------------------------------------------------------------------------------------
+def compare(results: list[dict], baseline: list[dict], tolerance: float) -> list[str]:
+    """
+    Find scenarios slower or using more memory than in the baseline, beyond the tolerance.
+
+    Args:
+        results (list[dict]): Results of this run.
+        baseline (list[dict]): Results of an earlier run.
+        tolerance (float): Allowed growth, such as 0.25 for 25%.
+
+    Returns:
+        list[str]: Descriptions of regressions, empty if there is none.
+    """
+    earlier = {_key(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        old = earlier.get(_key(result))
+
+        if old is None:
+            continue
+
+        if result["seconds"] > old["seconds"] * (1 + tolerance):
+            regressions.append(f"{_key(result)}: {result['seconds'] * 1000:.1f} ms, was {old['seconds'] * 1000:.1f} ms")
+
+        if "peakMB" in result and "peakMB" in old and result["peakMB"] > old["peakMB"] * (1 + tolerance):
+            regressions.append(f"{_key(result)}: {result['peakMB']:.1f} MB peak memory, was {old['peakMB']:.1f} MB")
+
+    return regressions
+
+# Run the benchmark ---------------------------------------------------------------------------------------------------------------
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Run all scenarios, print a table of results, and compare them with the baseline.
+
+    Args:
+        argv (list[str], optional): Command-line arguments without the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 0 if all scenarios ran and there is no regression, 1 otherwise.
+    """
+    arguments = parseArguments(sys.argv[1:] if argv is None else argv)
+
+    baseline = None
+
+    if arguments.baseline:
+        try:
+            with open(arguments.baseline, encoding="utf-8") as baselineFile:
+                baseline = json.load(baselineFile)["results"]
+        except (OSError, ValueError, KeyError) as ex:
+            print(f"Cannot load baseline: {ex}", file=sys.stderr)
+            return 1
+
+    options = {
+        "modes": arguments.modes, "densities": arguments.densities, "extraProperties": arguments.extra_properties,
+        "repeat": arguments.repeat,
+        # Memory of Blender objects is allocated by Blender, where it cannot be traced
+        "withMemory": not arguments.no_memory and not arguments.blender,
+    }
+
+    results = []
+    environment = "blender" if arguments.blender else "stand-in"
+
+    print(f"{'scenario':<32} {'changes':>9} {'ms':>11} {'objects/s':>12} {'peak MB':>9}")
+
+    for size in arguments.sizes:
+        try:
+            sizeResults = _runInBlender(arguments.blender, size, options) if arguments.blender else _runSize(size, options)
+        except (OSError, RuntimeError) as ex:
+            print(f"Cannot run scenarios of {size} objects: {ex}", file=sys.stderr)
+            return 1
+
+        for result in sizeResults:
+            result["environment"] = environment
+            results.append(result)
+
+            peak = f"{result['peakMB']:.1f}" if "peakMB" in result else "-"
+            print(f"{_key(result):<32} {result['changes']:>9} {result['seconds'] * 1000:>11.1f} {result['objectsPerSecond'] or 0:>12} {peak:>9}")
+
+    if arguments.save:
+        with open(arguments.save, "w", encoding="utf-8") as saveFile:
+            json.dump({"python": sys.version.split()[0], "results": results}, saveFile, indent=2)
+
+    if baseline is None:
+        return 0
+
+    regressions = compare(results, [result for result in baseline if result.get("environment", "stand-in") == environment], arguments.tolerance)
+
+    if regressions:
+        print(f"FAILED: {len(regressions)} regressions beyond {arguments.tolerance:.0%}:")
+
+        for regression in regressions:
+            print(f"  {regression}")
+
+        return 1
+
+    print(f"No regressions beyond {arguments.tolerance:.0%} compared to {arguments.baseline}")
+
+    return 0
+
+# Functions: background Blender process ###########################################################################################
+
+# Run scenarios in Blender --------------------------------------------------------------------------------------------------------
+def runInBlender(argv: list[str]):
+    """
+    Run the scenarios of a size on real Blender objects, and print the results for the launcher. This runs in the background
+    Blender processes started by the launcher.
+
+    Args:
+        argv (list[str]): Arguments after `--`, a single JSON document with size and the options of `_runSize`.
+    """
+    import bpy
+
+    options = json.loads(argv[0])
+
+    # Objects without data are the cheapest to make, and custom properties work the same on any object
+    results = _runSize(
+        options.pop("size"), options,
+        factory=lambda name: bpy.data.objects.new(name, None), discard=lambda objects: bpy.data.batch_remove(objects))
+
+    print(resultMarker + json.dumps(results), flush=True)
+
+# Private functions ###############################################################################################################
+
+# Run scenarios of a size ---------------------------------------------------------------------------------------------------------
+def _runSize(size: int, options: dict, factory=SyntheticObject, discard=None) -> list[dict]:
+    """
+    Run all scenarios on a number of objects.
+
+    Args:
+        size (int): Number of objects.
+        options (dict): The modes, densities, extraProperties, repeat and withMemory settings.
+        factory (Callable, optional): Makes an object from a name. Defaults to `SyntheticObject`.
+        discard (Callable, optional): Disposes of the objects of a density when done with them. Defaults to None.
+
+    Returns:
+        list[dict]: Results of each scenario, with size, density and mode.
+    """
+    results = []
+
+    for density in options["densities"]:
+        objects = makeObjects(size, density, options["extraProperties"], factory)
+
+        for mode in options["modes"]:
+            result = runScenario(objects, mode, options["withMemory"], options["repeat"])
+            results.append({"size": size, "density": density, "mode": mode, **result})
+
+        if discard is not None:
+            discard(objects)
+
+    return results
+
+# Run scenarios of a size in Blender ----------------------------------------------------------------------------------------------
+def _runInBlender(blender: str, size: int, options: dict) -> list[dict]:
+    """
+    Run all scenarios on a number of objects in a background Blender process.
+
+    Args:
+        blender (str): The Blender executable.
+        size (int): Number of objects.
+        options (dict): The modes, densities, extraProperties, repeat and withMemory settings.
+
+    Raises:
+        RuntimeError: If Blender fails or does not report results.
+
+    Returns:
+        list[dict]: Results of each scenario, with size, density and mode.
+    """
+    addonFolder = os.path.dirname(os.path.abspath(__file__))
+
+    script = \
+        "import sys\n" \
+        f"sys.path.insert(0, {addonFolder!r})\n" \
+        "import benchmark\n" \
+        "benchmark.runInBlender(sys.argv[sys.argv.index('--') + 1:])\n"
+
+    process = subprocess.run(
+        [blender, "--background", "--factory-startup", "--python-exit-code", "1", "--python-expr", script, "--", json.dumps({"size": size, **options})],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+
+    lines = process.stdout.splitlines()
+    reported = [line[len(resultMarker):] for line in lines if line.startswith(resultMarker)]
+
+    if process.returncode != 0 or not reported:
+        raise RuntimeError(f"Blender exited with code {process.returncode}: " + " | ".join(lines[-5:]))
+
+    return json.loads(reported[-1])
+
+# Import the Blender independent modules ------------------------------------------------------------------------------------------
+def _loadPackage() -> str:
+    """
+    Import the Blender independent modules of the add-on, without running its __init__.py, which needs Blender.
+
+    Returns:
+        str: Name the package is imported as.
+    """
+    if _packageAlias not in sys.modules:
+        package = types.ModuleType(_packageAlias)
+        package.__path__ = [os.path.dirname(os.path.abspath(__file__))]
+        sys.modules[_packageAlias] = package
+
+    importlib.import_module(f"{_packageAlias}.decoratorengine")
+    importlib.import_module(f"{_packageAlias}.propertyindex")
+
+    return _packageAlias
+
+# Identify a scenario -------------------------------------------------------------------------------------------------------------
+def _key(result: dict) -> str:
+    """
+    Get a name identifying a scenario, to match results with a baseline.
+
+    Args:
+        result (dict): Result of the scenario.
+
+    Returns:
+        str: The name, such as "Remove/10000/0.1".
+    """
+    return f"{result['mode']}/{result['size']}/{result['density']:g}"
+
+# Run the benchmark ###############################################################################################################
+if __name__ == "__main__":
+    sys.exit(main())
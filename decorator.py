@@ -49,11 +49,133 @@
 
 
 
+import os
 import bpy
-from bpy.props import StringProperty, BoolProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty, IntProperty, PointerProperty, FloatProperty
 from . import decoratorworker
+from . import decoratorhandlers
+from . import decoratorlog
 from . import updateChecker
 
+# Shared property definitions #####################################################################################################
+
+propertyTypeItems = [
+    ("String", "String", "Text value"),
+    ("Int", "Integer", "Whole number"),
+    ("Float", "Float", "Floating point number"),
+    ("Bool", "Boolean", "True or false (stored as an integer before Blender 4.0)"),
+    ("IntArray", "Integer Array", "Fixed-length array of whole numbers, type items separated by commas, such as 1, 2, 3"),
+    ("FloatArray", "Float Array", "Fixed-length array of floating point numbers, type items separated by commas, such as 0.5, 1, 2")
+]
+"""
+Types of property values, named after the values of `propertyvalue.ValueTypes`.
+"""
+
+renameConflictItems = [
+    ("Skip", "Skip", "Leave objects already having a property of the new name alone"),
+    ("Overwrite", "Overwrite", "Move the value, replacing the value of the property of the new name"),
+    ("KeepExisting", "Keep Existing", "Keep the value of the property of the new name, and remove the property of the old name")
+]
+"""
+What to do when renaming a property of an object already having a property of the new name, named after the values of 
+`decoratorengine.RenameConflicts`.
+"""
+
+templateDescription = "Compute the value for each object from fields in braces: {name}, {type}, {parent}, {collection}, {data} and {index}, such as {collection}_{name} or LOD{index:02d}. Use {{ and }} for braces"
+"""
+Description of settings telling if a value is a template, listing the fields of `valuetemplate.templateFields`.
+"""
+
+# Offer property names to choose from ---------------------------------------------------------------------------------------------
+def searchPropertyNames(self, context: bpy.types.Context, editText: str) -> list[tuple[str, str]]:
+    """
+    Offer names of custom properties used in the file, most used first, for property name fields. Names can also be typed freely.
+
+    Args:
+        context (bpy.types.Context): A bpy.context object passed by Blender.
+        editText (str): The text typed so far.
+
+    Returns:
+        list[tuple[str, str]]: The names with the number of objects having them.
+    """
+    return [
+        (name, f"{count} object{'s' if count != 1 else ''}") 
+        for name, count in decoratorworker.DecoratorWorker.propertyNameCatalog(editText)
+    ]
+
+# Property operation for batches ##################################################################################################
+class DecoratorPropertySpec(bpy.types.PropertyGroup):
+    """
+    A property operation to apply as part of a batch.
+    """
+    
+    # Properties ==================================================================================================================
+    
+    propertyName: StringProperty(
+        name="Property Name",
+        description="Specify the name of the property to process",
+        default="Hide at Lod Level",
+        search=searchPropertyNames,
+        search_options={'SUGGESTION'}
+    )
+    """
+    The name of the property to process.
+    """
+    
+    propertyValue: StringProperty(
+        name="Property Value",
+        description="The value to set for the property (not used when removing)",
+        default=""
+    )
+    """
+    The value to set for the property.
+    """
+    
+    propertyType: EnumProperty(
+        name="Property Type",
+        description="The type of the value to set",
+        items=propertyTypeItems,
+        default="String"
+    )
+    """
+    The type of the value to set.
+    """
+    
+    isValueTemplate: BoolProperty(
+        name="Template",
+        description=templateDescription,
+        default=False
+    )
+    """
+    Whether the value is a template computed for each object.
+    """
+    
+    action: EnumProperty(
+        name="Operation",
+        description="What to do with the property",
+        items=[
+            ("Add", "Set", "Add the property or reset its value", "ADD", 1),
+            ("Extend", "Extend", "Add the property if it doesn't exist, don't reset", "FULLSCREEN_ENTER", 4),
+            ("Reset", "Reset", "Reset the value of the property if it exists", "FILE_REFRESH", 3),
+            ("Remove", "Remove", "Remove the property", "REMOVE", 2),
+            ("Rename", "Rename", "Move the value of the property to the name given as value", "FORWARD", 5)
+        ],
+        default="Add"
+    )
+    """
+    The operation to perform, named after the values of `decoratorworker.DecoratorWorkerModes`.
+    """
+    
+    renameConflicts: EnumProperty(
+        name="If Taken",
+        description="What to do when renaming and an object already has a property of the new name",
+        items=renameConflictItems,
+        default="Skip"
+    )
+    """
+    What to do when renaming and an object already has a property of the new name.
+    """
+
 # Addon preferences ###############################################################################################################
 class DecoratorSettings(bpy.types.PropertyGroup):
     """
@@ -71,10 +193,131 @@ class DecoratorSettings(bpy.types.PropertyGroup):
     Controls whether to process selected objects or all.
     """
     
+    isCollectionTarget: BoolProperty(
+        name="Set on a collection",
+        description="Set the property on a collection instead of each object in it. Objects in the collection and its child collections inherit the value, as resolved by the property resolver",
+        default=False
+    )
+    """
+    Controls whether to process a collection instead of objects.
+    """
+    
+    targetCollection: PointerProperty(
+        name="Collection",
+        description="The collection to set the property on",
+        type=bpy.types.Collection
+    )
+    """
+    The collection to process if `isCollectionTarget` is set.
+    """
+    
+    isFilterEnabled: BoolProperty(
+        name="Filter objects",
+        description="Only process objects in scope which match the criteria below",
+        default=False
+    )
+    """
+    Controls whether to filter objects in scope.
+    """
+    
+    filterObjectTypes: EnumProperty(
+        name="Types",
+        description="Only process objects of the selected types (process any type if none is selected)",
+        items=[
+            ("MESH", "Mesh", "Mesh objects"),
+            ("CURVE", "Curve", "Curve objects"),
+            ("EMPTY", "Empty", "Empty objects"),
+            ("ARMATURE", "Armature", "Armature objects"),
+            ("LIGHT", "Light", "Light objects"),
+            ("CAMERA", "Camera", "Camera objects"),
+            ("GPENCIL", "Grease Pencil", "Grease Pencil objects"),
+            ("OTHER", "Other", "Objects of any other type")
+        ],
+        options={'ENUM_FLAG'},
+        default=set()
+    )
+    """
+    Types of objects to process.
+    """
+    
+    filterCollection: PointerProperty(
+        name="Collection",
+        description="Only process objects in this collection or its child collections",
+        type=bpy.types.Collection
+    )
+    """
+    Collection to process objects of.
+    """
+    
+    filterNamePattern: StringProperty(
+        name="Name",
+        description="Only process objects with a name matching this pattern, such as 'Tree*' (leave empty to process any name)",
+        default=""
+    )
+    """
+    Pattern object names shall match.
+    """
+    
+    filterNameIsRegex: BoolProperty(
+        name="Regular expression",
+        description="Treat the name pattern as a regular expression instead of a wildcard pattern",
+        default=False
+    )
+    """
+    Controls whether the name pattern is a regular expression.
+    """
+    
+    filterPropertyName: StringProperty(
+        name="Property",
+        description="Name of the property to check",
+        default="",
+        search=searchPropertyNames,
+        search_options={'SUGGESTION'}
+    )
+    """
+    Name of the property to check.
+    """
+    
+    filterPropertyCondition: EnumProperty(
+        name="Condition",
+        description="What to check for the property",
+        items=[
+            ("Any", "Any", "Don't check the property"),
+            ("Has", "Has", "Only process objects having the property"),
+            ("HasNot", "Has not", "Only process objects not having the property"),
+            ("Compare", "Compare", "Only process objects having the property with a value matching the comparison")
+        ],
+        default="Any"
+    )
+    """
+    What to check for the property, named after the values of `scopefilter.PropertyConditions`.
+    """
+    
+    filterComparison: EnumProperty(
+        name="Operator",
+        description="Operator to compare the property value with",
+        items=[(symbol, symbol, f"Property value {symbol} the value specified") for symbol in ["==", "!=", "<", "<=", ">", ">="]],
+        default="=="
+    )
+    """
+    Operator to compare the property value with.
+    """
+    
+    filterValue: StringProperty(
+        name="Value",
+        description="Value to compare the property value with. Numeric properties are compared numerically",
+        default=""
+    )
+    """
+    Value to compare the property value with.
+    """
+    
     propertyName: StringProperty(
         name="Property Name",
         description="Specify the name of the property to add or remove",
-        default="Hide at Lod Level"
+        default="Hide at Lod Level",
+        search=searchPropertyNames,
+        search_options={'SUGGESTION'}
     )    
     """
     The name of the property to add or remove.
@@ -86,12 +329,31 @@ class DecoratorSettings(bpy.types.PropertyGroup):
         default=""
     )    
     """
-    The name of the property to add or remove.
+    The value to set for the property, as text.
+    """
+    
+    propertyType: EnumProperty(
+        name="Property Type",
+        description="The type of the value to set. The value is converted once per operation, and stored as a native property of this type",
+        items=propertyTypeItems,
+        default="String"
+    )
+    """
+    The type of the value to set.
+    """
+    
+    isValueTemplate: BoolProperty(
+        name="Template",
+        description=templateDescription,
+        default=False
+    )
+    """
+    Whether the value is a template computed for each object.
     """
 
     isVerbose: BoolProperty(
         name="Verbose mode",
-        description="Check to get a detailed log on what happened and what not. Non-verbose mode only reports what actually happened.",
+        description="Check to get a detailed log on what happened to each object and what not. Non-verbose mode only reports the operation and a summary.",
         default=False
     )
     """
@@ -107,6 +369,142 @@ class DecoratorSettings(bpy.types.PropertyGroup):
     Controls if actions are actually taken or just simulated.
     """
     
+    isModal: BoolProperty(
+        name="Keep Blender responsive",
+        description="Process objects in small steps, showing progress and letting you cancel with Esc (changes made are rolled back). Recommended for large scenes",
+        default=False
+    )
+    """
+    Controls whether operations run step by step in a modal operator.
+    """
+    
+    isProfiling: BoolProperty(
+        name="Profile",
+        description="Measure the time spent in each phase of operations and count objects, reads and writes. Results are shown in the report and below, and can be saved for chrome://tracing",
+        default=False
+    )
+    """
+    Controls whether to profile operations.
+    """
+    
+    valueCondition: EnumProperty(
+        name="Only Where Value",
+        description="Reset or remove the property only where its current value passes this condition",
+        items=[
+            ("Any", "Any", "Reset or remove any value"),
+            ("Equals", "Equals", "Only where the value equals the one specified. Numbers are compared numerically, other values as text"),
+            ("NotEquals", "Not Equals", "Only where the value doesn't equal the one specified"),
+            ("Regex", "Matches Pattern", "Only where the whole value, as text, matches the regular expression specified"),
+            ("Range", "In Range", "Only where the value is a number between the limits specified, inclusive")
+        ],
+        default="Any"
+    )
+    """
+    Condition on the current value to reset or remove the property, named after the values of `scopefilter.ValueConditions`.
+    """
+    
+    conditionValue: StringProperty(
+        name="Condition Value",
+        description="Value to compare with, or the regular expression to match",
+        default=""
+    )
+    """
+    Value to compare with, or the regular expression to match.
+    """
+    
+    conditionMinimum: FloatProperty(
+        name="Min",
+        description="Smallest value to reset or remove",
+        default=0.0
+    )
+    """
+    Smallest value to reset or remove.
+    """
+    
+    conditionMaximum: FloatProperty(
+        name="Max",
+        description="Largest value to reset or remove",
+        default=1.0
+    )
+    """
+    Largest value to reset or remove.
+    """
+    
+    newPropertyName: StringProperty(
+        name="Rename To",
+        description="New name of the property when renaming",
+        default="",
+        search=searchPropertyNames,
+        search_options={'SUGGESTION'}
+    )
+    """
+    New name of the property when renaming.
+    """
+    
+    renameConflicts: EnumProperty(
+        name="If Taken",
+        description="What to do when renaming and an object already has a property of the new name",
+        items=renameConflictItems,
+        default="Skip"
+    )
+    """
+    What to do when renaming and an object already has a property of the new name, named after the values of 
+    `decoratorengine.RenameConflicts`.
+    """
+    
+    isShowingStatistics: BoolProperty(
+        name="Show statistics",
+        description="Show how many objects in scope have the property, already have the value, and would be changed by each operation. Objects are counted in the background when settings or the selection change",
+        default=True
+    )
+    """
+    Controls whether to show property statistics on the panel.
+    """
+    
+    batchSpecs: CollectionProperty(
+        name="Batch",
+        description="Property operations to apply to each object in a single pass",
+        type=DecoratorPropertySpec
+    )
+    """
+    Property operations to apply in a batch.
+    """
+    
+    batchSpecIndex: IntProperty(
+        name="Active batch item",
+        default=0
+    )
+    """
+    Index of the active item in `batchSpecs`.
+    """
+    
+    isAutoExtending: BoolProperty(
+        name="Auto-extend new objects",
+        description="Add the properties of the rules to each new object which doesn't have them yet. When turned on or the file is loaded, all objects of the scene are extended, afterwards only objects not seen before are processed, so it's fine to leave it on",
+        default=False,
+        update=lambda self, context: autoExtendAll(context) if self.isAutoExtending else None
+    )
+    """
+    Controls whether to apply `autoExtendRules` to new objects.
+    """
+    
+    autoExtendRules: CollectionProperty(
+        name="Auto-extend rules",
+        description="Properties to add to new objects if they don't have them yet",
+        type=DecoratorPropertySpec
+    )
+    """
+    Properties to add to new objects. The action of the items is not used, it's always Extend.
+    """
+    
+    autoExtendRuleIndex: IntProperty(
+        name="Active auto-extend rule",
+        default=0
+    )
+    """
+    Index of the active item in `autoExtendRules`.
+    """
+    
 # Addon preferences ###############################################################################################################
 class T1nkerDecoratorAddonPreferences(bpy.types.AddonPreferences):    
     """
@@ -126,6 +524,69 @@ class T1nkerDecoratorAddonPreferences(bpy.types.AddonPreferences):
     """
     Information about the current version and the latest available
     """
+    
+    useLightweightUndo: BoolProperty(
+        name="Lightweight undo",
+        description="Don't make Blender store an undo step of the whole file for each property operation, which takes long for big files. Use Revert last operation to undo property operations instead",
+        default=False,
+        update=lambda self, context: setLightweightUndo(self.useLightweightUndo)
+    )
+    """
+    Whether to rely on the change journal instead of Blender's undo for operations changing properties.
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # Draw the preferences --------------------------------------------------------------------------------------------------------
+    def draw(self, context):
+        """
+        Draws the preferences.
+        """
+        self.layout.prop(self, "useLightweightUndo")
+
+# List of batch items for the UI ##################################################################################################
+class DECORATOR_UL_PropertySpecs(bpy.types.UIList):
+    """
+    List of property operations in the batch
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # Draw an item ----------------------------------------------------------------------------------------------------------------
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        """
+        Draws an item of the list.
+        """
+        row = layout.row(align=True)
+        row.prop(item, "action", text="", icon_only=True)
+        row.prop(item, "propertyName", text="", emboss=False)
+        
+        if item.action == "Rename":
+            row.prop(item, "propertyValue", text="", icon="FORWARD")
+            row.prop(item, "renameConflicts", text="")
+        elif item.action != "Remove":
+            row.prop(item, "propertyType", text="")
+            row.prop(item, "propertyValue", text="")
+            row.prop(item, "isValueTemplate", text="", icon="TEXT")
+
+# List of auto-extend rules #######################################################################################################
+class DECORATOR_UL_AutoExtendRules(bpy.types.UIList):
+    """
+    List of properties to add to new objects
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # Draw an item ----------------------------------------------------------------------------------------------------------------
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        """
+        Draws an item of the list.
+        """
+        row = layout.row(align=True)
+        row.prop(item, "propertyName", text="", emboss=False)
+        row.prop(item, "propertyType", text="")
+        row.prop(item, "propertyValue", text="")
+        row.prop(item, "isValueTemplate", text="", icon="TEXT")
 
 # Panel for the UI ################################################################################################################
 class DecoratorPanel(bpy.types.Panel):
@@ -170,8 +631,38 @@ class DecoratorPanel(bpy.types.Panel):
         row.label(text="Select scope")
         
         row = box.row(align=True)
+        row.prop(self.settings, "isCollectionTarget")
+        
+        if self.settings.isCollectionTarget:
+            row = box.row(align=True)
+            row.prop(self.settings, "targetCollection")
+        
+        row = box.row(align=True)
+        row.enabled = not self.settings.isCollectionTarget
         row.prop(self.settings, "affectSelectedObjectsOnly")
         
+        row = box.row(align=True)
+        row.enabled = not self.settings.isCollectionTarget
+        row.prop(self.settings, "isFilterEnabled")
+        
+        if self.settings.isFilterEnabled and not self.settings.isCollectionTarget:
+            col = box.column(align=True)
+            col.prop(self.settings, "filterObjectTypes")
+            col.prop(self.settings, "filterCollection")
+            
+            row = col.row(align=True)
+            row.prop(self.settings, "filterNamePattern")
+            row.prop(self.settings, "filterNameIsRegex", text="", icon="SORTALPHA")
+            
+            row = col.row(align=True)
+            row.prop(self.settings, "filterPropertyName")
+            row.prop(self.settings, "filterPropertyCondition", text="")
+            
+            if self.settings.filterPropertyCondition == "Compare":
+                row = col.row(align=True)
+                row.prop(self.settings, "filterComparison", text="")
+                row.prop(self.settings, "filterValue", text="")
+        
         
         # Property name and value
         box = layout.box()
@@ -182,11 +673,40 @@ class DecoratorPanel(bpy.types.Panel):
         row = box.row(align=True)
         row.prop(self.settings, "propertyName")
         
+        index = decoratorhandlers.getPropertyIndex(build=False)
+        
+        if index.isValid and self.settings.propertyName not in index.objectsByName:
+            # Likely a typo unless a new property is being introduced, only checked if the index is built anyway
+            row = box.row(align=True)
+            row.label(text="No object has a property of this name yet", icon="INFO")
+        
         row = box.row(align=True)
-        row.label(text="Type: String (others may be supported in the future)")
+        row.prop(self.settings, "propertyType")
 
         row = box.row(align=True)
         row.prop(self.settings, "propertyValue")
+        row.prop(self.settings, "isValueTemplate", text="", icon="TEXT")
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "valueCondition")
+        
+        if self.settings.valueCondition == "Range":
+            row = box.row(align=True)
+            row.prop(self.settings, "conditionMinimum")
+            row.prop(self.settings, "conditionMaximum")
+        elif self.settings.valueCondition != "Any":
+            row = box.row(align=True)
+            row.prop(self.settings, "conditionValue", text="")
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "newPropertyName")
+        row.prop(self.settings, "renameConflicts", text="")
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "isShowingStatistics")
+        
+        if self.settings.isShowingStatistics:
+            self._drawStatistics(context, box)
         
         
         # Operation settings
@@ -200,6 +720,35 @@ class DecoratorPanel(bpy.types.Panel):
         
         row = box.row(align=True)
         row.prop(self.settings, "isTestOnly")  
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "isModal")  
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "isProfiling")  
+        
+        if self.settings.isProfiling and decoratorworker.lastProfile is not None:
+            col = box.column(align=True)
+            profile = decoratorworker.lastProfile.toDict()
+            
+            for name, phase in profile["phases"].items():
+                col.label(text=f"{name}: {phase['ms']:.1f} ms ({phase['calls']}x)")
+            
+            for name, amount in profile["counters"].items():
+                col.label(text=f"{name}: {amount}")
+            
+            row = box.row(align=True)
+            row.operator("t1nker.object_property_manager_save_profile", text="Save profile...", icon="TIME")
+        
+        if decoratorworker.lastTestPlan is not None:
+            row = box.row(align=True)
+            row.operator("t1nker.object_property_manager_apply_tested", text=f"Apply tested changes ({len(decoratorworker.lastTestPlan)})", icon="CHECKMARK")
+        
+        lastOperation = decoratorhandlers.getChangeJournal().last
+        
+        if lastOperation is not None:
+            row = box.row(align=True)
+            row.operator("t1nker.object_property_manager_revert_last", text=f"Revert last operation ({len(lastOperation.changes)})", icon="LOOP_BACK")
 
 
         # Action section
@@ -215,12 +764,77 @@ class DecoratorPanel(bpy.types.Panel):
         col.label(text="Add if doesn't exist, don't reset")
         col.label(text="Reset value if exists")        
         col.label(text="Remove property")        
+        col.label(text="Rename property, keep values")        
+        
+        col = row.column(align=True)
+        
+        if self.settings.isModal:
+            # Same operations, run step by step
+            col.operator("t1nker.object_property_manager_modal", text="Set", icon="ADD").action = "Add"
+            col.operator("t1nker.object_property_manager_modal", text="Extend", icon="FULLSCREEN_ENTER").action = "Extend"
+            col.operator("t1nker.object_property_manager_modal", text="Reset", icon="FILE_REFRESH").action = "Reset"
+            col.operator("t1nker.object_property_manager_modal", text="Remove", icon="REMOVE").action = "Remove"
+            col.operator("t1nker.object_property_manager_modal", text="Rename", icon="FORWARD").action = "Rename"
+        else:
+            col.operator("t1nker.object_property_manager_add", text="Set", icon="ADD")
+            col.operator("t1nker.object_property_manager_extend", text="Extend", icon="FULLSCREEN_ENTER")
+            col.operator("t1nker.object_property_manager_reset", text="Reset", icon="FILE_REFRESH")        
+            col.operator("t1nker.object_property_manager_remove", text="Remove", icon="REMOVE")
+            col.operator("t1nker.object_property_manager_rename", text="Rename", icon="FORWARD")
+        
+        
+        # Batch section
+        box = layout.box()
+        
+        row = box.row(align=True)
+        row.label(text="Apply many properties in one pass")
+        
+        row = box.row()
+        row.template_list(
+            "DECORATOR_UL_PropertySpecs", "", self.settings, "batchSpecs", self.settings, "batchSpecIndex", rows=3)
+        
+        col = row.column(align=True)
+        col.operator("t1nker.object_property_manager_batch_add_item", text="", icon="ADD")
+        col.operator("t1nker.object_property_manager_batch_remove_item", text="", icon="REMOVE")
+        
+        row = box.row(align=True)
+        
+        if self.settings.isModal:
+            row.operator("t1nker.object_property_manager_modal", text="Apply batch", icon="CHECKMARK").action = "Batch"
+        else:
+            row.operator("t1nker.object_property_manager_batch_apply", text="Apply batch", icon="CHECKMARK")
+        
+        
+        # Auto-extend section
+        box = layout.box()
+        
+        row = box.row(align=True)
+        row.prop(self.settings, "isAutoExtending")
+        
+        row = box.row()
+        row.template_list(
+            "DECORATOR_UL_AutoExtendRules", "", self.settings, "autoExtendRules", self.settings, "autoExtendRuleIndex", rows=2)
         
         col = row.column(align=True)
-        col.operator("t1nker.object_property_manager_add", text="Set", icon="ADD")
-        col.operator("t1nker.object_property_manager_extend", text="Extend", icon="FULLSCREEN_ENTER")
-        col.operator("t1nker.object_property_manager_reset", text="Reset", icon="FILE_REFRESH")        
-        col.operator("t1nker.object_property_manager_remove", text="Remove", icon="REMOVE")
+        col.operator("t1nker.object_property_manager_auto_extend_add_rule", text="", icon="ADD")
+        col.operator("t1nker.object_property_manager_auto_extend_remove_rule", text="", icon="REMOVE")
+        
+        row = box.row(align=True)
+        row.operator("t1nker.object_property_manager_auto_extend_apply", text="Apply rules to all objects", icon="CHECKMARK")
+        
+        
+        # Snapshot section
+        box = layout.box()
+        
+        row = box.row(align=True)
+        row.label(text="Export or import property values")
+        
+        row = box.row(align=True)
+        row.operator("t1nker.object_property_manager_export", text="Export...", icon="EXPORT")
+        row.operator("t1nker.object_property_manager_import", text="Import...", icon="IMPORT")
+        
+        row = box.row(align=True)
+        row.operator("t1nker.object_property_manager_import_values", text="Set values from table...", icon="SPREADSHEET")
         
         
         # Update available button
@@ -229,9 +843,9 @@ class DecoratorPanel(bpy.types.Panel):
         try:
             updateInfo = context.preferences.addons[__package__].preferences.updateInfo
             
-            # Note that checking update is part of executing the main operator, that is, performing at least
-            # one synchronization. Until that no updates will be detected. Updates are not checked each time
-            # this dialog is drawn, but as set in `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`.
+            # Note that updates are checked in the background when an operator runs, and the result is shown once
+            # the check finishes. Until the first operation, no updates will be detected. Updates are not checked each 
+            # time this dialog is drawn, but as set in `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`.
             if updateInfo.updateAvailable:
                 box = layout.box()
                 
@@ -251,11 +865,45 @@ class DecoratorPanel(bpy.types.Panel):
             # Fail silently if we cannot check for updates or draw the UI
             pass    
 
-# Operator to add a property ######################################################################################################
-class OBJECT_OT_DecoratorAdd(bpy.types.Operator):    
-    """Add the custom object property to objects. If the property exists for an object, its value will be reset to the value specified above"""
-    
-    # Properties ==================================================================================================================
+    # Private functions ===========================================================================================================
+    
+    # Draw property statistics ----------------------------------------------------------------------------------------------------
+    def _drawStatistics(self, context: bpy.types.Context, box: bpy.types.UILayout):
+        """
+        Draw how many objects in scope have the property, have its value, and would be changed by each operation. Only counts
+        maintained in the background are shown, objects are not processed here.
+
+        Args:
+            context (Context): A bpy.context object passed by Blender.
+            box (UILayout): The layout to draw in.
+        """
+        statistics = decoratorhandlers.getPropertyStatistics()
+        
+        if statistics.key != decoratorworker.DecoratorWorker.statisticsKey(context):
+            # Settings or scope changed, start counting and show results when redrawn
+            decoratorworker.DecoratorWorker.startStatistics(context)
+        
+        col = box.column(align=True)
+        
+        if statistics.problem:
+            col.label(text=statistics.problem, icon="INFO")
+            return
+        
+        counting = "" if statistics.isComplete else " (counting...)"
+        
+        col.label(text=f"In scope: {len(statistics.objectsInScope)}{counting}")
+        col.label(text=f"Having the property: {len(statistics.objectsHaving)}")
+        col.label(text=f"Having the value: {len(statistics.objectsMatching)}")
+        modes = decoratorworker.DecoratorWorkerModes
+        col.label(text=
+            f"Would change: Set {statistics.wouldChange(modes.Add)}, Extend {statistics.wouldChange(modes.Extend)}, "
+            f"Reset {statistics.wouldChange(modes.Reset)}, Remove {statistics.wouldChange(modes.Remove)}")
+
+# Operator to add a property ######################################################################################################
+class OBJECT_OT_DecoratorAdd(bpy.types.Operator):    
+    """Add the custom object property to objects. If the property exists for an object, its value will be reset to the value specified above"""
+    
+    # Properties ==================================================================================================================
     
     # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
     bl_idname = "t1nker.object_property_manager_add"
@@ -528,4 +1176,912 @@ class OBJECT_OT_DecoratorRemove(bpy.types.Operator):
         
         return opResult    
     
+    
+# Operator to rename a property ###################################################################################################
+class OBJECT_OT_DecoratorRename(bpy.types.Operator):    
+    """Rename the custom object property named above, keeping the value of each object, in a single pass"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_rename"
+    bl_label = "Rename custom object property"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        """
+        Make an instance and create a scene-level copy of the settings.
+        """
+        
+        self.settings = DecoratorSettings(self)
+        """
+        Copy of the operator settings specific to the Blender file (scene)
+        """
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode, false otherwise
+        
+        return context.mode == 'OBJECT'
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        # Call the update checker to check for updates time to time, as specified in 
+        # `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`
+        try:
+            bpy.ops.t1nker.decoratorupdatechecker()            
+        except:
+            # Don't mess up anything if update checking doesn't work, just ignore the error
+            pass
+                        
+        # We just need to run the worker with the context and the proper operation mode (rename here)
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.processObjects(context = context, action = decoratorworker.DecoratorWorkerModes.Rename)
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+    
+# Operator to add an item to the batch ############################################################################################
+class OBJECT_OT_DecoratorBatchAddItem(bpy.types.Operator):    
+    """Add the property name and value specified above to the batch"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_batch_add_item"
+    bl_label = "Add item to batch"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        settings = context.scene.decoratorSettings
+        
+        spec = settings.batchSpecs.add()
+        spec.propertyName = settings.propertyName
+        spec.propertyValue = settings.propertyValue
+        spec.propertyType = settings.propertyType
+        spec.isValueTemplate = settings.isValueTemplate
+        
+        settings.batchSpecIndex = len(settings.batchSpecs) - 1
+        
+        return {'FINISHED'}
+    
+# Operator to remove an item from the batch #######################################################################################
+class OBJECT_OT_DecoratorBatchRemoveItem(bpy.types.Operator):    
+    """Remove the selected item from the batch"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_batch_remove_item"
+    bl_label = "Remove item from batch"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if there is anything to remove
+        return len(context.scene.decoratorSettings.batchSpecs) > 0
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        settings = context.scene.decoratorSettings
+        
+        settings.batchSpecs.remove(settings.batchSpecIndex)
+        settings.batchSpecIndex = min(settings.batchSpecIndex, max(len(settings.batchSpecs) - 1, 0))
+        
+        return {'FINISHED'}
+    
+# Operator to add an auto-extend rule #############################################################################################
+class OBJECT_OT_DecoratorAutoExtendAddRule(bpy.types.Operator):    
+    """Add the property name and value specified above to the auto-extend rules"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_auto_extend_add_rule"
+    bl_label = "Add auto-extend rule"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        settings = context.scene.decoratorSettings
+        
+        rule = settings.autoExtendRules.add()
+        rule.propertyName = settings.propertyName
+        rule.propertyValue = settings.propertyValue
+        rule.propertyType = settings.propertyType
+        rule.isValueTemplate = settings.isValueTemplate
+        
+        settings.autoExtendRuleIndex = len(settings.autoExtendRules) - 1
+        
+        return {'FINISHED'}
+    
+# Operator to remove an auto-extend rule ##########################################################################################
+class OBJECT_OT_DecoratorAutoExtendRemoveRule(bpy.types.Operator):    
+    """Remove the selected auto-extend rule"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_auto_extend_remove_rule"
+    bl_label = "Remove auto-extend rule"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if there is anything to remove
+        return len(context.scene.decoratorSettings.autoExtendRules) > 0
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        settings = context.scene.decoratorSettings
+        
+        settings.autoExtendRules.remove(settings.autoExtendRuleIndex)
+        settings.autoExtendRuleIndex = min(settings.autoExtendRuleIndex, max(len(settings.autoExtendRules) - 1, 0))
+        
+        return {'FINISHED'}
+    
+# Operator to apply auto-extend rules to all objects ##############################################################################
+class OBJECT_OT_DecoratorAutoExtendApply(bpy.types.Operator):    
+    """Apply the auto-extend rules to all objects of the scene, for example after changing the rules"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_auto_extend_apply"
+    bl_label = "Apply auto-extend rules to all objects"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode and there are rules, false otherwise
+        return context.mode == 'OBJECT' and len(context.scene.decoratorSettings.autoExtendRules) > 0
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        try:
+            added = decoratorhandlers.autoExtend(context.scene)
+        except ValueError as ex:
+            self.report({'ERROR'}, f"Invalid property value: {ex}")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"{added} propert{'ies' if added != 1 else 'y'} added")
+        
+        return {'FINISHED'}
+    
+# Operator to apply the batch #####################################################################################################
+class OBJECT_OT_DecoratorBatchApply(bpy.types.Operator):    
+    """Apply all property operations of the batch to objects, processing each object only once"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_batch_apply"
+    bl_label = "Apply batch of custom object properties"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode and there is anything in the batch, false otherwise
+        return context.mode == 'OBJECT' and len(context.scene.decoratorSettings.batchSpecs) > 0
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        # Call the update checker to check for updates time to time, as specified in 
+        # `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`
+        try:
+            bpy.ops.t1nker.decoratorupdatechecker()            
+        except:
+            # Don't mess up anything if update checking doesn't work, just ignore the error
+            pass
+                        
+        # We just need to run the worker in batch mode
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.processBatch(context = context)
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to apply the last test #################################################################################################
+class OBJECT_OT_DecoratorApplyTested(bpy.types.Operator):    
+    """Apply the changes found by the last operation run as a test, without processing objects again"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_apply_tested"
+    bl_label = "Apply tested changes of custom object properties"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
 
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode and there is a tested plan, false otherwise
+        return context.mode == 'OBJECT' and decoratorworker.lastTestPlan is not None
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.applyLastTestPlan()
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to revert the last operation ###########################################################################################
+class OBJECT_OT_DecoratorRevertLast(bpy.types.Operator):    
+    """Restore the values custom object properties had before the last operation. Properties changed since are left alone"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_revert_last"
+    bl_label = "Revert last operation on custom object properties"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode and there is an operation to revert, false otherwise
+        return context.mode == 'OBJECT' and len(decoratorhandlers.getChangeJournal()) > 0
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.revertLastOperation()
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to run operations step by step #########################################################################################
+class OBJECT_OT_DecoratorModal(bpy.types.Operator):    
+    """Process objects in small steps so that Blender stays responsive. Press Esc to cancel and roll back changes made"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_modal"
+    bl_label = "Process custom object properties step by step"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    action: EnumProperty(
+        name="Operation",
+        items=[
+            ("Add", "Set", "Add the property or reset its value"),
+            ("Extend", "Extend", "Add the property if it doesn't exist, don't reset"),
+            ("Reset", "Reset", "Reset the value of the property if it exists"),
+            ("Remove", "Remove", "Remove the property"),
+            ("Rename", "Rename", "Move the value of the property to a new name"),
+            ("Batch", "Batch", "Apply the batch")
+        ],
+        default="Add"
+    )
+    """
+    The operation to perform, named after the values of `decoratorworker.DecoratorWorkerModes`, or Batch to apply the batch.
+    """
+    
+    frameBudget = 1 / 60
+    """
+    Time to spend processing objects in a step (seconds), so that Blender can redraw the UI at a reasonable rate.
+    """
+    
+    timerInterval = 0.001
+    """
+    Interval of the timer triggering steps (seconds).
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode, false otherwise
+        return context.mode == 'OBJECT'
+    
+    # Start the operation ---------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event): 
+        """
+        Start the operation and the timer to make steps.
+        """     
+        
+        # Call the update checker to check for updates time to time, as specified in 
+        # `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`
+        try:
+            bpy.ops.t1nker.decoratorupdatechecker()            
+        except:
+            # Don't mess up anything if update checking doesn't work, just ignore the error
+            pass
+        
+        action = None if self.action == "Batch" else decoratorworker.DecoratorWorkerModes[self.action]
+        
+        try:
+            self._job = decoratorworker.DecoratorWorker().startJob(context, action)
+        except ValueError as ex:
+            self.report({'ERROR'}, f"Invalid property value: {ex}")
+            return {'CANCELLED'}
+        
+        self._job.start()
+        
+        if self._job.isDone: # failed to start
+            return self._finish(context)
+        
+        windowManager = context.window_manager
+        windowManager.progress_begin(0, 100)
+        self._timer = windowManager.event_timer_add(self.timerInterval, window=context.window)
+        windowManager.modal_handler_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    # Run the whole operation at once ---------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """
+        Run the whole operation at once, such as when called from scripts, where there is no UI to keep responsive.
+        """     
+        
+        action = None if self.action == "Batch" else decoratorworker.DecoratorWorkerModes[self.action]
+        
+        try:
+            self._job = decoratorworker.DecoratorWorker().startJob(context, action)
+        except ValueError as ex:
+            self.report({'ERROR'}, f"Invalid property value: {ex}")
+            return {'CANCELLED'}
+        
+        self._job.start()
+        self._job.step()
+        
+        return self._finish(context)
+    
+    # Run the operation -----------------------------------------------------------------------------------------------------------
+    def modal(self, context, event): 
+        """
+        Make a step on timer events, and cancel on Esc.
+        """     
+        
+        if event.type == 'ESC':
+            self._job.cancel()
+            return self._finish(context)
+        
+        if event.type == 'TIMER':
+            if self._job.step(self.frameBudget):
+                return self._finish(context)
+            
+            progress = self._job.progress
+            context.window_manager.progress_update(int(progress * 100))
+            context.workspace.status_text_set(f"T1nk-R Custom Object Property Manager: {progress:.0%} done, press Esc to cancel")
+        
+        # Let the user interact with Blender meanwhile
+        return {'PASS_THROUGH'}
+    
+    # Private functions ===========================================================================================================
+    
+    # Finish the operation --------------------------------------------------------------------------------------------------------
+    def _finish(self, context):
+        """
+        Stop the timer, clear progress info and report results.
+        """
+        windowManager = context.window_manager
+        
+        if getattr(self, "_timer", None) is not None:
+            windowManager.event_timer_remove(self._timer)
+            self._timer = None
+            windowManager.progress_end()
+            context.workspace.status_text_set(None)
+        
+        (opResult, report) = self._job.finish()
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+
+# Operator to export properties ###################################################################################################
+class OBJECT_OT_DecoratorExportSnapshot(bpy.types.Operator):    
+    """Write custom properties of objects in scope to a JSON Lines (.jsonl) or CSV (.csv) file"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_export"
+    bl_label = "Export custom object properties"
+    bl_options = {'REGISTER'}    
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype="FILE_PATH")
+    """
+    The file to write, as chosen in the file browser. The format is told by the extension.
+    """
+    
+    filter_glob: StringProperty(default="*.jsonl;*.csv", options={'HIDDEN'})
+    """
+    File types to show in the file browser.
+    """
+    
+    isPropertyOnly: BoolProperty(
+        name="Only the property set",
+        description="Export only the property named on the panel, not all properties",
+        default=False
+    )
+    """
+    Whether to export only the property named in the settings.
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode, false otherwise
+        return context.mode == 'OBJECT'
+    
+    # Show the file browser -------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """Let the user choose a file"""
+        
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(bpy.path.display_name_from_filepath(bpy.data.filepath) or "untitled", ".jsonl")
+        
+        context.window_manager.fileselect_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.exportSnapshot(
+            context, self.filepath, snapshotFormat(self.filepath), context.scene.decoratorSettings.propertyName if self.isPropertyOnly else "")
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to import properties ###################################################################################################
+class OBJECT_OT_DecoratorImportSnapshot(bpy.types.Operator):    
+    """Give objects in scope the custom property values of a JSON Lines (.jsonl) or CSV (.csv) file exported earlier. Objects are matched by name"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_import"
+    bl_label = "Import custom object properties"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype="FILE_PATH")
+    """
+    The file to read, as chosen in the file browser. The format is told by the extension.
+    """
+    
+    filter_glob: StringProperty(default="*.jsonl;*.csv", options={'HIDDEN'})
+    """
+    File types to show in the file browser.
+    """
+    
+    isExact: BoolProperty(
+        name="Remove other properties",
+        description="Also remove properties of matched objects not in the file, restoring the snapshot exactly",
+        default=False
+    )
+    """
+    Whether to also remove properties not in the snapshot.
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode, false otherwise
+        return context.mode == 'OBJECT'
+    
+    # Show the file browser -------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """Let the user choose a file"""
+        
+        context.window_manager.fileselect_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.importSnapshot(context, self.filepath, snapshotFormat(self.filepath), isExact=self.isExact)
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to import a table of values ############################################################################################
+class OBJECT_OT_DecoratorImportValues(bpy.types.Operator):    
+    """Set custom property values of objects in scope from a table mapping object names to values (.csv, .jsonl or .json). CSV cells are of the type set above, and a column named value is for the property named above"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_import_values"
+    bl_label = "Set custom object property values from a table"
+    bl_options = {'REGISTER', 'UNDO'}    
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype="FILE_PATH")
+    """
+    The file to read, as chosen in the file browser. The format is told by the extension.
+    """
+    
+    filter_glob: StringProperty(default="*.csv;*.jsonl;*.json", options={'HIDDEN'})
+    """
+    File types to show in the file browser.
+    """
+    
+    action: EnumProperty(
+        name="Operation",
+        items=[
+            ("Add", "Set", "Add the property or reset its value"),
+            ("Extend", "Extend", "Add the property if it doesn't exist, don't reset"),
+            ("Reset", "Reset", "Reset the value of the property if it exists")
+        ],
+        default="Add"
+    )
+    """
+    The operation to perform with each value, named after the values of `decoratorworker.DecoratorWorkerModes`.
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if the user is in object mode, false otherwise
+        return context.mode == 'OBJECT'
+    
+    # Show the file browser -------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """Let the user choose a file"""
+        
+        context.window_manager.fileselect_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        dw = decoratorworker.DecoratorWorker()
+        (opResult, report) = dw.importValueTable(
+            context, self.filepath, snapshotFormat(self.filepath), decoratorworker.DecoratorWorkerModes[self.action])
+        
+        if opResult == {'FINISHED'}:
+            self.report({'INFO'}, report)
+        else:
+            self.report({'ERROR'}, report)
+        
+        return opResult
+    
+# Operator to save the last profile ###############################################################################################
+class OBJECT_OT_DecoratorSaveProfile(bpy.types.Operator):    
+    """Save the profile of the last operation as a JSON file, which can also be opened in chrome://tracing or ui.perfetto.dev"""
+    
+    # Properties ==================================================================================================================
+    
+    # Blender-specific stuff ------------------------------------------------------------------------------------------------------    
+    bl_idname = "t1nker.object_property_manager_save_profile"
+    bl_label = "Save profile of the last custom object property operation"
+    bl_options = {'REGISTER'}    
+    
+    # Other properties ------------------------------------------------------------------------------------------------------------
+    filepath: StringProperty(subtype="FILE_PATH")
+    """
+    The file to write, as chosen in the file browser.
+    """
+    
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+    """
+    File types to show in the file browser.
+    """
+    
+    # Public functions ============================================================================================================
+    
+    # See if the operation can run ------------------------------------------------------------------------------------------------
+    @classmethod
+    def poll(cls, context):
+        """
+        Tell if the operator can run.
+
+        Args:
+            context (bpy.types.Context): A context object passed on by Blender for the current context.
+
+        Returns:
+            bool: `True` if the operator can run, `False` otherwise.
+        """
+        
+        # Return true if there is a profile to save, false otherwise
+        return decoratorworker.lastProfile is not None
+    
+    # Show the file browser -------------------------------------------------------------------------------------------------------
+    def invoke(self, context, event):
+        """Let the user choose a file"""
+        
+        if not self.filepath:
+            self.filepath = "property-manager-profile.json"
+        
+        context.window_manager.fileselect_add(self)
+        
+        return {'RUNNING_MODAL'}
+    
+    # Perform the operation -------------------------------------------------------------------------------------------------------
+    def execute(self, context): 
+        """Execute the operator"""     
+        
+        try:
+            decoratorworker.lastProfile.save(bpy.path.ensure_ext(self.filepath, ".json"))
+        except OSError as ex:
+            self.report({'ERROR'}, f"Cannot save profile: {ex}")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, "Profile saved")
+        
+        return {'FINISHED'}
+    
+# Operators using the change journal ##############################################################################################
+
+journaledOperators = [
+    OBJECT_OT_DecoratorAdd,
+    OBJECT_OT_DecoratorExtend,
+    OBJECT_OT_DecoratorReset,
+    OBJECT_OT_DecoratorRemove,
+    OBJECT_OT_DecoratorRename,
+    OBJECT_OT_DecoratorBatchApply,
+    OBJECT_OT_DecoratorApplyTested,
+    OBJECT_OT_DecoratorRevertLast,
+    OBJECT_OT_DecoratorModal,
+    OBJECT_OT_DecoratorImportSnapshot,
+    OBJECT_OT_DecoratorImportValues
+]
+"""
+Operators changing properties and recording their changes in the change journal.
+"""
+
+# Functions #######################################################################################################################
+
+# Choose how operations can be undone ---------------------------------------------------------------------------------------------
+def setLightweightUndo(isEnabled: bool):
+    """
+    Make operators changing properties push an undo step of the whole file in Blender, or not to push it and rely on the change
+    journal (see `decoratorengine.ChangeJournal`) for reverting them. Operators already registered are registered again, as
+    Blender reads their options only when registering.
+
+    Args:
+        isEnabled (bool): `True` not to push undo steps.
+    """
+    options = {'REGISTER'} if isEnabled else {'REGISTER', 'UNDO'}
+    
+    for c in journaledOperators:
+        if c.bl_options == options:
+            continue
+        
+        isRegistered = c.is_registered
+        
+        if isRegistered:
+            bpy.utils.unregister_class(c)
+        
+        c.bl_options = options
+        
+        if isRegistered:
+            bpy.utils.register_class(c)
+
+# Apply the auto-extend rules to all objects --------------------------------------------------------------------------------------
+def autoExtendAll(context: bpy.types.Context):
+    """
+    Apply the auto-extend rules to all objects of the scene when auto-extend is turned on. Invalid rules are logged, as errors 
+    cannot be reported when changing a setting.
+
+    Args:
+        context (bpy.types.Context): A bpy.context object passed by Blender.
+    """
+    try:
+        decoratorhandlers.autoExtend(context.scene)
+    except ValueError as ex:
+        decoratorlog.logger.warning("Auto-extend rules are not applied: %s", ex)
+
+# Tell the format of a snapshot file ----------------------------------------------------------------------------------------------
+def snapshotFormat(path: str) -> decoratorworker.SnapshotFormats:
+    """
+    Tell the format of a snapshot file from its extension.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        decoratorworker.SnapshotFormats: CSV for .csv files, JSON for .json files, JSON Lines otherwise.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    
+    if extension == ".csv":
+        return decoratorworker.SnapshotFormats.Csv
+    
+    if extension == ".json":
+        return decoratorworker.SnapshotFormats.Json
+    
+    return decoratorworker.SnapshotFormats.JsonLines
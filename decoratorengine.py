@@ -0,0 +1,976 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains the bpy-independent property mutation engine of the add-on.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import logging
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence
+from . import decoratorlog
+from .propertyindex import PropertyIndex
+from .propertyvalue import isSameValue, plainValue
+from .valuetemplate import ValueTemplate
+
+# Enum for operating modes ########################################################################################################
+class DecoratorWorkerModes(Enum):
+    """
+    An enum for operating modes.
+    """
+    Add = 1,
+    Remove = 2,
+    Reset = 3,
+    Extend = 4,
+    Rename = 5
+
+
+# Enum for handling rename conflicts ##############################################################################################
+class RenameConflicts(Enum):
+    """
+    An enum for what to do when renaming a property of an object which already has a property of the new name.
+    """
+    Skip = 1
+    """
+    Leave the object alone, keeping both properties.
+    """
+
+    Overwrite = 2
+    """
+    Move the value to the new name, replacing the existing value.
+    """
+
+    KeepExisting = 3
+    """
+    Keep the existing value of the new name, and remove the property of the old name.
+    """
+
+
+# Specification of a property operation ###########################################################################################
+class PropertySpec(NamedTuple):
+    """
+    Specification of an operation on a single property, so that many of them can be applied in one pass over the objects.
+    """
+
+    propertyName: str
+    """
+    Name of the property to process.
+    """
+
+    propertyValue: Any
+    """
+    Value to set for the property (ignored when removing), a `ValueTemplate` to compute it for each object, or the new name of 
+    the property when renaming.
+    """
+
+    action: DecoratorWorkerModes
+    """
+    The operation to perform.
+    """
+
+    conflictPolicy: RenameConflicts = RenameConflicts.Skip
+    """
+    What to do when renaming and an object already has a property of the new name (ignored by other operations).
+    """
+
+    condition: Optional[Callable[[Any], bool]] = None
+    """
+    Tells if the current value of the property is to be reset or removed, such as one made by 
+    `scopefilter.compileValueCondition`, or `None` to reset or remove any value (ignored by other operations).
+    """
+
+
+# Enum for kinds of changes #######################################################################################################
+class ChangeKinds(Enum):
+    """
+    An enum for the kinds of changes a plan can contain.
+    """
+    Add = 1
+    Set = 2
+    Remove = 3
+
+
+# A single planned change #########################################################################################################
+class PlannedChange(NamedTuple):
+    """
+    A single change of a single property of a single object, as decided in the planning phase.
+    """
+
+    object: Any
+    """
+    The object to change.
+    """
+
+    propertyName: str
+    """
+    Name of the property to change.
+    """
+
+    oldValue: Any
+    """
+    Value of the property before the change, or `None` if the object doesn't have it.
+    """
+
+    newValue: Any
+    """
+    Value of the property after the change, or `None` if the property is removed.
+    """
+
+    kind: ChangeKinds
+    """
+    The kind of the change.
+    """
+
+
+# Plan of changes #################################################################################################################
+class ChangePlan:
+    """
+    Changes decided in the planning phase of an operation, in the order they shall be applied. A plan made in test mode can be
+    inspected and then applied later without processing the objects again.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, specs: Iterable[PropertySpec] = ()):
+        """
+        Make an empty plan.
+
+        Args:
+            specs (Iterable[PropertySpec], optional): The property operations the plan is made for. Defaults to none.
+        """
+
+        self.specs = list(specs)
+        """
+        The property operations the plan is made for.
+        """
+
+        self.changes: list[PlannedChange] = []
+        """
+        The planned changes.
+        """
+
+        self.objectsScanned = 0
+        """
+        Number of objects processed when planning.
+        """
+
+        self.keysRead = 0
+        """
+        Number of properties looked up on objects when planning, not counting those already looked up by an earlier operation on
+        the same object.
+        """
+
+        self.operationsSkipped = 0
+        """
+        Number of operations on objects which turned out to need no change when planning.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Number of changes -----------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    # Iterate changes -------------------------------------------------------------------------------------------------------------
+    def __iter__(self):
+        return iter(self.changes)
+
+    # Count changes by kind -------------------------------------------------------------------------------------------------------
+    def counts(self) -> dict[ChangeKinds, int]:
+        """
+        Count planned changes by kind.
+
+        Returns:
+            dict[ChangeKinds, int]: The number of changes for each kind.
+        """
+        result = {kind: 0 for kind in ChangeKinds}
+
+        for change in self.changes:
+            result[change.kind] += 1
+
+        return result
+
+
+# Operation recorded in the journal ###############################################################################################
+class JournalEntry(NamedTuple):
+    """
+    Changes made by a single operation, recorded so that they can be reverted.
+    """
+
+    title: str
+    """
+    Description of the operation.
+    """
+
+    changes: list[PlannedChange]
+    """
+    The changes made, in the order they have been made.
+    """
+
+
+# Journal of changes made #########################################################################################################
+class ChangeJournal:
+    """
+    Journal of the last few operations, recording only the changes actually made with the old values of touched properties,
+    so that operations can be reverted without Blender's undo storing a full copy of the file. Memory used is proportional to
+    the number of changes recorded.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, maxOperations: int = 8):
+        """
+        Make an empty journal.
+
+        Args:
+            maxOperations (int, optional): Number of operations to remember, older ones are dropped. 0 not to remember any.
+            Defaults to 8.
+        """
+
+        self.entries: list[JournalEntry] = []
+        """
+        The operations recorded, the latest last.
+        """
+
+        self.maxOperations = maxOperations
+        """
+        Number of operations to remember.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Number of operations --------------------------------------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # Record an operation ---------------------------------------------------------------------------------------------------------
+    def record(self, title: str, changes: Iterable[PlannedChange]):
+        """
+        Record the changes made by an operation. Operations not changing anything are not recorded, and nothing is recorded if 
+        no operations are to be remembered.
+
+        Args:
+            title (str): Description of the operation.
+            changes (Iterable[PlannedChange]): The changes made, in the order they have been made.
+        """
+        if self.maxOperations <= 0:
+            # Slicing with -0 would keep everything
+            self.entries = []
+            return
+
+        changes = list(changes)
+
+        if not changes:
+            return
+
+        self.entries.append(JournalEntry(title, changes))
+
+        del self.entries[:-self.maxOperations]
+
+    # Get the last operation ------------------------------------------------------------------------------------------------------
+    @property
+    def last(self) -> JournalEntry:
+        """
+        The last operation recorded, or `None` if there is none.
+        """
+        return self.entries[-1] if self.entries else None
+
+    # Take the last operation -----------------------------------------------------------------------------------------------------
+    def pop(self) -> JournalEntry:
+        """
+        Remove the last operation recorded from the journal.
+
+        Returns:
+            JournalEntry: The operation, or `None` if there is none.
+        """
+        return self.entries.pop() if self.entries else None
+
+    # Forget all operations -------------------------------------------------------------------------------------------------------
+    def clear(self):
+        """
+        Forget all operations, for example when the objects they changed are no longer valid.
+        """
+        self.entries = []
+
+
+# Helper functions ################################################################################################################
+
+# Get a printable name of an object -----------------------------------------------------------------------------------------------
+def objectName(object: Any) -> str:
+    """
+    Get a printable name for an object. Blender objects have a `name`, while plain mappings used outside Blender may not.
+
+    Args:
+        object (Any): The object to get the name of.
+
+    Returns:
+        str: The name of the object, or its string representation if it has no name.
+    """
+    return getattr(object, "name", None) or str(object)
+
+
+# The algorithm of supported operations ###########################################################################################
+class DecoratorEngine:
+    """
+    The algorithm of supported operations, independent of Blender. It works on any collection of mapping-like objects
+    supporting `in`, `[]`, assignment and `del` for keys, such as Blender objects (through their ID properties) or plain
+    dictionaries. `DecoratorWorker` is a thin adapter on top of this to collect objects and settings from a Blender context.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, isTestOnly: bool = False, logger: logging.Logger = None, index: PropertyIndex = None):
+        """
+        Make an instance.
+
+        Args:
+            isTestOnly (bool, optional): Whether to only simulate changes. Defaults to False.
+            logger (logging.Logger, optional): Logger to use. Per-object details are only logged (and formatted) if it is
+            enabled for DEBUG level. Defaults to the logger of the add-on.
+            index (PropertyIndex, optional): Index of property names of all objects to use for finding objects having a 
+            property. It's kept current when applying changes. Defaults to None, meaning objects are checked one by one.
+        """
+
+        self.isTestOnly = isTestOnly
+        """
+        Controls if actions are actually taken or just simulated.
+        """
+
+        self.logger = logger or decoratorlog.logger
+        """
+        Logger to log with.
+        """
+
+        self.index = index
+        """
+        Index of property names of all objects, if available.
+        """
+
+        self.isVerbose = False
+        """
+        Whether per-object details are logged, determined from the level of the logger when planning starts.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Describe an operation -------------------------------------------------------------------------------------------------------
+    def describe(
+            self, propertyName: str, propertyValue: Any, action: DecoratorWorkerModes, 
+            conflictPolicy: RenameConflicts = RenameConflicts.Skip, condition: Callable[[Any], bool] = None) -> str:
+        """
+        Tell in plain words what an operation is going to do.
+
+        Args:
+            propertyName (str): Name of the property to process.
+            propertyValue (Any): Value to set for the property, or its new name when renaming.
+            action (DecoratorWorkerModes): The operation to perform.
+            conflictPolicy (RenameConflicts, optional): What to do if the new name is taken when renaming. Defaults to Skip.
+            condition (Callable[[Any], bool], optional): Tells which values to reset or remove. Defaults to None.
+
+        Raises:
+            ValueError: If `action` is not a valid operation mode, or the new name or the conflict policy is not valid when
+            renaming.
+
+        Returns:
+            str: The description of the operation.
+        """
+        match action:
+            case DecoratorWorkerModes.Add:
+                return f"Will add property {propertyName} with a value of '{propertyValue}'"
+            case DecoratorWorkerModes.Extend:
+                return f"Will extend property {propertyName} with the default value of '{propertyValue}'"
+            case DecoratorWorkerModes.Reset:
+                where = "" if condition is None else " where its value passes the condition"
+                return f"Will reset property {propertyName} to the default value of '{propertyValue}'{where}"
+            case DecoratorWorkerModes.Remove:
+                where = "" if condition is None else " where its value passes the condition"
+                return f"Will remove property {propertyName}{where}"
+            case DecoratorWorkerModes.Rename:
+                if not isinstance(propertyValue, str) or propertyValue == "" or propertyValue == propertyName:
+                    raise ValueError(f"Specify a new name for property {propertyName} different from the current one")
+
+                if not isinstance(conflictPolicy, RenameConflicts):
+                    raise ValueError(f"Invalid policy for rename conflicts: {conflictPolicy}")
+
+                return f"Will rename property {propertyName} to {propertyValue}, {conflictPolicy.name} if the new name is taken"
+            case _:
+                raise ValueError("Invalid operation mode specified. This should not happen. Contact the developer and blame him.")
+
+    # Process objects -------------------------------------------------------------------------------------------------------------
+    def process(self, objects: Iterable, propertyName: str, propertyValue: Any, action: DecoratorWorkerModes) -> int:
+        """
+        Process objects and add, extend, reset, remove or rename a custom property, as controlled by action.
+
+        Args:
+            objects (Iterable): The mapping-like objects to process.
+            propertyName (str): Name of the property to process.
+            propertyValue (Any): Value to set for the property (ignored when removing), or its new name when renaming, keeping
+            the value of objects already having a property of the new name.
+            action (DecoratorWorkerModes): The operation to perform.
+
+        Raises:
+            ValueError: If `action` is not a valid operation mode.
+
+        Returns:
+            int: The number of changes made (or that would have been made in test mode).
+        """
+        return self.processBatch(objects, [PropertySpec(propertyName, propertyValue, action)])
+
+    # Process objects with many property operations -------------------------------------------------------------------------------
+    def processBatch(self, objects: Iterable, specs: Iterable[PropertySpec]) -> int:
+        """
+        Plan all property operations in `specs` for each object in a single pass over the objects, and apply the plan unless
+        in test mode.
+
+        Args:
+            objects (Iterable): The mapping-like objects to process.
+            specs (Iterable[PropertySpec]): The property operations to apply.
+
+        Raises:
+            ValueError: If an operation mode in `specs` is not valid.
+
+        Returns:
+            int: The number of changes made (or that would have been made in test mode), counting each property of each 
+            object separately.
+        """
+
+        plan = self.plan(objects, specs)
+
+        if not self.isTestOnly:
+            self.apply(plan)
+
+        return len(plan)
+
+    # Plan changes ----------------------------------------------------------------------------------------------------------------
+    def plan(self, objects: Iterable, specs: Iterable[PropertySpec], inScope: Callable[[Any], bool] = None) -> ChangePlan:
+        """
+        Decide what to change to apply all property operations in `specs` to each object, without changing anything. Operations
+        are applied to an object in the order they are specified, so a later operation sees the effect of an earlier one on 
+        the same property. Writes which would not change the value are left out of the plan.
+        
+        If all operations are resets, removals or renames, only objects already having one of the properties can be affected. If the
+        engine has a valid index and `inScope` is specified, only objects the index tells to have the property are planned, 
+        checking conditions on values once for each distinct value. The index shall be kept current by whoever changes objects,
+        such as the handlers of the add-on. Objects it returns are checked to still exist, be in scope and have the property, 
+        and those which don't are dropped from the index.
+
+        Args:
+            objects (Iterable): The mapping-like objects to process.
+            specs (Iterable[PropertySpec]): The property operations to plan.
+            inScope (Callable[[Any], bool], optional): Tells if an object is in `objects`, for using the index. Defaults to None.
+
+        Raises:
+            ValueError: If an operation mode in `specs` is not valid.
+
+        Returns:
+            ChangePlan: The changes to make.
+        """
+
+        plan = self.startPlan(specs)
+
+        # Process all objects in scope
+        for object in self._candidates(objects, plan.specs, inScope):
+            self._planSpecs(object, plan)
+
+        return plan
+
+    # Start planning changes ------------------------------------------------------------------------------------------------------
+    def startPlan(self, specs: Iterable[PropertySpec]) -> ChangePlan:
+        """
+        Make an empty plan for property operations, to be filled by `planObjects`. Use this and `planObjects` instead of `plan`
+        to plan changes step by step.
+
+        Args:
+            specs (Iterable[PropertySpec]): The property operations to plan.
+
+        Raises:
+            ValueError: If an operation mode in `specs` is not valid.
+
+        Returns:
+            ChangePlan: The empty plan.
+        """
+
+        plan = ChangePlan(specs)
+
+        # Make a note of what is going to happen (this validates operation modes before touching anything)
+        for spec in plan.specs:
+            self.logger.info(self.describe(*spec))
+
+        # Check the log level only once instead of for each object
+        self.isVerbose = self.logger.isEnabledFor(logging.DEBUG)
+
+        return plan
+
+    # Plan changes step by step ---------------------------------------------------------------------------------------------------
+    def planObjects(self, plan: ChangePlan, objects: Iterable, inScope: Callable[[Any], bool] = None) -> Iterator[int]:
+        """
+        Plan changes for objects step by step, yielding after each object so that the caller can interrupt planning any time.
+        See `plan` for details.
+
+        Args:
+            plan (ChangePlan): The plan to fill, as returned by `startPlan`.
+            objects (Iterable): The mapping-like objects to process.
+            inScope (Callable[[Any], bool], optional): Tells if an object is in `objects`, for using the index. Defaults to None.
+
+        Yields:
+            int: The number of objects processed so far.
+        """
+        for object in self._candidates(objects, plan.specs, inScope):
+            self._planSpecs(object, plan)
+            yield plan.objectsScanned
+
+    # Plan changes specific to each object ----------------------------------------------------------------------------------------
+    def planEach(self, plan: ChangePlan, items: Iterable[tuple[Any, Iterable[PropertySpec]]]) -> ChangePlan:
+        """
+        Plan changes for objects each with property operations of its own, such as values read from a table or a snapshot,
+        instead of the operations of the plan. Items are processed as they come, so they can be read from a file on the fly.
+
+        Args:
+            plan (ChangePlan): The plan to fill, as returned by `startPlan`.
+            items (Iterable[tuple[Any, Iterable[PropertySpec]]]): Objects with the property operations to apply to them.
+
+        Raises:
+            ValueError: If an operation mode is not valid.
+
+        Returns:
+            ChangePlan: The plan filled.
+        """
+        for object, specs in items:
+            plan.objectsScanned += 1
+
+            pending = {}
+
+            for spec in specs:
+                if not isinstance(spec.action, DecoratorWorkerModes):
+                    raise ValueError(f"Invalid operation mode: {spec.action}")
+
+                self._planObject(object, spec, pending, plan)
+
+        return plan
+
+    # Apply a plan ----------------------------------------------------------------------------------------------------------------
+    def apply(self, plan: ChangePlan, verify: bool = False, journal: ChangeJournal = None, title: str = "") -> int:
+        """
+        Make the changes of a plan. This is atomic: if a change fails, the changes already made are reverted before the error is
+        raised.
+
+        Args:
+            plan (ChangePlan): The plan to apply.
+            verify (bool, optional): Whether to check each property still has the value it had when planning, and skip 
+            the change if it doesn't (or the object is gone). Use it when applying a plan made earlier. Defaults to False.
+            journal (ChangeJournal, optional): Journal to record the changes made in. Defaults to None.
+            title (str, optional): Description of the operation for the journal. Defaults to "".
+
+        Returns:
+            int: The number of changes made.
+        """
+
+        applied = []
+
+        try:
+            for change in plan.changes:
+                if self.applyChange(change, verify):
+                    applied.append(change)
+        except Exception:
+            self.revert(applied)
+            raise
+
+        if journal is not None:
+            journal.record(title, applied)
+
+        return len(applied)
+
+    # Apply a single change -------------------------------------------------------------------------------------------------------
+    def applyChange(self, change: PlannedChange, verify: bool = False) -> bool:
+        """
+        Make a single change of a plan.
+
+        Args:
+            change (PlannedChange): The change to make.
+            verify (bool, optional): Whether to check the property still has the value it had when planning, and skip the 
+            change if it doesn't (or the object is gone). Defaults to False.
+
+        Returns:
+            bool: `True` if the change has been made, `False` if skipped.
+        """
+        object = change.object
+
+        try:
+            if verify and not isSameValue(plainValue(object.get(change.propertyName)), change.oldValue):
+                self.logger.debug("\tProperty %s of '%s' changed since planning, skipped", change.propertyName, objectName(object))
+                return False
+
+            self._setValue(object, change.propertyName, change.newValue)
+        except ReferenceError:
+            # The object has been deleted since planning
+            self.logger.debug("\tAn object changed in the plan no longer exists, skipped")
+            return False
+
+        return True
+
+    # Roll back changes -----------------------------------------------------------------------------------------------------------
+    def revert(self, changes: Sequence[PlannedChange], verify: bool = False) -> int:
+        """
+        Restore the values properties had before changes were made, in reverse order. Use it to roll back an operation 
+        interrupted while applying changes, or to revert an operation recorded in a `ChangeJournal`.
+
+        Args:
+            changes (Sequence[PlannedChange]): The changes made.
+            verify (bool, optional): Whether to check each property still has the value set by the change, and leave it alone
+            if it doesn't. Use it when reverting changes made earlier, not to overwrite edits made since. Defaults to False.
+
+        Returns:
+            int: The number of changes reverted.
+        """
+
+        reverted = 0
+
+        for change in reversed(changes):
+            try:
+                if verify and not isSameValue(plainValue(change.object.get(change.propertyName)), change.newValue):
+                    self.logger.debug("\tProperty %s of '%s' changed since, not reverted", change.propertyName, objectName(change.object))
+                    continue
+
+                self._setValue(change.object, change.propertyName, change.oldValue)
+            except ReferenceError:
+                # The object has been deleted since changed, nothing to restore
+                continue
+
+            reverted = reverted + 1
+
+        return reverted
+
+    # Private functions ===========================================================================================================
+
+    # Get objects to process ------------------------------------------------------------------------------------------------------
+    def _candidates(self, objects: Iterable, specs: list[PropertySpec], inScope: Callable[[Any], bool]) -> Iterator:
+        """
+        Get the objects which need to be processed to plan `specs`, using the index if possible. Objects found in the index 
+        are checked one by one as they are taken, so taking the first one doesn't cost a pass over all objects.
+
+        Args:
+            objects (Iterable): All objects in scope.
+            specs (list[PropertySpec]): The property operations to plan.
+            inScope (Callable[[Any], bool]): Tells if an object is in `objects`, or `None` if this is not known.
+
+        Yields:
+            Any: The objects of `objects`, or the objects in scope having any of the properties in `specs`.
+        """
+        if self.index is None or not self.index.isValid or inScope is None or not specs:
+            yield from objects
+            return
+
+        if any(spec.action not in (DecoratorWorkerModes.Reset, DecoratorWorkerModes.Remove, DecoratorWorkerModes.Rename) for spec in specs):
+            # Objects not having the property can be affected, all objects shall be processed
+            yield from objects
+            return
+
+        candidates = set()
+        for spec in specs:
+            if spec.condition is not None and spec.action != DecoratorWorkerModes.Rename:
+                # Only objects with values passing the condition can be affected, check each distinct value once
+                candidates |= self.index.objectsWhere(spec.propertyName, spec.condition)
+            else:
+                candidates |= self.index.objectsWith(spec.propertyName)
+
+        self.logger.info("Using the property index, %d objects may have the property", len(candidates))
+
+        names = [spec.propertyName for spec in specs]
+
+        for object in candidates:
+            try:
+                if not inScope(object):
+                    continue
+
+                if not any(name in object for name in names):
+                    # The property has been removed by a script without anyone telling the index, drop the object from it
+                    self.index.refresh(object)
+                    continue
+            except ReferenceError:
+                # The object has been deleted since indexed
+                self.index.discard(object)
+                continue
+
+            yield object
+
+    # Plan all property operations for a single object ----------------------------------------------------------------------------
+    def _planSpecs(self, object: Any, plan: ChangePlan):
+        """
+        Plan all property operations of a plan for a single object.
+
+        Args:
+            object (Any): The mapping-like object to process.
+            plan (ChangePlan): The plan to add changes to.
+        """
+        plan.objectsScanned += 1
+
+        # Properties changed by earlier operations on this object (only needed if there are several operations)
+        pending = {}
+
+        for spec in plan.specs:
+            planned = len(plan.changes)
+
+            self._planObject(object, spec, pending, plan)
+
+            if len(plan.changes) == planned:
+                plan.operationsSkipped += 1
+
+    # Plan a single property operation for a single object ------------------------------------------------------------------------
+    def _planObject(self, object: Any, spec: PropertySpec, pending: dict, plan: ChangePlan):
+        """
+        Decide what to change to add, extend, reset, remove or rename a custom property of a single object, as controlled by the
+        action of `spec`, and add the change to the plan.
+
+        Args:
+            object (Any): The mapping-like object to process.
+            spec (PropertySpec): The property operation to plan.
+            pending (dict): Values of properties of this object changed by earlier operations, `None` for removed ones.
+            plan (ChangePlan): The plan to add changes to.
+        """
+
+        propertyName, propertyValue, action, conflictPolicy, condition = spec
+
+        # Get the current value considering changes planned earlier
+        if propertyName in pending:
+            currentValue = pending[propertyName]
+        else:
+            currentValue = plainValue(object[propertyName]) if propertyName in object else None
+            plan.keysRead += 1
+
+        # Branch based on whether the current object has this property 
+        if currentValue is not None: # this object has this property
+
+            if condition is not None and action in (DecoratorWorkerModes.Reset, DecoratorWorkerModes.Remove) and not condition(currentValue):
+                if self.isVerbose:
+                    self.logger.debug("\tProperty of '%s' has a value of '%s' not passing the condition, left alone", objectName(object), currentValue)
+                return
+
+            # Branch based on operation mode
+            match action:
+
+                case DecoratorWorkerModes.Add | DecoratorWorkerModes.Reset: # addition or reset requested
+                    # The property already exists, revert its value to the specified one
+                    propertyValue = self._valueFor(propertyValue, object, plan)
+
+                    if isSameValue(currentValue, propertyValue):
+                        if self.isVerbose:
+                            self.logger.debug("\tProperty already exists on '%s' with a value of '%s', nothing to reset", objectName(object), currentValue)
+                        return
+
+                    if self.isVerbose:
+                        self.logger.debug("\tProperty already exists on '%s' with a value of '%s', will be reset", objectName(object), currentValue)
+
+                    self._addChange(plan, pending, PlannedChange(object, propertyName, currentValue, propertyValue, ChangeKinds.Set))
+
+                case DecoratorWorkerModes.Extend: # extension requested
+                    # The property already exists, don't need to re-add
+                    if self.isVerbose:
+                        self.logger.debug("\tProperty already exists on '%s' with a value of '%s', and it won't be reset", objectName(object), currentValue)
+
+                case DecoratorWorkerModes.Remove: # removal requested
+                    # The property exists, needs to be removed
+                    if self.isVerbose:
+                        self.logger.debug("\tRemoving property from '%s'", objectName(object))
+
+                    self._addChange(plan, pending, PlannedChange(object, propertyName, currentValue, None, ChangeKinds.Remove))
+
+                case DecoratorWorkerModes.Rename: # rename requested
+                    # The property exists, move its value to the new name
+                    self._planRename(object, propertyName, currentValue, propertyValue, conflictPolicy, pending, plan)
+
+                case _:
+                    # Do nothing, it may happen that nothing has to be made on this code branch with a specific operation mode
+                    pass
+
+        else: # this object doesn't have this property
+
+            # Branch based on operation mode
+            match action:
+
+                case DecoratorWorkerModes.Add | DecoratorWorkerModes.Extend: # addition requested
+                    # This object doesn't have this property, let's add it
+                    propertyValue = self._valueFor(propertyValue, object, plan)
+
+                    if self.isVerbose:
+                        self.logger.debug("\tAdding property to '%s'", objectName(object))
+
+                    self._addChange(plan, pending, PlannedChange(object, propertyName, None, propertyValue, ChangeKinds.Add))
+
+                case DecoratorWorkerModes.Reset: # reset requested
+                    # This object doesn't have this property, there's nothing to reset
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' doesn't have this property, therefore there's nothing to reset", objectName(object))
+
+                case DecoratorWorkerModes.Remove: # removal requested
+                    # This object doesn't have this property, there's nothing to remove
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' doesn't have this property, therefore there's nothing to remove", objectName(object))
+
+                case DecoratorWorkerModes.Rename: # rename requested
+                    # This object doesn't have this property, there's nothing to rename
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' doesn't have this property, therefore there's nothing to rename", objectName(object))
+
+                case _:
+                    # Do nothing, it may happen that nothing has to be made on this code branch with a specific operation mode
+                    pass
+
+    # Plan renaming a property of a single object ---------------------------------------------------------------------------------
+    def _planRename(
+            self, object: Any, propertyName: str, currentValue: Any, newName: str, conflictPolicy: RenameConflicts, 
+            pending: dict, plan: ChangePlan):
+        """
+        Decide what to change to move the value of a property of an object to a new name, and add the changes to the plan. 
+        Renaming is planned as setting the new name and then removing the old one, so it's journaled and reverted like any
+        other change.
+
+        Args:
+            object (Any): The mapping-like object to process.
+            propertyName (str): Name of the property to rename, which the object has.
+            currentValue (Any): Value of the property.
+            newName (str): The new name of the property.
+            conflictPolicy (RenameConflicts): What to do if the object already has a property of the new name.
+            pending (dict): Values of properties of this object changed by earlier operations, `None` for removed ones.
+            plan (ChangePlan): The plan to add changes to.
+        """
+        if newName in pending:
+            existingValue = pending[newName]
+        else:
+            existingValue = plainValue(object[newName]) if newName in object else None
+            plan.keysRead += 1
+
+        if existingValue is None:
+            if self.isVerbose:
+                self.logger.debug("\tRenaming property of '%s'", objectName(object))
+
+            self._addChange(plan, pending, PlannedChange(object, newName, None, currentValue, ChangeKinds.Add))
+
+        else:
+            match conflictPolicy:
+                case RenameConflicts.Skip:
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' already has property %s, skipped", objectName(object), newName)
+                    return
+
+                case RenameConflicts.Overwrite:
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' already has property %s with a value of '%s', will be overwritten", objectName(object), newName, existingValue)
+
+                    if not isSameValue(existingValue, currentValue):
+                        self._addChange(plan, pending, PlannedChange(object, newName, existingValue, currentValue, ChangeKinds.Set))
+
+                case RenameConflicts.KeepExisting:
+                    if self.isVerbose:
+                        self.logger.debug("\tObject '%s' already has property %s with a value of '%s', will be kept", objectName(object), newName, existingValue)
+
+        self._addChange(plan, pending, PlannedChange(object, propertyName, currentValue, None, ChangeKinds.Remove))
+
+    # Get the value to set for an object ------------------------------------------------------------------------------------------
+    def _valueFor(self, propertyValue: Any, object: Any, plan: ChangePlan) -> Any:
+        """
+        Get the value to set for an object, rendering it if it's a template. Templates are only rendered for objects actually
+        needing the value.
+
+        Args:
+            propertyValue (Any): The value, or a `ValueTemplate`.
+            object (Any): The object being processed.
+            plan (ChangePlan): The plan being made, telling the position of the object in the operation.
+
+        Raises:
+            ValueError: If the template cannot be rendered for the object.
+
+        Returns:
+            Any: The value.
+        """
+        if not isinstance(propertyValue, ValueTemplate):
+            return propertyValue
+
+        try:
+            return propertyValue.render(object, plan.objectsScanned - 1)
+        except ValueError as ex:
+            raise ValueError(f"Cannot compute value of '{objectName(object)}' from template '{propertyValue}': {ex}")
+
+    # Add a change to the plan ----------------------------------------------------------------------------------------------------
+    def _addChange(self, plan: ChangePlan, pending: dict, change: PlannedChange):
+        """
+        Add a change to the plan, and remember the new value for later operations on the same object.
+
+        Args:
+            plan (ChangePlan): The plan to add the change to.
+            pending (dict): Values of properties of this object changed by earlier operations.
+            change (PlannedChange): The change to add.
+        """
+        plan.changes.append(change)
+
+        # Only needed if more operations follow, but cheaper to record than to check
+        pending[change.propertyName] = change.newValue
+
+    # Set or remove a property value ----------------------------------------------------------------------------------------------
+    def _setValue(self, object: Any, propertyName: str, value: Any):
+        """
+        Set the value of a property of an object, or remove the property if `value` is `None`, and keep the index current.
+
+        Args:
+            object (Any): The object to change.
+            propertyName (str): Name of the property.
+            value (Any): The value to set, or `None` to remove the property.
+        """
+        if value is None:
+            if propertyName in object:
+                del object[propertyName]
+
+                if self.index is not None:
+                    self.index.removed(object, propertyName)
+        else:
+            if self.index is not None and propertyName not in object:
+                self.index.added(object, propertyName)
+
+            object[propertyName] = value
+
+            if self.index is not None:
+                self.index.setValue(object, propertyName, value)
@@ -0,0 +1,440 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains Blender handlers keeping cached information of the add-on current.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import bpy
+from bpy.app.handlers import persistent
+from .propertyindex import PropertyIndex
+from .decoratorengine import ChangeJournal
+from .propertyresolver import PropertyResolver
+from .propertystats import PropertyStatistics
+from .autoextend import AutoExtender, AutoExtendRule
+from .decoratorlog import logger
+
+# State ###########################################################################################################################
+
+_propertyIndex = PropertyIndex()
+"""
+Index of custom property names of all objects of the current file. Use `getPropertyIndex` to access it.
+"""
+
+_changeJournal = ChangeJournal()
+"""
+Journal of the last operations changing properties in the current file. Use `getChangeJournal` to access it.
+"""
+
+_propertyResolver = PropertyResolver(allCollections=lambda: [*bpy.data.collections, *(scene.collection for scene in bpy.data.scenes)])
+"""
+Resolver of property values inherited from parents and collections in the current file. Use `getPropertyResolver` to access it.
+"""
+
+_propertyStatistics = PropertyStatistics()
+"""
+Statistics of the property set on the panel over the objects in scope. Use `getPropertyStatistics` to access it.
+"""
+
+_autoExtender = AutoExtender(index=_propertyIndex)
+"""
+Applies the auto-extend rules to objects not seen before. Use `autoExtend` to apply them to all objects of a scene.
+"""
+
+_masterCollectionShapes: dict[int, tuple[int, int]] = {}
+"""
+Number of child collections and objects of the master collection of each scene, by `session_uid` of the scene, to tell changes
+of the hierarchy of collections from other updates of scenes.
+"""
+
+_countingBudget = 0.02
+"""
+Seconds to spend counting statistics in a timer call, short enough to keep the UI responsive.
+"""
+
+_redrawInterval = 0.25
+"""
+Seconds to wait at least between redraws of the panel requested when statistics change.
+"""
+
+# Functions #######################################################################################################################
+
+# Get the property index ----------------------------------------------------------------------------------------------------------
+def getPropertyIndex(build: bool = True) -> PropertyIndex:
+    """
+    Get the index of custom property names of all objects of the current file, building it if not yet built or invalidated.
+
+    Args:
+        build (bool, optional): Whether to build the index if needed. If `False`, the index may be invalid, which is fine to 
+        pass on to code only keeping it current. Defaults to True.
+
+    Returns:
+        PropertyIndex: The index.
+    """
+    if build and not _propertyIndex.isValid:
+        _propertyIndex.build(bpy.data.objects)
+
+    return _propertyIndex
+
+# Get the change journal ----------------------------------------------------------------------------------------------------------
+def getChangeJournal() -> ChangeJournal:
+    """
+    Get the journal of the last operations changing properties in the current file.
+
+    Returns:
+        ChangeJournal: The journal.
+    """
+    return _changeJournal
+
+# Get the property resolver -------------------------------------------------------------------------------------------------------
+def getPropertyResolver() -> PropertyResolver:
+    """
+    Get the resolver of property values inherited from parents and collections in the current file. Values of collections are
+    memoized, and forgotten when collections change.
+
+    Returns:
+        PropertyResolver: The resolver.
+    """
+    return _propertyResolver
+
+# Get the property statistics -----------------------------------------------------------------------------------------------------
+def getPropertyStatistics() -> PropertyStatistics:
+    """
+    Get the statistics of the property set on the panel over the objects in scope. Start counting with `startStatistics`.
+
+    Returns:
+        PropertyStatistics: The statistics.
+    """
+    return _propertyStatistics
+
+# Start counting the property statistics ------------------------------------------------------------------------------------------
+def startStatistics(*args):
+    """
+    Start counting the property statistics, and count them in a timer, a time budget at a time.
+
+    Args:
+        args: Arguments of `PropertyStatistics.start`.
+    """
+    _propertyStatistics.start(*args)
+
+    if not bpy.app.timers.is_registered(_countStatistics):
+        bpy.app.timers.register(_countStatistics, first_interval=0.0)
+
+# Keep cached information current after changes -----------------------------------------------------------------------------------
+def propertiesChanged(changes: list):
+    """
+    Keep cached information current after properties have been changed (or reverted) by the add-on, without waiting for
+    the dependency graph, which doesn't report all changes of custom properties.
+
+    Args:
+        changes (list[PlannedChange]): The changes made.
+    """
+    # Properties of collections may have changed
+    _propertyResolver.invalidate()
+
+    if _propertyStatistics.isValid:
+        for change in changes:
+            _propertyStatistics.refresh(change.object)
+
+        requestRedraw()
+
+# Apply the auto-extend rules -----------------------------------------------------------------------------------------------------
+def autoExtend(scene: bpy.types.Scene, objects: list = None) -> int:
+    """
+    Apply the auto-extend rules of a scene to objects whether seen before or not, and remember them as seen, so that only 
+    objects created afterwards are processed when the dependency graph reports them.
+
+    Args:
+        scene (bpy.types.Scene): The scene with the rules.
+        objects (list[bpy.types.Object], optional): The objects to extend. Defaults to None, meaning all objects of the scene.
+
+    Raises:
+        ValueError: If a value of a rule cannot be converted to its type, or is not a valid template.
+
+    Returns:
+        int: The number of properties added.
+    """
+    _autoExtender.setRules(_autoExtendRules(scene))
+
+    plan = _autoExtender.extend(scene.objects if objects is None else objects)
+
+    if len(plan) > 0:
+        propertiesChanged(plan.changes)
+
+    return len(plan)
+
+# Redraw the panel soon -----------------------------------------------------------------------------------------------------------
+def requestRedraw():
+    """
+    Redraw the sidebar of 3D views soon, but not more often than once in `_redrawInterval` however many times requested.
+    """
+    if not bpy.app.timers.is_registered(_redrawSidebars):
+        bpy.app.timers.register(_redrawSidebars, first_interval=_redrawInterval)
+
+# Handlers ########################################################################################################################
+
+# Track changed objects -----------------------------------------------------------------------------------------------------------
+@persistent
+def onDepsgraphUpdatePost(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """
+    Re-index and re-count objects reported as added or changed by the dependency graph, and forget inherited values if collections
+    changed. Statistics are counted again only if their scope may have changed without objects being reported: when the selection
+    changes and only selected objects are counted, or when collections change and objects are filtered by collection. Deleted
+    objects are not reported, they are removed from the index and statistics when found. If auto-extend is on, the rules are
+    applied to objects not seen before, so this costs the same regardless of the number of objects in the file.
+
+    Args:
+        scene (bpy.types.Scene): The scene updated.
+        depsgraph (bpy.types.Depsgraph): The dependency graph with the updates.
+    """
+    isObjectUpdated = False
+    isSceneUpdated = False
+    isHierarchyUpdated = False
+    isAutoExtending = scene.decoratorSettings.isAutoExtending
+    newObjects = []
+
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            isObjectUpdated = True
+
+            if isAutoExtending and update.id.original.session_uid not in _autoExtender.seen:
+                newObjects.append(update.id.original)
+
+            if _propertyIndex.isValid:
+                _propertyIndex.refresh(update.id.original)
+
+            if _propertyStatistics.isValid:
+                _propertyStatistics.refresh(update.id.original)
+        elif isinstance(update.id, bpy.types.Collection):
+            # Collections or their hierarchy may have changed
+            _propertyResolver.invalidate()
+            isSceneUpdated = True
+            isHierarchyUpdated = True
+        elif isinstance(update.id, bpy.types.Scene):
+            # Master collections are reported as scenes, along with selection and frame changes, which don't matter here
+            if _isHierarchyChanged(update.id.original):
+                _propertyResolver.invalidate()
+                isHierarchyUpdated = True
+
+            isSceneUpdated = True
+
+    if newObjects:
+        _autoExtendNew(scene, newObjects)
+
+    settings = scene.decoratorSettings
+
+    if isSceneUpdated and not isObjectUpdated and settings.affectSelectedObjectsOnly and not settings.isCollectionTarget:
+        # Selection changes are reported for the scene only, objects may have moved in or out of scope
+        _propertyStatistics.invalidate()
+    elif isHierarchyUpdated and settings.isFilterEnabled and settings.filterCollection is not None:
+        # Objects may have been linked to or unlinked from the filter collection, whose objects are collected when counting starts
+        _propertyStatistics.invalidate()
+
+    if isObjectUpdated or isSceneUpdated:
+        requestRedraw()
+
+# Drop cached information when objects are replaced -------------------------------------------------------------------------------
+@persistent
+def onObjectsReplaced(*args):
+    """
+    Invalidate the index, inherited values and statistics, and forget journaled operations when a file is loaded or an undo or
+    redo step is made, as objects may be all different.
+    """
+    _propertyIndex.invalidate()
+    _changeJournal.clear()
+    _propertyResolver.invalidate()
+    _propertyStatistics.invalidate()
+    _masterCollectionShapes.clear()
+
+# Apply the auto-extend rules after loading a file --------------------------------------------------------------------------------
+@persistent
+def onFileLoaded(*args):
+    """
+    Forget objects seen in the previous file, and apply the auto-extend rules to all objects of scenes where auto-extend is on,
+    as the file may have been saved without the add-on enabled.
+    """
+    _autoExtender.seen.clear()
+
+    for scene in bpy.data.scenes:
+        if scene.decoratorSettings.isAutoExtending:
+            _autoExtendNew(scene, scene.objects)
+
+# Timers ##########################################################################################################################
+
+# Count the property statistics ---------------------------------------------------------------------------------------------------
+def _countStatistics() -> float:
+    """
+    Count the property statistics for a time budget, and redraw the panel to show the progress. This is a timer function.
+
+    Returns:
+        float: Seconds to wait until the next call, or `None` if counting is complete.
+    """
+    isComplete = _propertyStatistics.step(_countingBudget)
+
+    requestRedraw()
+
+    return None if isComplete else 0.0
+
+# Redraw the sidebar of 3D views --------------------------------------------------------------------------------------------------
+def _redrawSidebars() -> None:
+    """
+    Redraw the sidebar of 3D views, where the panel is. This is a timer function.
+
+    Returns:
+        None: Not to be called again.
+    """
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                for region in area.regions:
+                    if region.type == "UI":
+                        region.tag_redraw()
+
+    return None
+
+# Private functions ###############################################################################################################
+
+# Get the auto-extend rules of a scene --------------------------------------------------------------------------------------------
+def _autoExtendRules(scene: bpy.types.Scene) -> list[AutoExtendRule]:
+    """
+    Get the auto-extend rules of a scene as specified on the panel.
+
+    Args:
+        scene (bpy.types.Scene): The scene.
+
+    Returns:
+        list[AutoExtendRule]: The rules.
+    """
+    return [
+        AutoExtendRule(rule.propertyName, rule.propertyValue, rule.propertyType, rule.isValueTemplate) 
+        for rule in scene.decoratorSettings.autoExtendRules
+    ]
+
+# Tell if the hierarchy of collections of a scene changed -------------------------------------------------------------------------
+def _isHierarchyChanged(scene: bpy.types.Scene) -> bool:
+    """
+    Tell if child collections or objects of the master collection of a scene may have changed since the last call, by comparing
+    their numbers, which is cheap enough to do on each update of the scene. Changes of other collections are reported for the 
+    collections themselves.
+
+    Args:
+        scene (bpy.types.Scene): The scene updated.
+
+    Returns:
+        bool: `True` if the numbers changed, or the scene is checked for the first time.
+    """
+    shape = (len(scene.collection.children), len(scene.collection.objects))
+
+    if _masterCollectionShapes.get(scene.session_uid) == shape:
+        return False
+
+    _masterCollectionShapes[scene.session_uid] = shape
+
+    return True
+
+# Apply the auto-extend rules from a handler --------------------------------------------------------------------------------------
+def _autoExtendNew(scene: bpy.types.Scene, objects: list):
+    """
+    Apply the auto-extend rules of a scene to objects not seen before, logging invalid rules instead of raising an error, 
+    as there is nobody to report it to in a handler.
+
+    Args:
+        scene (bpy.types.Scene): The scene with the rules.
+        objects (list[bpy.types.Object]): The objects reported.
+    """
+    try:
+        _autoExtender.setRules(_autoExtendRules(scene))
+    except ValueError as error:
+        logger.warning("Auto-extend rules of scene '%s' are not applied: %s", scene.name, error)
+        return
+
+    plan = _autoExtender.extendNew(objects)
+
+    if len(plan) > 0:
+        propertiesChanged(plan.changes)
+
+# Lifecycle management ############################################################################################################
+
+_handlers = [
+    (bpy.app.handlers.depsgraph_update_post, onDepsgraphUpdatePost),
+    (bpy.app.handlers.load_post, onObjectsReplaced),
+    (bpy.app.handlers.load_post, onFileLoaded),
+    (bpy.app.handlers.undo_post, onObjectsReplaced),
+    (bpy.app.handlers.redo_post, onObjectsReplaced),
+]
+"""
+Handler lists and the handlers to add to them.
+"""
+
+# Register handlers ---------------------------------------------------------------------------------------------------------------
+def register():
+    """
+    Add handlers to Blender's handler lists.
+    """
+    for handlerList, handler in _handlers:
+        if handler not in handlerList:
+            handlerList.append(handler)
+
+# Unregister handlers -------------------------------------------------------------------------------------------------------------
+def unregister():
+    """
+    Remove handlers from Blender's handler lists, and drop cached information.
+    """
+    for handlerList, handler in _handlers:
+        # Match by name to also remove handlers of earlier versions of this module if it has been reloaded
+        for existing in list(handlerList):
+            if getattr(existing, "__module__", None) == handler.__module__ and getattr(existing, "__name__", None) == handler.__name__:
+                handlerList.remove(existing)
+
+    _propertyIndex.invalidate()
+    _changeJournal.clear()
+    _propertyResolver.invalidate()
+    _propertyStatistics.invalidate()
+    _masterCollectionShapes.clear()
+    _autoExtender.seen.clear()
+
+    for timer in (_countStatistics, _redrawSidebars):
+        if bpy.app.timers.is_registered(timer):
+            bpy.app.timers.unregister(timer)
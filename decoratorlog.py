@@ -0,0 +1,155 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains logging facilities for the add-on.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import logging
+import sys
+from contextlib import contextmanager
+from typing import Iterator, TextIO
+
+# The logger of the add-on ########################################################################################################
+
+logger = logging.getLogger("t1nker.objectpropertymanager")
+"""
+Logger of the add-on. Operation headers and summaries are logged on INFO level, per-object details on DEBUG level, so that
+they are not even formatted unless verbose mode is on.
+"""
+
+logger.propagate = False
+logger.setLevel(logging.INFO)
+
+
+# Buffered console output #########################################################################################################
+class BufferedConsoleHandler(logging.Handler):
+    """
+    Log handler collecting log lines in memory and writing them to the console at once when flushed, instead of one console
+    write per line, which is very slow on Windows and Linux consoles alike.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, stream: TextIO = None):
+        """
+        Make an instance.
+
+        Args:
+            stream (TextIO, optional): Stream to write to when flushed. Defaults to `sys.stdout` at the time of flushing.
+        """
+        super().__init__()
+
+        self.stream = stream
+        """
+        Stream to write to, or `None` to use `sys.stdout`.
+        """
+
+        self.buffer: list[str] = []
+        """
+        Log lines not yet written.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Collect a line --------------------------------------------------------------------------------------------------------------
+    def emit(self, record: logging.LogRecord):
+        """
+        Format a log record and add it to the buffer.
+
+        Args:
+            record (logging.LogRecord): The record to log.
+        """
+        try:
+            self.buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+    # Write collected lines -------------------------------------------------------------------------------------------------------
+    def flush(self):
+        """
+        Write all collected lines to the console in a single write.
+        """
+        self.acquire()
+        try:
+            if self.buffer:
+                stream = self.stream or sys.stdout
+                stream.write("\n".join(self.buffer) + "\n")
+                stream.flush()
+                self.buffer = []
+        finally:
+            self.release()
+
+
+# Functions #######################################################################################################################
+
+# Log an operation ----------------------------------------------------------------------------------------------------------------
+@contextmanager
+def operationLog(isVerbose: bool = False, stream: TextIO = None) -> Iterator[logging.Logger]:
+    """
+    Collect log lines of an operation in a buffer and write them to the console once when the operation finishes. Each operation
+    gets a logger of its own, so that the logger of the add-on is not reconfigured, and neither messages logged meanwhile by 
+    others, such as handlers, nor overlapping operations mix into the log of the operation.
+
+    Args:
+        isVerbose (bool, optional): Whether to log per-object details (DEBUG level). Defaults to False.
+        stream (TextIO, optional): Stream to write to. Defaults to `sys.stdout`.
+
+    Yields:
+        logging.Logger: The logger of the operation.
+    """
+    handler = BufferedConsoleHandler(stream)
+
+    # Made directly instead of by `logging.getLogger`, which would keep each one forever
+    operationLogger = logging.Logger(f"{logger.name}.operation", logging.DEBUG if isVerbose else logging.INFO)
+    operationLogger.propagate = False
+    operationLogger.addHandler(handler)
+
+    try:
+        yield operationLogger
+    finally:
+        operationLogger.removeHandler(handler)
+        handler.flush()
@@ -47,27 +47,46 @@
 #
 # *********************************************************************************************************************************
 
-from datetime import datetime
-from enum import Enum
+import logging
+import os
 import bpy
+from typing import Any, Callable
+from datetime import datetime
+from itertools import islice
+from time import perf_counter
+from . import decoratorlog
+from . import decoratorhandlers
+from . import scopefilter
+from . import propertyvalue
+from . import propertysnapshot
+from . import valuetemplate
+from .profiling import Profiler
+from .propertysnapshot import SnapshotFormats
+from .propertyvalue import ValueTypes
+from .decoratorengine import DecoratorEngine, DecoratorWorkerModes, PropertySpec, ChangePlan, ChangeKinds, RenameConflicts
 
-# Enum for operating modes ########################################################################################################
-class DecoratorWorkerModes(Enum):
-    """
-    An enum for operating modes.
-    """
-    Add = 1,
-    Remove = 2,
-    Reset = 3,
-    Extend = 4
+# State ###########################################################################################################################
+
+lastTestPlan: ChangePlan = None
+"""
+Plan made by the last operation run in test mode, so that it can be applied without processing objects again. Reset to `None`
+once applied or when an operation actually changes objects.
+"""
+
+lastProfile: Profiler = None
+"""
+Profile of the last operation run with profiling on, to show on the panel and save to a file.
+"""
 
-    
 # Container for the algorithm of supported operations #############################################################################
 class DecoratorWorker:
     """
-    Container for the algorithm of supported operations.
+    Adapter to run the algorithm of supported operations (see `decoratorengine.DecoratorEngine`) in a Blender context.
     """
     
+    # Public functions ============================================================================================================
+    
+    # Process objects with a single property operation ----------------------------------------------------------------------------
     def processObjects(self, context, action: DecoratorWorkerModes): 
         """
         Process objects scoped by the decoratorSettings properties of context.scene, and add or delete a custom property,
@@ -81,176 +100,892 @@ class DecoratorWorker:
         Returns:
             Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
         """
-        operationStarted = f"{datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S')}"
+        try:
+            specs = self._makeSpecs(context, action)
+        except ValueError as ex:
+            return ({'CANCELLED'}, f"Invalid property value: {ex}")
+        
+        return DecoratorJob(context, specs, self._title(action, specs)).run()
+    
+    # Process objects with the batch of property operations -----------------------------------------------------------------------
+    def processBatch(self, context): 
+        """
+        Process objects scoped by the decoratorSettings properties of context.scene, and apply all property operations listed in
+        decoratorSettings.batchSpecs in a single pass over the objects.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        try:
+            specs = self._makeSpecs(context, None)
+        except ValueError as ex:
+            return ({'CANCELLED'}, f"Invalid property value: {ex}")
+        
+        return DecoratorJob(context, specs, self._title(None, specs)).run()
+    
+    # Start processing objects step by step ---------------------------------------------------------------------------------------
+    def startJob(self, context, action: DecoratorWorkerModes = None) -> "DecoratorJob":
+        """
+        Prepare processing objects step by step, to run an operation without blocking Blender for its whole duration. Call 
+        `start` of the job returned, then `step` repeatedly until it returns `True`, and finally `finish`.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+            action (DecoratorWorkerModes, optional): The operation to perform on the property specified in the settings, or 
+            `None` to apply the batch of property operations. Defaults to None.
+
+        Raises:
+            ValueError: If a property value cannot be converted to its type.
+
+        Returns:
+            DecoratorJob: The job.
+        """
+        specs = self._makeSpecs(context, action)
         
-        status = None
-        summary = ""
+        return DecoratorJob(context, specs, self._title(action, specs))
+    
+    # Apply the plan of the last test ---------------------------------------------------------------------------------------------
+    def applyLastTestPlan(self): 
+        """
+        Apply the plan made by the last operation run in test mode, without processing objects again. Changes are skipped for
+        properties changed since the test was made.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        global lastTestPlan
         
-        print("")
-        print("")
-        print(f"=" * 80)
-        print(f"T1nk-R Custom Object Property Manager started ({operationStarted})")
-        print(f"-" * 80)
+        if lastTestPlan is None:
+            return ({'CANCELLED'}, "There is no tested operation to apply")
         
-        # Big try block to make sure we terminate gracefully
+        plan = lastTestPlan
+        lastTestPlan = None
         
         try:
-            print(f"Decorator {'addition' if action == DecoratorWorkerModes.Add else 'removal'} process started")
+            applied = DecoratorEngine(index=decoratorhandlers.getPropertyIndex()).apply(
+                plan, verify=True, journal=decoratorhandlers.getChangeJournal(), title="Apply tested changes")
+        except Exception as ex:
+            return ({'CANCELLED'}, f"An error occurred: {ex}")
+        finally:
+            decoratorhandlers.propertiesChanged(plan.changes)
+        
+        skipped = len(plan) - applied
+        
+        return ({'FINISHED'}, f"Tested operation applied, {applied} changes made" + (f", {skipped} skipped as changed since the test" if skipped > 0 else ""))
+    
+    # Revert the last operation ---------------------------------------------------------------------------------------------------
+    def revertLastOperation(self): 
+        """
+        Revert the last operation recorded in the change journal by restoring the old values of the properties it changed.
+        Properties changed since the operation are left alone.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        entry = decoratorhandlers.getChangeJournal().pop()
+        
+        if entry is None:
+            return ({'CANCELLED'}, "There is no operation to revert")
+        
+        try:
+            reverted = DecoratorEngine(index=decoratorhandlers.getPropertyIndex()).revert(entry.changes, verify=True)
+        except Exception as ex:
+            return ({'CANCELLED'}, f"An error occurred: {ex}")
+        finally:
+            decoratorhandlers.propertiesChanged(entry.changes)
+        
+        skipped = len(entry.changes) - reverted
+        
+        return ({'FINISHED'}, f"Reverted {entry.title}, {reverted} changes restored" + (f", {skipped} skipped as changed since" if skipped > 0 else ""))
+    
+    # Export a snapshot of properties ---------------------------------------------------------------------------------------------
+    def exportSnapshot(self, context, path: str, format: SnapshotFormats, propertyName: str = ""): 
+        """
+        Write custom properties of objects scoped by the decoratorSettings properties of context.scene to a file, one object at
+        a time.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+            path (str): The file to write.
+            format (SnapshotFormats): The format to write.
+            propertyName (str, optional): Name of the only property to export. Defaults to "", meaning all properties.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        with decoratorlog.operationLog(isVerbose=context.scene.decoratorSettings.isVerbose) as logger:
+            try:
+                (objects, _) = DecoratorWorker.collectScope(context, logger)
+                
+                with open(path, "w", encoding="utf-8", newline="") as stream:
+                    written = propertysnapshot.exportSnapshot(
+                        objects, stream, format, propertyNames=[propertyName] if propertyName else None, skipNames=self._addonPropertyNames())
+            except (OSError, ValueError) as ex:
+                return ({'CANCELLED'}, f"Cannot export properties: {ex}")
             
-            # Get relevant stuff to shortcut variables
-            settings = context.scene.decoratorSettings            
-            viewLayer = context.view_layer            
-            activeObject = viewLayer.objects.active
-                        
-            # Determine scope and collect objects
-            if settings.affectSelectedObjectsOnly:
-                if len(bpy.context.selected_objects) == 0:
-                    print(f"You chose to process selected objects only, but no object is selected")
-                    raise ValueError("You choose to process selected objects only, but no object is selected")
-                else:
-                    print(f"Will process only selected objects")
-                objects = bpy.context.selected_objects
-            else:
-                print(f"Will process all objects as follows")
-                objects = viewLayer.objects
-
-            if settings.isVerbose:
-                print("Objects to process" + ", ".join([o.name for o in objects]))
-
-            # Make a note of what is going to happen
-            match action:
-                case DecoratorWorkerModes.Add:
-                    print(f"Will add property {settings.propertyName} with a value of '{settings.propertyValue}'")         
-                case DecoratorWorkerModes.Extend:
-                    print(f"Will extend property {settings.propertyName} with the default value of '{settings.propertyValue}'")         
-                case DecoratorWorkerModes.Reset:
-                    print(f"Will reset property {settings.propertyName} to the default value of '{settings.propertyValue}'")         
-                case DecoratorWorkerModes.Remove:
-                    print(f"Will remove property {settings.propertyName}")
-                case _:
-                    raise ValueError("Invalid operation mode specified. This should not happen. Contact the developer and blame him.")
+            logger.info("Properties of %d objects exported to %s", written, path)
+        
+        return ({'FINISHED'}, f"Properties of {written} objects exported")
+    
+    # Import a snapshot of properties ---------------------------------------------------------------------------------------------
+    def importSnapshot(self, context, path: str, format: SnapshotFormats, isExact: bool = False): 
+        """
+        Give objects scoped by the decoratorSettings properties of context.scene the property values of a snapshot file. The file
+        is read one object at a time, and objects are matched by name.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+            path (str): The file to read.
+            format (SnapshotFormats): The format of the file.
+            isExact (bool, optional): Whether to also remove properties not in the snapshot. Defaults to False.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        return self._importRecords(
+            context, path, f"Import {os.path.basename(path)}", lambda stream: propertysnapshot.readSnapshot(stream, format), isExact=isExact)
+    
+    # Import a table of values ----------------------------------------------------------------------------------------------------
+    def importValueTable(self, context, path: str, format: SnapshotFormats, action: DecoratorWorkerModes): 
+        """
+        Give objects scoped by the decoratorSettings properties of context.scene the values of a table mapping object names to
+        property values, such as one maintained in a spreadsheet (see `propertysnapshot.readValueTable`). The file is read one 
+        row at a time. CSV cells are converted to the type set in decoratorSettings, and values in a column named value are 
+        set for the property named in decoratorSettings.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+            path (str): The file to read.
+            format (SnapshotFormats): The format of the file.
+            action (DecoratorWorkerModes): The operation to perform with each value.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        settings = context.scene.decoratorSettings
+        valueType = ValueTypes[settings.propertyType]
+        
+        return self._importRecords(
+            context, path, f"{action.name} values of {os.path.basename(path)}", 
+            lambda stream: propertysnapshot.readValueTable(stream, format, valueType, settings.propertyName), action=action)
+    
+    # Collect objects in scope ----------------------------------------------------------------------------------------------------
+    @staticmethod
+    def collectScope(context, logger: logging.Logger):
+        """
+        Determine the objects in scope as set by the decoratorSettings properties of context.scene. If filtering is on, objects
+        are filtered while being processed, without building a list of them.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            logger (logging.Logger): Logger to log with.
+
+        Raises:
+            ValueError: If only selected objects shall be processed but nothing is selected, or filter settings are invalid.
+
+        Returns:
+            tuple: The objects in scope as an iterable, and a predicate telling if an object is in scope, or `None` if the
+            property is set on a collection instead of objects.
+        """
+        settings = context.scene.decoratorSettings
+        viewLayer = context.view_layer
+        
+        if settings.isCollectionTarget:
+            if settings.targetCollection is None:
+                raise ValueError("You choose to set the property on a collection, but no collection is chosen")
             
-            print(f"Processing {len(objects)} objects...")
-            changed = 0
-                    
-            # Process all objects in scope
-            for object in objects:                
-                    
-                # Branch based on whether the current object has this property 
-                if settings.propertyName in object.keys(): # this object has this property
+            # Objects in the collection inherit its properties, the index of objects doesn't help
+            logger.info("Will process collection '%s'", settings.targetCollection.name)
+            return ([settings.targetCollection], None)
+        
+        if settings.affectSelectedObjectsOnly:
+            if len(context.selected_objects) == 0:
+                raise ValueError("You choose to process selected objects only, but no object is selected")
+            
+            logger.info("Will process only selected objects (%d)", len(context.selected_objects))
+            objects = context.selected_objects
+            inScope = lambda object: DecoratorWorker._isInViewLayer(object, viewLayer, selectedOnly=True)
+        else:
+            logger.info("Will process all objects (%d)", len(viewLayer.objects))
+            objects = viewLayer.objects
+            inScope = lambda object: DecoratorWorker._isInViewLayer(object, viewLayer)
+        
+        if not settings.isFilterEnabled:
+            return (objects, inScope)
+        
+        # Compile filter settings once into a single predicate
+        objectTypes = set(settings.filterObjectTypes)
+        
+        if "OTHER" in objectTypes:
+            # Replace Other with all types not listed in the settings
+            listed = {item.identifier for item in settings.bl_rna.properties["filterObjectTypes"].enum_items}
+            objectTypes |= {item.identifier for item in bpy.types.Object.bl_rna.properties["type"].enum_items} - listed
+        
+        collection = settings.filterCollection
+        
+        predicate = scopefilter.compileFilter(
+            objectTypes=objectTypes,
+            collectionObjects=set(collection.all_objects) if collection is not None else None,
+            namePattern=settings.filterNamePattern,
+            nameIsRegex=settings.filterNameIsRegex,
+            propertyName=settings.filterPropertyName,
+            propertyCondition=scopefilter.PropertyConditions[settings.filterPropertyCondition],
+            comparison=settings.filterComparison,
+            value=settings.filterValue)
+        
+        if predicate is None:
+            return (objects, inScope)
+        
+        logger.info("Will only process objects matching the filter")
+        
+        return ((object for object in objects if predicate(object)), scopefilter.combine(inScope, predicate))
+    
+    # List property names in use --------------------------------------------------------------------------------------------------
+    @staticmethod
+    def propertyNameCatalog(text: str = "") -> list[tuple[str, int]]:
+        """
+        Get the names of custom properties of objects in the current file with the number of objects having them, most used 
+        first. The index is built on first use, afterwards this doesn't go through the objects.
+
+        Args:
+            text (str, optional): Only list names containing this, ignoring case. Defaults to "".
+
+        Returns:
+            list[tuple[str, int]]: The names and numbers of objects.
+        """
+        return decoratorhandlers.getPropertyIndex().catalog(text, skipNames=DecoratorWorker._addonPropertyNames())
+    
+    # Identify the settings of statistics -----------------------------------------------------------------------------------------
+    @staticmethod
+    def statisticsKey(context) -> tuple:
+        """
+        Identify the settings the property statistics depend on, to tell if they shall be counted again. This is cheap, so that
+        it can be called whenever the panel is drawn.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing operation settings.
+
+        Returns:
+            tuple: The settings.
+        """
+        settings = context.scene.decoratorSettings
+        
+        return (
+            context.scene.name, context.view_layer.name,
+            settings.propertyName, settings.propertyType, settings.propertyValue, settings.isValueTemplate,
+            settings.isCollectionTarget, getattr(settings.targetCollection, "name", None), settings.affectSelectedObjectsOnly,
+            settings.isFilterEnabled, frozenset(settings.filterObjectTypes), getattr(settings.filterCollection, "name", None),
+            settings.filterNamePattern, settings.filterNameIsRegex, settings.filterPropertyName, settings.filterPropertyCondition,
+            settings.filterComparison, settings.filterValue,
+        )
+    
+    # Start counting statistics ---------------------------------------------------------------------------------------------------
+    @staticmethod
+    def startStatistics(context):
+        """
+        Start counting the property statistics of the panel for the current settings. Objects are counted in a timer, so this 
+        returns quickly even for huge scenes.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+        """
+        settings = context.scene.decoratorSettings
+        key = DecoratorWorker.statisticsKey(context)
+        
+        try:
+            objects, inScope = DecoratorWorker.collectScope(context, decoratorlog.logger)
+        except ValueError as ex:
+            decoratorhandlers.getPropertyStatistics().fail(key, str(ex))
+            return
+        
+        try:
+            value = propertyvalue.parseValue(settings.propertyValue, ValueTypes[settings.propertyType])
+        except ValueError:
+            # Still worth counting objects having the property, none matches an invalid value
+            value = None
+        
+        if settings.isValueTemplate and valuetemplate.isTemplate(settings.propertyValue):
+            # Values differ by object, only objects having the property are counted
+            value = None
+        
+        decoratorhandlers.startStatistics(key, objects, inScope, settings.propertyName, value)
+    
+    # Private functions ===========================================================================================================
+    
+    # Import records read from a file ---------------------------------------------------------------------------------------------
+    def _importRecords(self, context, path: str, title: str, read, isExact: bool = False, action: DecoratorWorkerModes = DecoratorWorkerModes.Add):
+        """
+        Give objects in scope property values read from a file, matching them by name.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            path (str): The file to read.
+            title (str): Description of the operation for the change journal.
+            read (Callable): Function taking the open file and yielding names of objects and their properties.
+            isExact (bool, optional): Whether to also remove properties not read. Defaults to False.
+            action (DecoratorWorkerModes, optional): The operation to perform with each value. Defaults to DecoratorWorkerModes.Add.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        settings = context.scene.decoratorSettings
+        
+        with decoratorlog.operationLog(isVerbose=settings.isVerbose) as logger:
+            try:
+                (objects, _) = DecoratorWorker.collectScope(context, logger)
+                
+                # Look up objects in a dictionary built once instead of searching Blender's collections for each record
+                objectsByName = {object.name: object for object in objects}
+                
+                engine = DecoratorEngine(isTestOnly=settings.isTestOnly, logger=logger, index=decoratorhandlers.getPropertyIndex())
+                unmatched = []
+                
+                logger.info("%s started", title)
+                
+                with open(path, encoding="utf-8", newline="") as stream:
+                    plan = propertysnapshot.planSnapshot(
+                        engine, read(stream), objectsByName, 
+                        isExact=isExact, unmatched=unmatched, skipNames=self._addonPropertyNames(), action=action)
+            except (OSError, ValueError) as ex:
+                return ({'CANCELLED'}, f"Cannot import properties: {ex}")
+            
+            return self._applyPlan(engine, plan, title, unmatched)
+    
+    # Apply a plan made at once ---------------------------------------------------------------------------------------------------
+    def _applyPlan(self, engine: DecoratorEngine, plan: ChangePlan, title: str, unmatched: list[str] = ()):
+        """
+        Apply a plan made without a `DecoratorJob`, or keep it to be applied later in test mode, and summarize what happened.
+
+        Args:
+            engine (DecoratorEngine): The engine the plan has been made with.
+            plan (ChangePlan): The plan.
+            title (str): Description of the operation for the change journal.
+            unmatched (list[str], optional): Names of objects in the input but not in scope. Defaults to none.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        global lastTestPlan
+        
+        notFound = ""
+        
+        if unmatched:
+            engine.logger.info("Objects not found in scope (%d): %s", len(unmatched), ", ".join(unmatched))
+            notFound = f", {len(unmatched)} objects not found (see System Console)"
+        
+        if engine.isTestOnly:
+            engine.logger.info("\t-- Relax, nothing is done as this is just a test")
+            lastTestPlan = plan
+            return ({'FINISHED'}, f"Processing finished, {DecoratorJob._describePlan(plan)} would have been made if this weren't a test{notFound}")
+        
+        lastTestPlan = None
+        
+        try:
+            engine.apply(plan, journal=decoratorhandlers.getChangeJournal(), title=title)
+        except Exception as ex:
+            return ({'CANCELLED'}, f"An error occurred: {ex}, nothing changed")
+        finally:
+            decoratorhandlers.propertiesChanged(plan.changes)
+        
+        return ({'FINISHED'}, f"Processing finished, {DecoratorJob._describePlan(plan)} made{notFound}")
+    
+    # Get names of properties defined by add-ons ----------------------------------------------------------------------------------
+    @staticmethod
+    def _addonPropertyNames() -> set[str]:
+        """
+        Get names of properties of objects defined by Blender and add-ons rather than by users, such as cycles. They are stored
+        the same way as custom properties once set, but shall not be exported or removed.
+
+        Returns:
+            set[str]: The names.
+        """
+        return {property.identifier for property in bpy.types.Object.bl_rna.properties} | {"_RNA_UI"}
+    
+    # Make property operations from settings --------------------------------------------------------------------------------------
+    def _makeSpecs(self, context, action: DecoratorWorkerModes) -> list[PropertySpec]:
+        """
+        Make the property operations to apply from the decoratorSettings properties of context.scene.
+
+        Args:
+            context (bpy.types.Context): A Blender context object. 
+            action (DecoratorWorkerModes): The operation to perform on the property specified in the settings, or `None` 
+            to apply the batch of property operations.
+
+        Raises:
+            ValueError: If a property value cannot be converted to its type, or the value condition is not valid.
+
+        Returns:
+            list[PropertySpec]: The property operations.
+        """
+        settings = context.scene.decoratorSettings
+        
+        if action == DecoratorWorkerModes.Rename:
+            return [self._makeSpec(
+                settings.propertyName, settings.newPropertyName, settings.propertyType, action, RenameConflicts[settings.renameConflicts])]
+        
+        if action is not None:
+            condition = scopefilter.compileValueCondition(
+                scopefilter.ValueConditions[settings.valueCondition], settings.conditionValue, 
+                settings.conditionMinimum, settings.conditionMaximum)
+            
+            return [self._makeSpec(
+                settings.propertyName, settings.propertyValue, settings.propertyType, action, isTemplate=settings.isValueTemplate,
+                condition=condition)]
+        
+        # The value of batch items is the new name when renaming
+        return [
+            self._makeSpec(
+                spec.propertyName, spec.propertyValue, spec.propertyType, DecoratorWorkerModes[spec.action], 
+                RenameConflicts[spec.renameConflicts], spec.isValueTemplate) 
+            for spec in settings.batchSpecs
+        ]
+    
+    # Tell what is going to happen ------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _title(action: DecoratorWorkerModes, specs: list[PropertySpec]) -> str:
+        """
+        Get the text to log when processing starts.
+
+        Args:
+            action (DecoratorWorkerModes): The operation to perform, or `None` for a batch.
+            specs (list[PropertySpec]): The property operations.
+
+        Returns:
+            str: The text.
+        """
+        if action is None:
+            return f"Batch process of {len(specs)} property operations started"
+        
+        if action == DecoratorWorkerModes.Rename:
+            return "Decorator rename process started"
+        
+        return f"Decorator {'addition' if action == DecoratorWorkerModes.Add else 'removal'} process started"
+    
+    # Make a property operation from settings -------------------------------------------------------------------------------------
+    @staticmethod
+    def _makeSpec(
+            propertyName: str, propertyValue: str, propertyType: str, action: DecoratorWorkerModes, 
+            conflictPolicy: RenameConflicts = RenameConflicts.Skip, isTemplate: bool = False, 
+            condition: Callable[[Any], bool] = None) -> PropertySpec:
+        """
+        Make a property operation from settings, converting the value to its type, or parsing it as a template, once for the 
+        whole operation.
+
+        Args:
+            propertyName (str): Name of the property.
+            propertyValue (str): Value of the property as text, or the new name of the property when renaming.
+            propertyType (str): Name of the type of the value, one of the names of `propertyvalue.ValueTypes`.
+            action (DecoratorWorkerModes): The operation to perform.
+            conflictPolicy (RenameConflicts, optional): What to do if an object already has a property of the new name when 
+            renaming. Defaults to RenameConflicts.Skip.
+            isTemplate (bool, optional): Whether the value is a template computed for each object, such as `{collection}_{name}`.
+            Values without fields are constants anyway. Defaults to False.
+            condition (Callable[[Any], bool], optional): Tells which current values to reset or remove, `None` for any. 
+            Defaults to None.
+
+        Raises:
+            ValueError: If the value cannot be converted to the type, or is not a valid template.
+
+        Returns:
+            PropertySpec: The property operation.
+        """
+        if action == DecoratorWorkerModes.Remove:
+            # The value is not used, don't complain about it
+            return PropertySpec(propertyName, None, action, condition=condition)
+        
+        if action == DecoratorWorkerModes.Rename:
+            return PropertySpec(propertyName, propertyValue.strip(), action, conflictPolicy)
+        
+        if isTemplate and valuetemplate.isTemplate(propertyValue):
+            return PropertySpec(propertyName, valuetemplate.ValueTemplate(propertyValue, ValueTypes[propertyType]), action, condition=condition)
+        
+        return PropertySpec(propertyName, propertyvalue.parseValue(propertyValue, ValueTypes[propertyType]), action, condition=condition)
+    
+    # Tell if an object is in scope -----------------------------------------------------------------------------------------------
+    @staticmethod
+    def _isInViewLayer(object, viewLayer, selectedOnly: bool = False) -> bool:
+        """
+        Tell if an object is in a view layer, and optionally if it's selected, without going through the objects of the view layer.
+
+        Args:
+            object (bpy.types.Object): The object to check.
+            viewLayer (bpy.types.ViewLayer): The view layer.
+            selectedOnly (bool, optional): Whether the object shall also be selected. Defaults to False.
+
+        Returns:
+            bool: `True` if the object is in the view layer (and selected if requested), `False` otherwise.
+        """
+        try:
+            selected = object.select_get(view_layer=viewLayer)
+        except RuntimeError:
+            # Blender reports an error if the object is not in the view layer
+            return False
+        except AttributeError:
+            # Not an object, such as a collection properties have been set on
+            return False
+        
+        return selected or not selectedOnly
+
+# An operation run step by step ###################################################################################################
+class DecoratorJob:
+    """
+    An operation on objects in scope, which can be run at once, or step by step with a time budget for each step so that 
+    Blender stays responsive. Changes are planned first, then applied. If the job is cancelled or fails while applying changes,
+    changes already made are rolled back.
+    """
+    
+    # Lifecycle management ========================================================================================================
+    
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, context, specs: list[PropertySpec], title: str):
+        """
+        Make a job.
+
+        Args:
+            context (bpy.types.Context): A Blender context object containing Blender objects, selection info and operation settings.
+            It is expected for context.scene to have a property decoratorSettings of the decorator.DecoratorSettings type.
+            specs (list[PropertySpec]): The property operations to apply.
+            title (str): Text to log when processing starts.
+        """
+        
+        self.context = context
+        """
+        The Blender context to take objects and settings from.
+        """
+        
+        self.specs = specs
+        """
+        The property operations to apply.
+        """
+        
+        self.title = title
+        """
+        Text to log when processing starts.
+        """
+        
+        self.chunkSize = 256
+        """
+        Number of objects or changes to process between checking the time. Tuned while running to match the time budget.
+        """
+        
+        self.isDone = False
+        """
+        Whether the job has finished, failed or has been cancelled.
+        """
+        
+        self.status = None
+        """
+        Operator return items (see `DecoratorWorker.processObjects`) of the job once done.
+        """
+        
+        self.summary = ""
+        """
+        Summary of what happened once done.
+        """
+        
+        self.plan: ChangePlan = None
+        """
+        The plan of changes.
+        """
+        
+        self.logger = decoratorlog.logger
+        """
+        Logger to log with.
+        """
+        
+        self.profiler = Profiler(isEnabled=context.scene.decoratorSettings.isProfiling, title=title)
+        """
+        Profiler recording timings of phases and counters, doing nothing unless profiling is on.
+        """
+        
+        self._settings = context.scene.decoratorSettings
+        self._viewLayer = context.view_layer
+        self._activeObject = None
+        self._log = None
+        self._engine: DecoratorEngine = None
+        self._planning = None
+        self._objectCount = 0
+        self._appliedCount = 0
+        self._writeCount = 0
+    
+    # Public functions ============================================================================================================
+    
+    # Run the whole job at once ---------------------------------------------------------------------------------------------------
+    def run(self):
+        """
+        Run the whole job at once.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        self.start()
+        
+        while not self.step():
+            pass
+        
+        return self.finish()
+    
+    # Start the job ---------------------------------------------------------------------------------------------------------------
+    def start(self):
+        """
+        Start the job by determining the scope and starting to plan changes. If something goes wrong, the job is done.
+        """
+        self._activeObject = self._viewLayer.objects.active
+        
+        # Collect log lines and write them to the console at once when finished
+        self._log = decoratorlog.operationLog(isVerbose=self._settings.isVerbose)
+        self.logger = self._log.__enter__()
+        
+        self.logger.info("")
+        self.logger.info("=" * 80)
+        self.logger.info("T1nk-R Custom Object Property Manager started (%s)", datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S'))
+        self.logger.info("-" * 80)
+        
+        try:
+            self.logger.info(self.title)
+            
+            # Determine scope
+            with self.profiler.phase("scope"):
+                (objects, inScope) = DecoratorWorker.collectScope(self.context, self.logger)
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                objects = list(objects)
+                self.logger.debug("Objects to process: %s", ", ".join([o.name for o in objects]))
+            
+            # Let the engine decide what to do
+            self._engine = DecoratorEngine(
+                isTestOnly=self._settings.isTestOnly, logger=self.logger, 
+                index=None if self._settings.isCollectionTarget else decoratorhandlers.getPropertyIndex())
+            
+            self.plan = self._engine.startPlan(self.specs)
+            self._planning = self._engine.planObjects(self.plan, objects, inScope=inScope)
+            
+            if self._settings.isCollectionTarget:
+                self._objectCount = 1
+            else:
+                self._objectCount = len(self.context.selected_objects if self._settings.affectSelectedObjectsOnly else self._viewLayer.objects)
+        except Exception as ex:
+            self._fail(ex)
+    
+    # Make a step -----------------------------------------------------------------------------------------------------------------
+    def step(self, budget: float = None) -> bool:
+        """
+        Plan or apply changes until the time budget is used up or the job is done.
+
+        Args:
+            budget (float, optional): Time to spend in seconds. Defaults to None, meaning to run until done.
+
+        Returns:
+            bool: `True` if the job is done, `False` if more steps are needed.
+        """
+        started = perf_counter()
+        
+        try:
+            while not self.isDone:
+                chunkStarted = perf_counter()
+                
+                if self._planning is not None:
+                    # Plan changes for the next chunk of objects
+                    with self.profiler.phase("plan"):
+                        isPlanned = sum(1 for _ in islice(self._planning, self.chunkSize)) < self.chunkSize
                     
-                    # Branch based on operation mode
-                    match action:
-                        
-                        case DecoratorWorkerModes.Add: # addition requested                           
-                            print(f"\tResetting property value for '{object.name}'")
-                            
-                            # The property already exists, don't need to re-add
-                            if settings.isVerbose:
-                                print(f"\tProperty already exists on '{object.name}' with a value of '{object[settings.propertyName]}', will be reset")
-                                
-                            if settings.isTestOnly:                                
-                                print(f"\t\t-- Relax, nothing is done as this is just a test")
-                            else:                                
-                                object[settings.propertyName] = settings.propertyValue
-                        
-                        case DecoratorWorkerModes.Extend: # extension requested
-                            # The property already exists, don't need to re-add
-                            if settings.isVerbose:
-                                print(f"\tProperty already exists on '{object.name}' with a value of '{object[settings.propertyName]}', and it won't be reset")
+                    if isPlanned:
+                        self._planning = None
                         
-                        case DecoratorWorkerModes.Reset: # reset value to default
-                            # The property already exists, revert its value to the default
-                            print(f"\tResetting property value for '{object.name}'")                            
-                            
-                            if settings.isVerbose:
-                                if object[settings.propertyName] == settings.propertyValue:
-                                    print(f"\tProperty already exists on '{object.name}' with a value of '{object[settings.propertyName]}', will be reset")
-                                else:
-                                    print(f"\tProperty already exists on '{object.name}', and is now reset")
-                            
-                            if settings.isTestOnly:                                
-                                print(f"\t\t-- Relax, nothing is done as this is just a test")
-                            else:
-                                object[settings.propertyName] = settings.propertyValue
-                                                    
-                        case DecoratorWorkerModes.Remove: # removal requested
-                            # The property exists, needs to be removed
-                            print(f"\tRemoving property from '{object.name}'")
-                            
-                            if settings.isTestOnly:                                
-                                print(f"\t\t-- Relax, nothing is done as this is just a test")    
-                            else:
-                                del object[settings.propertyName]
-                                
-                            changed = changed + 1
-                                
-                        case _:
-                            # Do nothing, it may happen that nothing has to be made on this code branch with a specific operation mode
-                            pass
+                        if self._settings.isTestOnly:
+                            self._succeed()
+                else:
+                    # Apply the next chunk of changes
+                    chunk = self.plan.changes[self._appliedCount:self._appliedCount + self.chunkSize]
                     
-                else: # this object doesn't have this property
+                    with self.profiler.phase("apply"):
+                        for change in chunk:
+                            if self._engine.applyChange(change):
+                                self._writeCount += 1
+                            self._appliedCount += 1
                     
-                    # Branch based on operation mode
-                    match action:
-                        
-                        case DecoratorWorkerModes.Add: # addition requested
-                            # This object doesn't have this property, let's add it
-                            print(f"\tAdding property to '{object.name}'")
-                            
-                            if settings.isTestOnly:                                
-                                print(f"\t\t-- Relax, nothing is done as this is just a test")    
-                            else:
-                                object[settings.propertyName] = settings.propertyValue
-                                
-                            changed = changed + 1
-                            
-                        case DecoratorWorkerModes.Extend: # addition requested
-                            # This object doesn't have this property, let's add it
-                            print(f"\tAdding property to '{object.name}'")
-                            
-                            if settings.isTestOnly:                                
-                                print(f"\t\t-- Relax, nothing is done as this is just a test")    
-                            else:
-                                object[settings.propertyName] = settings.propertyValue
-                                
-                            changed = changed + 1
-                        
-                        case DecoratorWorkerModes.Remove: # removal requested
-                            # This object doesn't have this property, there's nothing to reset
-                            if settings.isVerbose:
-                                print(f"\tObject '{object.name}' doesn't have this property, therefore there's nothing to reset")
-                                    
-                        case DecoratorWorkerModes.Remove: # removal requested
-                            # This object doesn't have this property, there's nothing to remove
-                            if settings.isVerbose:
-                                print(f"\tObject '{object.name}' doesn't have this property, therefore there's nothing to remove")
-                        
-                        case _:
-                            # Do nothing, it may happen that nothing has to be made on this code branch with a specific operation mode
-                            pass
-            
-            # Make a note of peaceful completion
-            summary = \
-                f"Processing finished, {changed} items would have been affected if this weren't a test" \
-                if settings.isTestOnly else \
-                f"Processing finished, {changed} items affected"
+                    if self._appliedCount >= len(self.plan):
+                        self._succeed()
                 
-            status = {'FINISHED'}
-            
+                if budget is not None:
+                    now = perf_counter()
+                    
+                    # Tune chunk size so that a chunk takes about a quarter of the budget
+                    elapsed = now - chunkStarted
+                    if elapsed > 0:
+                        self.chunkSize = max(16, min(65536, int(self.chunkSize * (budget / 4) / elapsed)))
+                    
+                    if now - started >= budget:
+                        break
         except Exception as ex:
-            summary = f"An error occurred: {ex}"
-            status = {'CANCELLED'}
-        finally:
-            # Restore active and selected flags
-            viewLayer.objects.active = activeObject
+            self._fail(ex)
+        
+        return self.isDone
+    
+    # Tell progress ---------------------------------------------------------------------------------------------------------------
+    @property
+    def progress(self) -> float:
+        """
+        Estimated progress of the job between 0 and 1. Planning and applying changes are counted as equal halves, unless in 
+        test mode, where only planning happens.
+        """
+        if self.isDone:
+            return 1.0
+        
+        planShare = 1.0 if self._settings.isTestOnly else 0.5
+        
+        if self._planning is not None:
+            return planShare * min(1.0, self.plan.objectsScanned / max(1, self._objectCount))
+        
+        return planShare + (1 - planShare) * self._appliedCount / max(1, len(self.plan))
+    
+    # Cancel the job --------------------------------------------------------------------------------------------------------------
+    def cancel(self):
+        """
+        Cancel the job and roll back changes already made.
+        """
+        if self.isDone:
+            return
+        
+        reverted = self._rollBack()
+        
+        self.isDone = True
+        self.status = {'CANCELLED'}
+        self.summary = f"Processing cancelled, {reverted} changes rolled back"
+    
+    # Finish the job --------------------------------------------------------------------------------------------------------------
+    def finish(self):
+        """
+        Finish the job by restoring the active object and writing the log.
+
+        Returns:
+            Operator Return Items: One of the values specified at https://docs.blender.org/api/current/bpy_types_enum_items/operator_return_items.html#rna-enum-operator-return-items
+        """
+        if not self.isDone:
+            self.cancel()
+        
+        # Keep cached information current, objects of changes not made or rolled back are just counted again
+        decoratorhandlers.propertiesChanged(self.plan.changes if self.plan is not None else [])
+        
+        # Restore active and selected flags
+        try:
+            self._viewLayer.objects.active = self._activeObject
+        except Exception:
+            # The object may have been deleted meanwhile
+            pass
+        
+        if self._log is not None:
+            self.logger.info("-" * 80)        
+            self.logger.info(self.summary)
+            self.logger.info("-" * 80)
+            self.logger.info("T1nk-R Custom Object Property Manager finished")                                            
+            self.logger.info("=" * 80)
+            
+            # Writing the log is timed, but can only be reported in the profile, as the log is already written
+            with self.profiler.phase("log"):
+                self._log.__exit__(None, None, None)
             
-            print("")
-            print(f"-" * 80)        
-            print(summary)
-            print(f"-" * 80)
-            print(f"T1nk-R Custom Object Property Manager finished")                                            
-            print(f"=" * 80)
-            print("")
-        
-        return (status, summary)
+            self._log = None
+        
+        self._profile()
+        
+        return (self.status, self.summary)
+    
+    # Private functions ===========================================================================================================
+    
+    # Complete the job ------------------------------------------------------------------------------------------------------------
+    def _succeed(self):
+        """
+        Make a note of peaceful completion.
+        """
+        global lastTestPlan
+        
+        if self._settings.isTestOnly:
+            # Keep the plan so that it can be applied as is if the user likes it
+            self.logger.info("\t-- Relax, nothing is done as this is just a test")
+            lastTestPlan = self.plan
+            self.summary = f"Processing finished, {self._describePlan(self.plan)} would have been made if this weren't a test"
+        else:
+            lastTestPlan = None
+            decoratorhandlers.getChangeJournal().record(
+                ", ".join(f"{spec.action.name} {spec.propertyName}" for spec in self.specs), self.plan.changes[:self._appliedCount])
+            self.summary = f"Processing finished, {self._describePlan(self.plan)} made"
+        
+        self.isDone = True
+        self.status = {'FINISHED'}
+    
+    # Fail the job ----------------------------------------------------------------------------------------------------------------
+    def _fail(self, ex: Exception):
+        """
+        Roll back changes made and make a note of the error.
+
+        Args:
+            ex (Exception): The error.
+        """
+        reverted = self._rollBack()
+        
+        self.isDone = True
+        self.status = {'CANCELLED'}
+        self.summary = f"An error occurred: {ex}" + (f", {reverted} changes rolled back" if reverted > 0 else "")
+    
+    # Roll back changes -----------------------------------------------------------------------------------------------------------
+    def _rollBack(self) -> int:
+        """
+        Roll back changes already made.
+
+        Returns:
+            int: The number of changes reverted.
+        """
+        if self._engine is None or self.plan is None or self._appliedCount == 0:
+            return 0
+        
+        reverted = self._engine.revert(self.plan.changes[:self._appliedCount])
+        self._appliedCount = 0
+        
+        return reverted
+    
+    # Finish profiling ------------------------------------------------------------------------------------------------------------
+    def _profile(self):
+        """
+        Add counters to the profile, and add the profile to the summary.
+        """
+        global lastProfile
+        
+        if not self.profiler.isEnabled:
+            return
+        
+        if self.plan is not None:
+            self.profiler.count("objects scanned", self.plan.objectsScanned)
+            self.profiler.count("keys read", self.plan.keysRead)
+            self.profiler.count("writes", self._writeCount)
+            self.profiler.count("skipped", self.plan.operationsSkipped)
+        
+        lastProfile = self.profiler
+        
+        self.summary = f"{self.summary} ({self.profiler.summary()})"
+    
+    # Describe the plan -----------------------------------------------------------------------------------------------------------
+    @staticmethod
+    def _describePlan(plan: ChangePlan) -> str:
+        """
+        Summarize a plan in plain words.
+
+        Args:
+            plan (ChangePlan): The plan.
+
+        Returns:
+            str: The summary, such as "3 changes (1 added, 2 set, 0 removed) on 10 objects".
+        """
+        counts = plan.counts()
+        
+        return \
+            f"{len(plan)} changes ({counts[ChangeKinds.Add]} added, {counts[ChangeKinds.Set]} set, " \
+            f"{counts[ChangeKinds.Remove]} removed) on {plan.objectsScanned} objects"
@@ -0,0 +1,226 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains the per-phase profiler of operations, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import json
+import os
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Iterator
+
+# Timings and counters of an operation ############################################################################################
+class Profiler:
+    """
+    Records how much time an operation spends in each phase, such as collecting the scope, planning, applying changes and 
+    writing the log, and counters such as the number of objects scanned. Phases can be entered many times, such as once per 
+    step of a modal operation, and their times add up.
+    
+    A disabled profiler records nothing and costs next to nothing, so it can be passed around unconditionally.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, isEnabled: bool = True, title: str = ""):
+        """
+        Make an empty profiler.
+
+        Args:
+            isEnabled (bool, optional): Whether to record anything. Defaults to True.
+            title (str, optional): Description of the operation profiled. Defaults to "".
+        """
+
+        self.isEnabled = isEnabled
+        """
+        Whether to record anything.
+        """
+
+        self.title = title
+        """
+        Description of the operation profiled.
+        """
+
+        self.phaseSeconds: dict[str, float] = {}
+        """
+        Total time spent in each phase, in the order phases were first entered.
+        """
+
+        self.phaseCalls: dict[str, int] = {}
+        """
+        Number of times each phase has been entered.
+        """
+
+        self.counters: dict[str, int] = {}
+        """
+        Counters, such as objects scanned or properties written.
+        """
+
+        self.events: list[tuple[str, float, float]] = []
+        """
+        Name, start and duration of each time a phase has been entered, in seconds from starting the profiler.
+        """
+
+        self._started = perf_counter()
+
+    # Public functions ============================================================================================================
+
+    # Time a phase ----------------------------------------------------------------------------------------------------------------
+    def phase(self, name: str):
+        """
+        Get a context manager timing a phase, to be used in a `with` statement.
+
+        Args:
+            name (str): Name of the phase.
+
+        Returns:
+            A context manager.
+        """
+        return self._timePhase(name) if self.isEnabled else nullcontext()
+
+    # Count something -------------------------------------------------------------------------------------------------------------
+    def count(self, name: str, amount: int = 1):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): Name of the counter.
+            amount (int, optional): The amount to add. Defaults to 1.
+        """
+        if self.isEnabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # Summarize -------------------------------------------------------------------------------------------------------------------
+    def summary(self) -> str:
+        """
+        Summarize timings and counters in a single line, such as "scope 1.2 ms, plan 35.0 ms; 4000 objects scanned".
+
+        Returns:
+            str: The summary, or "" if disabled.
+        """
+        if not self.isEnabled:
+            return ""
+
+        phases = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.phaseSeconds.items())
+        counters = ", ".join(f"{amount} {name}" for name, amount in self.counters.items())
+
+        return "; ".join(part for part in (phases, counters) if part)
+
+    # Get the results as a dictionary ---------------------------------------------------------------------------------------------
+    def toDict(self) -> dict:
+        """
+        Get the results in a machine-readable form.
+
+        Returns:
+            dict: Title, total time, and time, calls of each phase and counters.
+        """
+        return {
+            "title": self.title,
+            "totalMs": round((perf_counter() - self._started) * 1000, 3),
+            "phases": {
+                name: {"ms": round(seconds * 1000, 3), "calls": self.phaseCalls[name]} for name, seconds in self.phaseSeconds.items()
+            },
+            "counters": dict(self.counters),
+        }
+
+    # Get the results as a Chrome trace -------------------------------------------------------------------------------------------
+    def toChromeTrace(self) -> dict:
+        """
+        Get the results in the Trace Event Format, which can be opened in chrome://tracing or https://ui.perfetto.dev. The 
+        results of `toDict` are included as metadata, so that the file is machine-readable as well.
+
+        Returns:
+            dict: The trace.
+        """
+        pid = os.getpid()
+
+        events = [
+            {"name": name, "cat": "phase", "ph": "X", "ts": round(start * 1e6, 3), "dur": round(duration * 1e6, 3), "pid": pid, "tid": 1}
+            for name, start, duration in self.events
+        ]
+
+        if self.counters:
+            end = max((start + duration for _, start, duration in self.events), default=0.0)
+            events.append({"name": "counters", "ph": "C", "ts": round(end * 1e6, 3), "pid": pid, "args": dict(self.counters)})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.toDict()}
+
+    # Save the results ------------------------------------------------------------------------------------------------------------
+    def save(self, path: str):
+        """
+        Save the results as a Chrome trace (see `toChromeTrace`).
+
+        Args:
+            path (str): The file to write.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        with open(path, "w", encoding="utf-8") as traceFile:
+            json.dump(self.toChromeTrace(), traceFile, indent=1)
+
+    # Private functions ===========================================================================================================
+
+    # Time a phase ----------------------------------------------------------------------------------------------------------------
+    @contextmanager
+    def _timePhase(self, name: str) -> Iterator[None]:
+        """
+        Time a phase.
+
+        Args:
+            name (str): Name of the phase.
+        """
+        started = perf_counter()
+
+        try:
+            yield
+        finally:
+            duration = perf_counter() - started
+
+            self.phaseSeconds[name] = self.phaseSeconds.get(name, 0.0) + duration
+            self.phaseCalls[name] = self.phaseCalls.get(name, 0) + 1
+            self.events.append((name, started - self._started, duration))
@@ -0,0 +1,378 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains an inverted index of custom property names, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from typing import Any, Callable, Container, Iterable
+from .propertyvalue import plainValue
+
+# Inverted index of custom property names #########################################################################################
+class PropertyIndex:
+    """
+    Inverted index mapping custom property names to the set of objects having them, so that questions like "which objects
+    have property X" can be answered without reading the keys of every object. The index is built lazily on first use, and
+    shall be kept current by calling `refresh` for changed objects, or `invalidate` when this is not possible.
+    
+    Values of a property can also be indexed, on first use for the property, so that conditions on values can be checked 
+    once for each distinct value instead of once for each object. Values are kept current by `refresh` and `setValue`.
+
+    Objects can be any hashable mapping-like objects providing `keys()`, such as Blender objects or (wrappers of) dictionaries.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        """
+        Make an empty, invalid index.
+        """
+
+        self.objectsByName: dict[str, set] = {}
+        """
+        Objects having a property, by the name of the property.
+        """
+
+        self.namesByObject: dict[Any, frozenset[str]] = {}
+        """
+        Names of properties of an object, by object. This makes refreshing an object proportional to its number of properties.
+        """
+
+        self.isValid = False
+        """
+        Whether the index has been built and is considered current.
+        """
+
+        self.valuesByName: dict[str, dict[Any, tuple[Any, set]]] = {}
+        """
+        For properties whose values are indexed, the objects having each distinct value, along with the value, by a hashable 
+        key of the value, by the name of the property.
+        """
+
+        self.valueKeysByName: dict[str, dict[Any, Any]] = {}
+        """
+        For properties whose values are indexed, the key of the value of each object, by the name of the property.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Build the index -------------------------------------------------------------------------------------------------------------
+    def build(self, objects: Iterable):
+        """
+        Build the index from scratch.
+
+        Args:
+            objects (Iterable): All objects to index.
+        """
+        self.objectsByName = {}
+        self.namesByObject = {}
+        self.valuesByName = {}
+        self.valueKeysByName = {}
+
+        for object in objects:
+            names = frozenset(object.keys())
+            self.namesByObject[object] = names
+
+            for name in names:
+                self.objectsByName.setdefault(name, set()).add(object)
+
+        self.isValid = True
+
+    # Drop the index --------------------------------------------------------------------------------------------------------------
+    def invalidate(self):
+        """
+        Drop the index, so that it is rebuilt on next use. Call this when objects may have changed in ways not tracked.
+        """
+        self.objectsByName = {}
+        self.namesByObject = {}
+        self.valuesByName = {}
+        self.valueKeysByName = {}
+        self.isValid = False
+
+    # Re-index an object ----------------------------------------------------------------------------------------------------------
+    def refresh(self, object: Any):
+        """
+        Update the index for an object which may have been added or whose properties may have changed. This reads the keys of
+        the object and the values of properties whose values are indexed, so call it for objects reported as changed, not for
+        all objects.
+
+        Args:
+            object (Any): The object to re-index.
+        """
+        if not self.isValid:
+            return
+
+        names = frozenset(object.keys())
+        oldNames = self.namesByObject.get(object, frozenset())
+
+        # Values may have changed even if names didn't
+        for name in names & self.valuesByName.keys():
+            self._indexValue(object, name, object[name])
+
+        if names == oldNames:
+            return
+
+        for name in oldNames - names:
+            self._discardName(object, name)
+            self._discardValue(object, name)
+
+        for name in names - oldNames:
+            self.objectsByName.setdefault(name, set()).add(object)
+
+        self.namesByObject[object] = names
+
+    # Remove an object ------------------------------------------------------------------------------------------------------------
+    def discard(self, object: Any):
+        """
+        Remove an object from the index, for example because it has been deleted.
+
+        Args:
+            object (Any): The object to remove.
+        """
+        for name in self.namesByObject.pop(object, ()):
+            self._discardName(object, name)
+            self._discardValue(object, name)
+
+    # Record that a property has been added ---------------------------------------------------------------------------------------
+    def added(self, object: Any, name: str):
+        """
+        Record that a property has been added to an object, without reading the keys of the object.
+
+        Args:
+            object (Any): The object changed.
+            name (str): The name of the property added.
+        """
+        if not self.isValid:
+            return
+
+        self.objectsByName.setdefault(name, set()).add(object)
+        self.namesByObject[object] = self.namesByObject.get(object, frozenset()) | {name}
+
+    # Record that a property has been removed -------------------------------------------------------------------------------------
+    def removed(self, object: Any, name: str):
+        """
+        Record that a property has been removed from an object, without reading the keys of the object.
+
+        Args:
+            object (Any): The object changed.
+            name (str): The name of the property removed.
+        """
+        if not self.isValid:
+            return
+
+        self._discardName(object, name)
+        self._discardValue(object, name)
+
+        if object in self.namesByObject:
+            self.namesByObject[object] = self.namesByObject[object] - {name}
+
+    # Record that a value has been set --------------------------------------------------------------------------------------------
+    def setValue(self, object: Any, name: str, value: Any):
+        """
+        Record the value set for a property of an object, if values of the property are indexed.
+
+        Args:
+            object (Any): The object changed.
+            name (str): The name of the property.
+            value (Any): The value set.
+        """
+        if self.isValid and name in self.valuesByName:
+            self._indexValue(object, name, value)
+
+    # Get objects having a property with a value passing a condition --------------------------------------------------------------
+    def objectsWhere(self, name: str, condition: Callable[[Any], bool]) -> set:
+        """
+        Get the objects having a property with a value passing a condition. Values of the property are indexed on first use,
+        afterwards the condition is checked once for each distinct value.
+
+        Args:
+            name (str): The name of the property.
+            condition (Callable[[Any], bool]): Tells if a value passes.
+
+        Returns:
+            set: The objects.
+        """
+        if name not in self.valuesByName:
+            self.valuesByName[name] = {}
+            self.valueKeysByName[name] = {}
+
+            for object in list(self.objectsWith(name)):
+                try:
+                    self._indexValue(object, name, object[name])
+                except ReferenceError:
+                    # The object has been deleted since indexed
+                    self.discard(object)
+
+        result = set()
+
+        for value, objects in self.valuesByName[name].values():
+            if condition(value):
+                result |= objects
+
+        return result
+
+    # Get objects having a property -----------------------------------------------------------------------------------------------
+    def objectsWith(self, name: str) -> set:
+        """
+        Get the objects having a property. Don't modify the set returned.
+
+        Args:
+            name (str): The name of the property.
+
+        Returns:
+            set: The objects having the property.
+        """
+        return self.objectsByName.get(name, set())
+
+    # List property names by usage ------------------------------------------------------------------------------------------------
+    def catalog(self, text: str = "", skipNames: Container[str] = ()) -> list[tuple[str, int]]:
+        """
+        Get the names of properties with the number of objects having them, most used first, such as to offer names to choose
+        from. This only goes through the names, not the objects.
+
+        Args:
+            text (str, optional): Only list names containing this, ignoring case. Defaults to "".
+            skipNames (Container[str], optional): Names not to list, such as those of properties defined by add-ons. Defaults to ().
+
+        Returns:
+            list[tuple[str, int]]: The names and numbers of objects, by decreasing number of objects and then by name.
+        """
+        text = text.casefold()
+
+        names = [
+            (name, len(objects)) for name, objects in self.objectsByName.items()
+            if name not in skipNames and text in name.casefold()
+        ]
+
+        return sorted(names, key=lambda item: (-item[1], item[0]))
+
+    # Private functions ===========================================================================================================
+
+    # Index the value of an object ------------------------------------------------------------------------------------------------
+    def _indexValue(self, object: Any, name: str, value: Any):
+        """
+        Record the value of a property of an object in the index of values of the property, replacing the earlier value.
+
+        Args:
+            object (Any): The object.
+            name (str): The name of the property, whose values are indexed.
+            value (Any): The value, as read from the object.
+        """
+        value = plainValue(value)
+        key = _valueKey(value)
+
+        if self.valueKeysByName[name].get(object, _noValue) == key:
+            return
+
+        self._discardValue(object, name)
+
+        self.valuesByName[name].setdefault(key, (value, set()))[1].add(object)
+        self.valueKeysByName[name][object] = key
+
+    # Remove an object from the index of values -----------------------------------------------------------------------------------
+    def _discardValue(self, object: Any, name: str):
+        """
+        Remove the value of a property of an object from the index of values, if values of the property are indexed.
+
+        Args:
+            object (Any): The object.
+            name (str): The name of the property.
+        """
+        keys = self.valueKeysByName.get(name)
+
+        if keys is None or object not in keys:
+            return
+
+        key = keys.pop(object)
+        _, objects = self.valuesByName[name][key]
+        objects.discard(object)
+
+        if not objects:
+            del self.valuesByName[name][key]
+
+    # Remove an object from the set of a property name ----------------------------------------------------------------------------
+    def _discardName(self, object: Any, name: str):
+        """
+        Remove an object from the set of objects having a property, and drop the set if it gets empty.
+
+        Args:
+            object (Any): The object.
+            name (str): The name of the property.
+        """
+        objects = self.objectsByName.get(name)
+
+        if objects is not None:
+            objects.discard(object)
+
+            if not objects:
+                del self.objectsByName[name]
+
+
+# Private functions ###############################################################################################################
+
+_noValue = object()
+"""
+Marker of objects without a value indexed, different from any key.
+"""
+
+# Make a hashable key of a value --------------------------------------------------------------------------------------------------
+def _valueKey(value: Any) -> Any:
+    """
+    Make a key of a plain property value which can be used in dictionaries, equal for equal values.
+
+    Args:
+        value (Any): The value, such as a number, a string, a list or a dictionary.
+
+    Returns:
+        Any: The key.
+    """
+    if isinstance(value, list):
+        return (list, tuple(_valueKey(item) for item in value))
+
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((name, _valueKey(item)) for name, item in value.items())))
+
+    return (type(value), value)
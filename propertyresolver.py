@@ -0,0 +1,234 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module resolves effective property values inherited from parents and collections, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from typing import Any, Callable, Iterable
+from .propertyvalue import plainValue
+
+# Resolver of inherited property values ###########################################################################################
+class PropertyResolver:
+    """
+    Resolves the effective value of a custom property of an object, which is the first found of:
+    
+    1. the value set on the object itself,
+    2. the value set on its parent object, its grandparent and so on,
+    3. the value set on a collection the object is in, or a parent collection of it, nearest first. If the object is in 
+       several collections, they are checked in the order the object lists them.
+    
+    Setting a property on a collection instead of each object in it makes writes proportional to the number of collections. 
+    Effective properties of collections are merged with those of their parents once, and memoized until `invalidate` is 
+    called, so reads take constant time on average. Call `invalidate` when properties of collections or the hierarchy of 
+    collections change.
+    
+    Objects and collections can be any hashable mapping-like objects. By default, collections of an object are taken from
+    `users_collection` and its parent from `parent`, as named in Blender.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(
+            self,
+            allCollections: Callable[[], Iterable] = None,
+            collectionsOf: Callable[[Any], Iterable] = None,
+            parentOf: Callable[[Any], Any] = None):
+        """
+        Make a resolver.
+
+        Args:
+            allCollections (Callable[[], Iterable], optional): Gets all collections, including the root ones such as the master
+            collections of scenes, to learn the hierarchy of collections from their `children`. Called on first use after
+            making the resolver or invalidating it. Defaults to None, meaning collections have no parents.
+            collectionsOf (Callable[[Any], Iterable], optional): Gets the collections an object is in. Defaults to reading
+            `users_collection`.
+            parentOf (Callable[[Any], Any], optional): Gets the parent object of an object, or `None`. Defaults to reading
+            `parent`.
+        """
+
+        self.collectionsOf = collectionsOf or (lambda object: getattr(object, "users_collection", ()))
+        """
+        Gets the collections an object is in.
+        """
+
+        self.parentOf = parentOf or (lambda object: getattr(object, "parent", None))
+        """
+        Gets the parent object of an object, or `None`.
+        """
+
+        self.allCollections = allCollections or (lambda: ())
+        """
+        Gets all collections to learn the hierarchy of collections from.
+        """
+
+        self._parentsByCollection: dict[Any, list] = None
+        self._effectiveByCollection: dict[Any, dict[str, Any]] = {}
+
+    # Public functions ============================================================================================================
+
+    # Resolve a property value ----------------------------------------------------------------------------------------------------
+    def resolve(self, object: Any, propertyName: str, default: Any = None) -> Any:
+        """
+        Get the effective value of a property of an object.
+
+        Args:
+            object (Any): The object.
+            propertyName (str): Name of the property.
+            default (Any, optional): The value to return if neither the object nor its parents or collections have the 
+            property. Defaults to None.
+
+        Returns:
+            Any: The effective value, or `default`.
+        """
+        current = object
+
+        # Walk up the parent chain, objects usually have only a few ancestors
+        while current is not None:
+            if propertyName in current:
+                return plainValue(current[propertyName])
+
+            current = self.parentOf(current)
+
+        current = object
+
+        while current is not None:
+            for collection in self.collectionsOf(current):
+                effective = self.collectionProperties(collection)
+
+                if propertyName in effective:
+                    return effective[propertyName]
+
+            current = self.parentOf(current)
+
+        return default
+
+    # Get all effective properties ------------------------------------------------------------------------------------------------
+    def effectiveProperties(self, object: Any) -> dict[str, Any]:
+        """
+        Get the effective values of all properties of an object, including inherited ones.
+
+        Args:
+            object (Any): The object.
+
+        Returns:
+            dict[str, Any]: The effective values by property name.
+        """
+        chain = []
+        current = object
+
+        while current is not None:
+            chain.append(current)
+            current = self.parentOf(current)
+
+        result = {}
+
+        # Fill from the lowest priority up, so that values with higher priority overwrite them
+        for current in reversed(chain):
+            for collection in reversed(list(self.collectionsOf(current))):
+                result.update(self.collectionProperties(collection))
+
+        for current in reversed(chain):
+            result.update((name, plainValue(current[name])) for name in current.keys())
+
+        return result
+
+    # Get effective properties of a collection ------------------------------------------------------------------------------------
+    def collectionProperties(self, collection: Any) -> dict[str, Any]:
+        """
+        Get the effective values of properties of a collection, merged with those inherited from its parent collections. The 
+        result is memoized, don't change it.
+
+        Args:
+            collection (Any): The collection.
+
+        Returns:
+            dict[str, Any]: The effective values by property name.
+        """
+        effective = self._effectiveByCollection.get(collection)
+
+        if effective is not None:
+            return effective
+
+        if self._parentsByCollection is None:
+            self._buildHierarchy()
+
+        # Mark as being resolved to survive cycles, which Blender doesn't allow but other callers might make
+        self._effectiveByCollection[collection] = {}
+
+        effective = {}
+
+        # Parents first, nearest last, so that nearer values overwrite farther ones
+        for parent in reversed(self._parentsByCollection.get(collection, [])):
+            effective.update(self.collectionProperties(parent))
+
+        effective.update((name, plainValue(collection[name])) for name in collection.keys())
+
+        self._effectiveByCollection[collection] = effective
+
+        return effective
+
+    # Drop memoized values --------------------------------------------------------------------------------------------------------
+    def invalidate(self):
+        """
+        Forget memoized values, so that they are resolved again on next use. Call this when properties of collections or the
+        hierarchy of collections change.
+        """
+        self._parentsByCollection = None
+        self._effectiveByCollection = {}
+
+    # Private functions ===========================================================================================================
+
+    # Learn the hierarchy of collections ------------------------------------------------------------------------------------------
+    def _buildHierarchy(self):
+        """
+        Map collections to their parent collections.
+        """
+        self._parentsByCollection = {}
+
+        for collection in self.allCollections():
+            for child in getattr(collection, "children", ()):
+                self._parentsByCollection.setdefault(child, []).append(collection)
@@ -0,0 +1,471 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains streaming export and import of custom property snapshots, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import csv
+import json
+from enum import Enum
+from itertools import groupby
+from typing import Any, Collection, Iterable, Iterator, Mapping, TextIO
+from .decoratorengine import DecoratorEngine, DecoratorWorkerModes, PropertySpec, ChangePlan, objectName
+from .propertyvalue import ValueTypes, parseValue, plainValue
+
+# Enum for snapshot formats #######################################################################################################
+class SnapshotFormats(Enum):
+    """
+    An enum for the file formats of snapshots.
+    """
+    JsonLines = 1
+    """
+    One JSON document per line, one line per object, such as {"object": "Cube", "properties": {"LOD": 2}}.
+    """
+    Csv = 2
+    """
+    A table with object, property, type and value columns, one row per property. Rows of an object are adjacent.
+    """
+    Json = 3
+    """
+    A single JSON document mapping object names to values, such as {"Cube": {"LOD": 2}}. Only for value tables, see 
+    `readValueTable`. It is read at once, so prefer JSON Lines for huge tables.
+    """
+
+
+# Constants #######################################################################################################################
+
+csvColumns = ["object", "property", "type", "value"]
+"""
+Header of CSV snapshots.
+"""
+
+valueColumn = "value"
+"""
+Name of the column of value tables holding values of the property specified when reading, instead of a property of its own.
+"""
+
+_jsonType = "Json"
+"""
+Type written to CSV snapshots for values not covered by `propertyvalue.ValueTypes`, such as groups. Their value is JSON.
+"""
+
+# Functions #######################################################################################################################
+
+# Export a snapshot ---------------------------------------------------------------------------------------------------------------
+def exportSnapshot(
+        objects: Iterable,
+        stream: TextIO,
+        format: SnapshotFormats = SnapshotFormats.JsonLines,
+        propertyNames: Collection[str] = None,
+        skipNames: Collection[str] = ()) -> int:
+    """
+    Write custom properties of objects to a stream. Each object is written as soon as it is read, so memory use doesn't depend
+    on the number of objects. Objects without properties to write are left out.
+
+    Args:
+        objects (Iterable): The mapping-like objects to export, with a `name`.
+        stream (TextIO): The stream to write to. Open files for CSV with `newline=""`.
+        format (SnapshotFormats, optional): The format to write. Defaults to SnapshotFormats.JsonLines.
+        propertyNames (Collection[str], optional): Names of properties to export. Defaults to None, meaning all.
+        skipNames (Collection[str], optional): Names of properties not to export, such as ones defined by add-ons rather than
+        by users. Defaults to none.
+
+    Raises:
+        ValueError: If the format is not supported for snapshots.
+
+    Returns:
+        int: The number of objects written.
+    """
+    if format == SnapshotFormats.Json:
+        raise ValueError("Snapshots are written as JSON Lines or CSV, not as a single JSON document")
+
+    writer = None
+
+    if format == SnapshotFormats.Csv:
+        writer = csv.writer(stream)
+        writer.writerow(csvColumns)
+
+    written = 0
+
+    for object in objects:
+        names = object.keys() if propertyNames is None else [name for name in propertyNames if name in object]
+        properties = {name: plainValue(object[name]) for name in names if name not in skipNames}
+
+        if not properties:
+            continue
+
+        if writer is None:
+            stream.write(json.dumps({"object": objectName(object), "properties": properties}, ensure_ascii=False))
+            stream.write("\n")
+        else:
+            for name, value in properties.items():
+                writer.writerow([objectName(object), name, *_encodeValue(value)])
+
+        written = written + 1
+
+    return written
+
+# Read a snapshot -----------------------------------------------------------------------------------------------------------------
+def readSnapshot(stream: TextIO, format: SnapshotFormats = SnapshotFormats.JsonLines) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Read a snapshot written by `exportSnapshot` from a stream, one object at a time.
+
+    Args:
+        stream (TextIO): The stream to read. Open files for CSV with `newline=""`.
+        format (SnapshotFormats, optional): The format to read. Defaults to SnapshotFormats.JsonLines.
+
+    Raises:
+        ValueError: If the stream is not a valid snapshot or the format is not supported for snapshots. The line number is
+        included in the message if known.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The name of an object and its properties.
+    """
+    if format == SnapshotFormats.Json:
+        raise ValueError("Snapshots are read from JSON Lines or CSV, not from a single JSON document")
+
+    if format == SnapshotFormats.Csv:
+        reader = csv.DictReader(stream)
+
+        if reader.fieldnames is None:
+            return
+
+        if reader.fieldnames[:len(csvColumns)] != csvColumns:
+            raise ValueError(f"Invalid CSV snapshot, the header shall be {','.join(csvColumns)}")
+
+        # Rows of an object are adjacent, so an object is complete when the name changes
+        for name, rows in groupby(reader, key=lambda row: row["object"]):
+            properties = {}
+
+            for row in rows:
+                try:
+                    properties[row["property"]] = _decodeValue(row["type"], row["value"])
+                except ValueError as ex:
+                    raise ValueError(f"Line {reader.line_num}: {ex}") from None
+
+            yield (name, properties)
+
+        return
+
+    for lineNumber, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+            yield (record["object"], _checkValues(dict(record["properties"])))
+        except (ValueError, KeyError, TypeError) as ex:
+            raise ValueError(f"Line {lineNumber}: invalid snapshot record ({ex})") from None
+
+# Read a value table --------------------------------------------------------------------------------------------------------------
+def readValueTable(
+        stream: TextIO,
+        format: SnapshotFormats = SnapshotFormats.Csv,
+        valueType: ValueTypes = ValueTypes.String,
+        propertyName: str = "") -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Read a table mapping object names to property values, such as one maintained in a spreadsheet, one object at a time. 
+    
+    * CSV: the first column holds object names, other columns are named after properties, such as `name,LOD,Hide`. Cells are
+      converted to `valueType`, and empty cells are skipped.
+    * JSON Lines: a line per object, holding the object name in `name` and properties in other keys, such as 
+      `{"name": "Cube", "LOD": 2}`.
+    * JSON: a single document mapping object names to properties, such as `{"Cube": {"LOD": 2}}`, or to a single value.
+
+    Values in JSON are used as they are. Properties named `value`, and single values in JSON, are taken as values of
+    `propertyName`.
+
+    Args:
+        stream (TextIO): The stream to read. Open files for CSV with `newline=""`.
+        format (SnapshotFormats, optional): The format to read. Defaults to SnapshotFormats.Csv.
+        valueType (ValueTypes, optional): The type to convert CSV cells to. Defaults to ValueTypes.String.
+        propertyName (str, optional): Name of the property of values not named. Defaults to "".
+
+    Raises:
+        ValueError: If the stream is not a valid table, or a value is unnamed but `propertyName` is not specified. The line
+        number is included in the message if known.
+
+    Yields:
+        tuple[str, dict[str, Any]]: The name of an object and its properties.
+    """
+    def named(name: str) -> str:
+        if name != valueColumn:
+            return name
+        
+        if not propertyName:
+            raise ValueError(f"specify the property to set for the '{valueColumn}' column")
+        
+        return propertyName
+    
+    match format:
+        case SnapshotFormats.Csv:
+            reader = csv.reader(stream)
+            header = next(reader, None)
+
+            if header is None:
+                return
+
+            if len(header) < 2:
+                raise ValueError("Invalid table, the first column shall hold object names, the others values of properties")
+
+            names = [named(name.strip()) for name in header[1:]]
+
+            for row in reader:
+                if not row or not row[0]:
+                    continue
+
+                try:
+                    yield (row[0], {name: parseValue(cell, valueType) for name, cell in zip(names, row[1:]) if cell != ""})
+                except ValueError as ex:
+                    raise ValueError(f"Line {reader.line_num}: {ex}") from None
+
+        case SnapshotFormats.JsonLines:
+            for lineNumber, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    record = json.loads(line)
+                    name = record.pop("name")
+                    yield (name, _checkValues({named(key): value for key, value in record.items()}))
+                except (ValueError, KeyError, TypeError, AttributeError) as ex:
+                    raise ValueError(f"Line {lineNumber}: invalid record ({ex})") from None
+
+        case SnapshotFormats.Json:
+            table = json.load(stream)
+
+            if not isinstance(table, dict):
+                raise ValueError("Invalid table, the document shall map object names to values")
+
+            for name, values in table.items():
+                try:
+                    yield (name, _checkValues(
+                        {named(key): value for key, value in values.items()} if isinstance(values, dict) else {named(valueColumn): values}))
+                except ValueError as ex:
+                    raise ValueError(f"Object '{name}': {ex}") from None
+
+# Plan importing a snapshot -------------------------------------------------------------------------------------------------------
+def planSnapshot(
+        engine: DecoratorEngine,
+        records: Iterable[tuple[str, dict[str, Any]]],
+        objectsByName: Mapping[str, Any],
+        isExact: bool = False,
+        unmatched: list[str] = None,
+        skipNames: Collection[str] = (),
+        action: DecoratorWorkerModes = DecoratorWorkerModes.Add) -> ChangePlan:
+    """
+    Plan the changes to give objects the property values of a snapshot or a value table. Records are processed as they come, so
+    they can be read from a file with `readSnapshot` or `readValueTable` on the fly.
+
+    Args:
+        engine (DecoratorEngine): The engine to plan with.
+        records (Iterable[tuple[str, dict[str, Any]]]): Names of objects and their properties, as yielded by `readSnapshot`.
+        objectsByName (Mapping[str, Any]): The objects to match records with, by name. Build it once, don't look up objects
+        one by one in Blender's collections.
+        isExact (bool, optional): Whether to also remove properties of matched objects not in the snapshot, restoring the 
+        snapshot exactly. Defaults to False, meaning to only add and set properties.
+        unmatched (list[str], optional): List to append names of objects in the snapshot but not found to. Defaults to None.
+        skipNames (Collection[str], optional): Names of properties not to remove when `isExact`, as they are never exported.
+        Defaults to none.
+        action (DecoratorWorkerModes, optional): The operation to perform with each value, such as Extend to only add values
+        missing. Defaults to DecoratorWorkerModes.Add.
+
+    Returns:
+        ChangePlan: The changes to make.
+    """
+    return engine.planEach(engine.startPlan([]), _snapshotSpecs(records, objectsByName, isExact, unmatched, skipNames, action))
+
+# Private functions ###############################################################################################################
+
+# Make property operations from snapshot records ----------------------------------------------------------------------------------
+def _snapshotSpecs(
+        records: Iterable[tuple[str, dict[str, Any]]],
+        objectsByName: Mapping[str, Any],
+        isExact: bool,
+        unmatched: list[str],
+        skipNames: Collection[str],
+        action: DecoratorWorkerModes) -> Iterator[tuple[Any, list[PropertySpec]]]:
+    """
+    Match snapshot records with objects, and make the property operations to apply to each.
+
+    Args:
+        records (Iterable[tuple[str, dict[str, Any]]]): Names of objects and their properties.
+        objectsByName (Mapping[str, Any]): The objects by name.
+        isExact (bool): Whether to also remove properties not in the snapshot.
+        unmatched (list[str]): List to append names of objects not found to, or `None`.
+        skipNames (Collection[str]): Names of properties not to remove.
+        action (DecoratorWorkerModes): The operation to perform with each value.
+
+    Yields:
+        tuple[Any, list[PropertySpec]]: An object and the property operations to apply to it.
+    """
+    for name, properties in records:
+        object = objectsByName.get(name)
+
+        if object is None:
+            if unmatched is not None:
+                unmatched.append(name)
+            continue
+
+        specs = [PropertySpec(propertyName, value, action) for propertyName, value in properties.items()]
+
+        if isExact:
+            specs.extend(
+                PropertySpec(propertyName, None, DecoratorWorkerModes.Remove)
+                for propertyName in object.keys() if propertyName not in properties and propertyName not in skipNames)
+
+        yield (object, specs)
+
+# Check values of properties ------------------------------------------------------------------------------------------------------
+def _checkValues(properties: dict[str, Any]) -> dict[str, Any]:
+    """
+    Make sure no value of properties read from JSON is null, which cannot be stored in a property.
+
+    Args:
+        properties (dict[str, Any]): The properties.
+
+    Raises:
+        ValueError: If a value is or contains null.
+
+    Returns:
+        dict[str, Any]: `properties` itself.
+    """
+    for name, value in properties.items():
+        try:
+            _checkValue(value)
+        except ValueError as ex:
+            raise ValueError(f"property '{name}': {ex}") from None
+
+    return properties
+
+# Check a value -------------------------------------------------------------------------------------------------------------------
+def _checkValue(value: Any) -> Any:
+    """
+    Make sure a value read from JSON is not and doesn't contain null, which cannot be stored in a property. Removing properties
+    is not expressed by null values, but by importing exactly.
+
+    Args:
+        value (Any): The value.
+
+    Raises:
+        ValueError: If the value is or contains null.
+
+    Returns:
+        Any: `value` itself.
+    """
+    if value is None:
+        raise ValueError("null is not a property value")
+
+    if isinstance(value, list):
+        for item in value:
+            _checkValue(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _checkValue(item)
+
+    return value
+
+# Encode a value for CSV ----------------------------------------------------------------------------------------------------------
+def _encodeValue(value: Any) -> tuple[str, str]:
+    """
+    Get the type and the text of a value to write to a CSV snapshot. Strings are written as they are, other values as JSON.
+
+    Args:
+        value (Any): A plain property value.
+
+    Returns:
+        tuple[str, str]: The type and the text.
+    """
+    if isinstance(value, str):
+        return (ValueTypes.String.name, value)
+
+    # Check bool first, as it is an int as well
+    if isinstance(value, bool):
+        valueType = ValueTypes.Bool
+    elif isinstance(value, int):
+        valueType = ValueTypes.Int
+    elif isinstance(value, float):
+        valueType = ValueTypes.Float
+    elif isinstance(value, list) and all(isinstance(item, int) and not isinstance(item, bool) for item in value):
+        valueType = ValueTypes.IntArray
+    elif isinstance(value, list) and all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in value):
+        valueType = ValueTypes.FloatArray
+    else:
+        valueType = None
+
+    return (valueType.name if valueType is not None else _jsonType, json.dumps(value, ensure_ascii=False))
+
+# Decode a value from CSV ---------------------------------------------------------------------------------------------------------
+def _decodeValue(typeName: str, text: str) -> Any:
+    """
+    Get a value from its type and text read from a CSV snapshot.
+
+    Args:
+        typeName (str): The name of the type.
+        text (str): The text.
+
+    Raises:
+        ValueError: If the type is unknown, the text is not a value of the type, or it is null.
+
+    Returns:
+        Any: The value.
+    """
+    if typeName == ValueTypes.String.name:
+        return text
+
+    if typeName != _jsonType and typeName not in ValueTypes.__members__:
+        raise ValueError(f"unknown type '{typeName}'")
+
+    value = _checkValue(json.loads(text))
+
+    # JSON doesn't tell 1.0 from 1
+    match typeName:
+        case "Float":
+            return float(value)
+        case "FloatArray":
+            return [float(item) for item in value]
+        case _:
+            return value
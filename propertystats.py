@@ -0,0 +1,313 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains incrementally maintained statistics of a property over the objects in scope.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from time import perf_counter
+from typing import Any, Callable, Hashable, Iterable, Optional
+from .decoratorengine import DecoratorWorkerModes
+from .propertyvalue import isSameValue, plainValue
+
+# Statistics of a property ########################################################################################################
+class PropertyStatistics:
+    """
+    Counts of objects in scope, objects having a property, and objects where it already has a value, so that the panel can tell
+    what an operation would change without processing objects when drawn. Counting all objects is started when settings change,
+    and done in steps with a time budget. Afterwards, counts are kept current by calling `refresh` for changed objects, which
+    costs the same regardless of the number of objects.
+
+    Objects can be any hashable mapping-like objects, such as Blender objects or (wrappers of) dictionaries.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self):
+        """
+        Make empty, invalid statistics.
+        """
+
+        self.key: Optional[Hashable] = None
+        """
+        Identifies the settings the statistics have been counted for. Compare it with the current settings to tell if counting
+        shall be started again.
+        """
+
+        self.isValid = False
+        """
+        Whether counting has been started for `key` and counts are kept current.
+        """
+
+        self.problem = ""
+        """
+        Why the statistics cannot be counted for `key`, such as an invalid value, or empty if they can.
+        """
+
+        self.propertyName = ""
+        """
+        Name of the property counted.
+        """
+
+        self.propertyValue: Any = None
+        """
+        Value objects are compared with, `None` if not known, when no object matches.
+        """
+
+        self.inScope: Optional[Callable[[Any], bool]] = None
+        """
+        Tells if an object is in scope, or `None` if this is not known, when only objects already counted are refreshed.
+        """
+
+        self.objectsInScope: set = set()
+        """
+        Objects in scope counted so far.
+        """
+
+        self.objectsHaving: set = set()
+        """
+        Objects in scope having the property.
+        """
+
+        self.objectsMatching: set = set()
+        """
+        Objects in scope where the property has the value.
+        """
+
+        self._pending: Optional[Iterable] = None
+        """
+        Iterator of objects not yet counted, `None` when counting is complete.
+        """
+
+    # Public functions ============================================================================================================
+
+    # Start counting --------------------------------------------------------------------------------------------------------------
+    def start(self, key: Hashable, objects: Iterable, inScope: Optional[Callable[[Any], bool]], propertyName: str, propertyValue: Any):
+        """
+        Drop the counts and start counting objects for new settings. Objects are counted by `step`.
+
+        Args:
+            key (Hashable): Identifies the settings.
+            objects (Iterable): The objects in scope.
+            inScope (Callable[[Any], bool], optional): Tells if an object is in scope, or `None` if this is not known.
+            propertyName (str): Name of the property to count.
+            propertyValue (Any): Value to compare with, or `None` to count no object as matching.
+        """
+        self._reset(key)
+
+        self.isValid = True
+        self.propertyName = propertyName
+        self.propertyValue = propertyValue
+        self.inScope = inScope
+        self._pending = iter(objects)
+
+    # Record that counting is not possible ----------------------------------------------------------------------------------------
+    def fail(self, key: Hashable, problem: str):
+        """
+        Drop the counts and record why they cannot be counted for new settings.
+
+        Args:
+            key (Hashable): Identifies the settings.
+            problem (str): Why the statistics cannot be counted.
+        """
+        self._reset(key)
+        self.problem = problem
+
+    # Count some objects ----------------------------------------------------------------------------------------------------------
+    def step(self, budget: float = None) -> bool:
+        """
+        Count objects not yet counted, until all are counted or the time budget is used up.
+
+        Args:
+            budget (float, optional): Seconds to spend, or `None` to count all objects. Defaults to None.
+
+        Returns:
+            bool: `True` if counting is complete, `False` if more steps are needed.
+        """
+        if self._pending is None:
+            return True
+
+        deadline = None if budget is None else perf_counter() + budget
+        counted = 0
+
+        for object in self._pending:
+            self._count(object)
+            counted = counted + 1
+
+            # Reading the clock is not free, check it once in a while
+            if deadline is not None and counted % 256 == 0 and perf_counter() > deadline:
+                return False
+
+        self._pending = None
+
+        return True
+
+    # Re-count an object ----------------------------------------------------------------------------------------------------------
+    def refresh(self, object: Any):
+        """
+        Update the counts for an object which may have been added, changed, or moved in or out of scope.
+
+        Args:
+            object (Any): The object to re-count.
+        """
+        if not self.isValid:
+            return
+
+        if self.inScope is None and object not in self.objectsInScope:
+            # Only objects already counted can be told to be in scope
+            return
+
+        try:
+            isInScope = self.inScope is None or self.inScope(object)
+        except ReferenceError:
+            # The object has been deleted
+            isInScope = False
+
+        if isInScope:
+            self._count(object)
+        else:
+            self.discard(object)
+
+    # Remove an object ------------------------------------------------------------------------------------------------------------
+    def discard(self, object: Any):
+        """
+        Remove an object from the counts, for example because it has been deleted.
+
+        Args:
+            object (Any): The object to remove.
+        """
+        self.objectsInScope.discard(object)
+        self.objectsHaving.discard(object)
+        self.objectsMatching.discard(object)
+
+    # Drop the counts -------------------------------------------------------------------------------------------------------------
+    def invalidate(self):
+        """
+        Drop the counts, so that counting is started again when next needed. Call this when objects or the scope may have
+        changed in ways not tracked.
+        """
+        self._reset(None)
+
+    # Tell if counting is complete ------------------------------------------------------------------------------------------------
+    @property
+    def isComplete(self) -> bool:
+        """
+        Whether all objects have been counted. Until then, counts only include objects counted so far.
+
+        Returns:
+            bool: `True` if complete, `False` otherwise.
+        """
+        return self.isValid and self._pending is None
+
+    # Tell how many objects an operation would change -----------------------------------------------------------------------------
+    def wouldChange(self, action: DecoratorWorkerModes) -> int:
+        """
+        Get the number of objects an operation would change, the same way `DecoratorEngine` decides.
+
+        Args:
+            action (DecoratorWorkerModes): The operation.
+
+        Returns:
+            int: The number of objects.
+        """
+        match action:
+            case DecoratorWorkerModes.Add:
+                return len(self.objectsInScope) - len(self.objectsMatching)
+            case DecoratorWorkerModes.Extend:
+                return len(self.objectsInScope) - len(self.objectsHaving)
+            case DecoratorWorkerModes.Reset:
+                return len(self.objectsHaving) - len(self.objectsMatching)
+            case DecoratorWorkerModes.Remove:
+                return len(self.objectsHaving)
+            case _:
+                return 0
+
+    # Private functions ===========================================================================================================
+
+    # Count an object -------------------------------------------------------------------------------------------------------------
+    def _count(self, object: Any):
+        """
+        Add an object in scope to the counts, or update them if already counted.
+
+        Args:
+            object (Any): The object in scope.
+        """
+        try:
+            hasProperty = self.propertyName in object
+            isMatching = hasProperty and self.propertyValue is not None and isSameValue(plainValue(object[self.propertyName]), self.propertyValue)
+        except ReferenceError:
+            # The object has been deleted
+            self.discard(object)
+            return
+
+        self.objectsInScope.add(object)
+
+        if hasProperty:
+            self.objectsHaving.add(object)
+        else:
+            self.objectsHaving.discard(object)
+
+        if isMatching:
+            self.objectsMatching.add(object)
+        else:
+            self.objectsMatching.discard(object)
+
+    # Drop the counts -------------------------------------------------------------------------------------------------------------
+    def _reset(self, key: Optional[Hashable]):
+        """
+        Drop the counts and make the statistics invalid.
+
+        Args:
+            key (Hashable, optional): Identifies the settings the statistics are for.
+        """
+        self.key = key
+        self.isValid = False
+        self.problem = ""
+        self.inScope = None
+        self.objectsInScope = set()
+        self.objectsHaving = set()
+        self.objectsMatching = set()
+        self._pending = None
@@ -0,0 +1,210 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains parsing of typed property values, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from enum import Enum
+from typing import Any
+
+# Enum for value types ############################################################################################################
+class ValueTypes(Enum):
+    """
+    An enum for the types of property values supported.
+    """
+    String = 1
+    Int = 2
+    Float = 3
+    Bool = 4
+    IntArray = 5
+    FloatArray = 6
+
+
+# Functions #######################################################################################################################
+
+# Parse a value -------------------------------------------------------------------------------------------------------------------
+def parseValue(text: str, valueType: ValueTypes) -> Any:
+    """
+    Convert a value typed as text to the value to store as a custom property. Call this once per operation, not per object.
+    Arrays are returned as lists, which Blender stores as native ID property arrays.
+
+    Args:
+        text (str): The value as text. Array items are separated by commas, such as "1, 2, 3" (brackets are optional). 
+        Booleans can be specified as true/false, yes/no, on/off or 1/0.
+        valueType (ValueTypes): The type of the value.
+
+    Raises:
+        ValueError: If the text cannot be converted to the type.
+
+    Returns:
+        Any: The value converted to the type.
+    """
+    match valueType:
+        case ValueTypes.String:
+            return text
+        case ValueTypes.Int:
+            return _parseNumber(text, int)
+        case ValueTypes.Float:
+            return _parseNumber(text, float)
+        case ValueTypes.Bool:
+            return _parseBool(text)
+        case ValueTypes.IntArray:
+            return [_parseNumber(item, int) for item in _splitArray(text)]
+        case ValueTypes.FloatArray:
+            return [_parseNumber(item, float) for item in _splitArray(text)]
+        case _:
+            raise ValueError(f"Unsupported value type {valueType}")
+
+# Get a plain value ---------------------------------------------------------------------------------------------------------------
+def plainValue(value: Any) -> Any:
+    """
+    Get a plain Python copy of a property value read from an object. Blender returns ID property arrays and groups as views
+    into the object, which can neither be compared with plain values nor kept after the object changes.
+
+    Args:
+        value (Any): The value as read from an object.
+
+    Returns:
+        Any: A list for arrays, a dictionary for groups, the value itself otherwise.
+    """
+    if hasattr(value, "to_list"):
+        return value.to_list()
+
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+
+    return value
+
+# Tell if values are the same -----------------------------------------------------------------------------------------------------
+def isSameValue(value: Any, other: Any) -> bool:
+    """
+    Tell if two plain property values are the same, including their types, so that `1` and `1.0` are different values, as are
+    arrays of different item types. Booleans are the same as the integers they are stored as by Blender before 4.0, so that 
+    `1` and `True` are the same.
+
+    Args:
+        value (Any): A plain value, see `plainValue`.
+        other (Any): Another plain value.
+
+    Returns:
+        bool: `True` if the values and their types are equal.
+    """
+    if type(value) is not type(other):
+        # One of them is a boolean if both are integers
+        return isinstance(value, int) and isinstance(other, int) and int(value) == int(other)
+
+    if isinstance(value, list):
+        return len(value) == len(other) and all(isSameValue(item, otherItem) for item, otherItem in zip(value, other))
+
+    if isinstance(value, dict):
+        return value.keys() == other.keys() and all(isSameValue(item, other[name]) for name, item in value.items())
+
+    return value == other
+
+# Private functions ###############################################################################################################
+
+# Parse a number ------------------------------------------------------------------------------------------------------------------
+def _parseNumber(text: str, numberType: type) -> Any:
+    """
+    Convert text to a number, with an error message telling what's wrong.
+
+    Args:
+        text (str): The text to convert.
+        numberType (type): `int` or `float`.
+
+    Raises:
+        ValueError: If the text is not a number of the type.
+
+    Returns:
+        Any: The number.
+    """
+    try:
+        return numberType(text.strip())
+    except ValueError:
+        raise ValueError(f"'{text.strip()}' is not {'an integer' if numberType is int else 'a number'}")
+
+# Parse a boolean -----------------------------------------------------------------------------------------------------------------
+def _parseBool(text: str) -> bool:
+    """
+    Convert text to a boolean.
+
+    Args:
+        text (str): The text to convert.
+
+    Raises:
+        ValueError: If the text is not a recognized boolean.
+
+    Returns:
+        bool: The boolean.
+    """
+    match text.strip().lower():
+        case "true" | "yes" | "on" | "1":
+            return True
+        case "false" | "no" | "off" | "0":
+            return False
+        case _:
+            raise ValueError(f"'{text.strip()}' is not a boolean (use true or false)")
+
+# Split an array ------------------------------------------------------------------------------------------------------------------
+def _splitArray(text: str) -> list[str]:
+    """
+    Split the text of an array to items.
+
+    Args:
+        text (str): The text to split, such as "1, 2, 3" or "[1, 2, 3]".
+
+    Raises:
+        ValueError: If the array is empty.
+
+    Returns:
+        list[str]: The items.
+    """
+    items = [item for item in text.strip().strip("[]()").split(",") if item.strip()]
+
+    if not items:
+        raise ValueError("An array needs at least one item")
+
+    return items
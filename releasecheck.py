@@ -0,0 +1,198 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains getting and caching information on the latest release, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import json
+import os
+import re
+import threading
+import time
+
+# Functions #######################################################################################################################
+
+# Get information on the latest release -------------------------------------------------------------------------------------------
+def fetchLatestRelease(url: str, timeout: float = 5, cache: dict = None, auth: tuple[str, str] = None) -> dict:
+    """
+    Download information on the latest release. This blocks until the server responds, so don't call it on Blender's main
+    thread, use `updateChecker.startUpdateCheck` instead.
+    
+    If a cache is specified with information from an earlier response, the request is conditional, and an unchanged release
+    costs a 304 response with no body. The cache is updated in place with the release, the validators of the response and the
+    time of checking, so that it can be saved with `saveReleaseCache`.
+
+    Args:
+        url (str): API URL to get latest release information from.
+        timeout (float, optional): Seconds to wait for the server. Defaults to 5.
+        cache (dict, optional): Cached information from an earlier check, as loaded by `loadReleaseCache`. Defaults to None.
+        auth (tuple[str, str], optional): User name and token to access the API with. Defaults to None.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails, the body is not JSON, or the release is reported unchanged
+        while not cached.
+        KeyError: If the response does not contain release information.
+
+    Returns:
+        dict: The name of the release (name) and its version tag (tag_name).
+    """
+    # Loading requests takes long, so don't make enabling the add-on and starting Blender pay for it
+    import requests
+    
+    headers = {}
+    
+    # Validators are only worth sending if we have the release they belong to
+    if cache is not None and "release" in cache:
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("lastModified"):
+            headers["If-Modified-Since"] = cache["lastModified"]
+    
+    response = requests.get(url, timeout=timeout, auth=auth, headers=headers)
+    
+    if response.status_code == 304:
+        # Only a release we have can be unchanged, and there's no body to take one from
+        if cache is None or "release" not in cache:
+            raise requests.exceptions.HTTPError("Release reported unchanged, but no release is cached", response=response)
+        
+        release = cache["release"]
+    else:
+        response.raise_for_status()
+        
+        body = response.json()
+        
+        try:
+            release = {"name": body["name"], "tag_name": body["tag_name"]}
+        except (KeyError, TypeError):
+            raise KeyError("The response does not contain release information") from None
+    
+    if cache is not None:
+        if response.status_code != 304:
+            cache.clear()
+            cache["release"] = release
+            
+        # A 304 response may come with refreshed validators
+        if response.headers.get("ETag"):
+            cache["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            cache["lastModified"] = response.headers["Last-Modified"]
+        
+        cache["checkedAt"] = time.time()
+    
+    return release
+
+# Load cached release information -------------------------------------------------------------------------------------------------
+def loadReleaseCache(path: str) -> dict:
+    """
+    Load cached release information saved by `saveReleaseCache`.
+
+    Args:
+        path (str): The cache file.
+
+    Returns:
+        dict: The cached information, empty if there is no cache or it cannot be read.
+    """
+    try:
+        with open(path, encoding="utf-8") as cacheFile:
+            cache = json.load(cacheFile)
+    except (OSError, ValueError):
+        return {}
+    
+    if not isinstance(cache, dict) or not isinstance(cache.get("release"), dict):
+        return {}
+    
+    return cache
+
+# Save cached release information -------------------------------------------------------------------------------------------------
+def saveReleaseCache(path: str, cache: dict):
+    """
+    Save release information to the cache file. The file is replaced atomically, so that other Blender instances reading it at
+    the same time never see a partially written file.
+
+    Args:
+        path (str): The cache file.
+        cache (dict): The information to save, as updated by `fetchLatestRelease`.
+    """
+    temporaryPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    
+    try:
+        with open(temporaryPath, "w", encoding="utf-8") as cacheFile:
+            json.dump(cache, cacheFile)
+        
+        os.replace(temporaryPath, path)
+    except OSError as ex:
+        print(f"Cannot save update check cache: {ex}")
+        
+        try:
+            os.remove(temporaryPath)
+        except OSError:
+            pass
+
+# Compare versions ----------------------------------------------------------------------------------------------------------------
+def isNewerVersion(latestTag: str, installedVersion: tuple) -> bool:
+    """
+    Tell if a release tag denotes a newer version than the one installed.
+
+    Args:
+        latestTag (str): The release tag, such as v1.2.3 or v1.2.3-alpha.
+        installedVersion (tuple): The installed version, such as (1, 2, 1).
+
+    Raises:
+        ValueError: If the tag does not contain a version number.
+
+    Returns:
+        bool: `True` if the tag is of a newer version.
+    """
+    # Trim leading v and eventual trailing qualifiers such as -alpha
+    match = re.match(r"[v]?((\d+\.)*(\d+)).*", latestTag)
+    
+    if match is None:
+        raise ValueError(f"No version number in release tag '{latestTag}'")
+    
+    # Parse into a list
+    latestVersionTags = [int(t) for t in match[1].split(".")]
+    
+    return tuple(latestVersionTags) > tuple(installedVersion)
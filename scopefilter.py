@@ -0,0 +1,323 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains compiled scope filters, independent of Blender.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+import fnmatch
+import operator
+import re
+from enum import Enum
+from typing import Any, Callable, Collection, Optional
+from .propertyvalue import ValueTypes, parseValue
+
+# Enum for property conditions ####################################################################################################
+class PropertyConditions(Enum):
+    """
+    An enum for conditions on a property of objects in scope.
+    """
+    Any = 1
+    Has = 2
+    HasNot = 3
+    Compare = 4
+
+
+# Enum for value conditions #######################################################################################################
+class ValueConditions(Enum):
+    """
+    An enum for conditions on the current value of the property an operation changes.
+    """
+    Any = 1
+    Equals = 2
+    NotEquals = 3
+    Regex = 4
+    Range = 5
+
+
+# Comparison operators ############################################################################################################
+
+comparisonOperators: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+"""
+Operators to compare property values with, by their symbols.
+"""
+
+
+# Functions #######################################################################################################################
+
+# Compile a filter into a predicate -----------------------------------------------------------------------------------------------
+def compileFilter(
+        objectTypes: Optional[Collection[str]] = None,
+        collectionObjects: Optional[Collection] = None,
+        namePattern: str = "",
+        nameIsRegex: bool = False,
+        propertyName: str = "",
+        propertyCondition: PropertyConditions = PropertyConditions.Any,
+        comparison: str = "==",
+        value: Any = None) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile filter criteria into a single predicate telling whether an object passes all criteria. Patterns are compiled and
+    values are converted here once, so that evaluating the predicate for an object is cheap. Criteria not specified are not
+    checked at all.
+
+    Args:
+        objectTypes (Collection[str], optional): Types of objects to keep (the `type` attribute of objects, such as 'MESH').
+        Defaults to None, meaning objects of any type.
+        collectionObjects (Collection, optional): Objects of the collection to keep objects of, preferably as a set. Defaults 
+        to None, meaning objects of any collection.
+        namePattern (str, optional): Glob pattern (or regular expression) object names shall match. Defaults to "", meaning
+        any name.
+        nameIsRegex (bool, optional): Whether `namePattern` is a regular expression. Defaults to False.
+        propertyName (str, optional): Name of a property to check. Defaults to "".
+        propertyCondition (PropertyConditions, optional): What to check for the property. Defaults to PropertyConditions.Any.
+        comparison (str, optional): Symbol of the operator to compare the property value with `value`, one of the keys of
+        `comparisonOperators`. Defaults to "==".
+        value (Any, optional): Value to compare the property value with. Defaults to None.
+
+    Raises:
+        ValueError: If the name pattern is not a valid regular expression, or the comparison operator is not known.
+
+    Returns:
+        Optional[Callable[[Any], bool]]: The predicate, or `None` if there are no criteria to check.
+    """
+    checks = []
+
+    # Type
+    if objectTypes:
+        types = frozenset(objectTypes)
+        checks.append(lambda object: object.type in types)
+
+    # Collection
+    if collectionObjects is not None:
+        members = collectionObjects if isinstance(collectionObjects, (set, frozenset)) else set(collectionObjects)
+        checks.append(lambda object: object in members)
+
+    # Name
+    if namePattern:
+        try:
+            matchName = re.compile(namePattern if nameIsRegex else fnmatch.translate(namePattern)).match
+        except re.error as ex:
+            raise ValueError(f"Invalid name pattern '{namePattern}': {ex}")
+
+        checks.append(lambda object: matchName(object.name) is not None)
+
+    # Property
+    if propertyName:
+        match propertyCondition:
+            case PropertyConditions.Has:
+                checks.append(lambda object: propertyName in object)
+            case PropertyConditions.HasNot:
+                checks.append(lambda object: propertyName not in object)
+            case PropertyConditions.Compare:
+                checks.append(_compileComparison(propertyName, comparison, value))
+            case _:
+                pass
+
+    # Combine checks into one predicate
+    if not checks:
+        return None
+
+    if len(checks) == 1:
+        return checks[0]
+
+    return lambda object: all(check(object) for check in checks)
+
+# Compile a condition on values ---------------------------------------------------------------------------------------------------
+def compileValueCondition(
+        condition: ValueConditions,
+        value: str = "",
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a condition on property values into a predicate on a value, such as to reset or remove a property only where it
+    has a specific value. The pattern is compiled and the value is converted here once. Values are compared as in filters:
+    numeric values numerically if `value` is a number, other values as text.
+
+    Args:
+        condition (ValueConditions): The condition.
+        value (str, optional): Value to compare with for Equals and NotEquals, or the regular expression the whole value (as
+        text) shall match for Regex. Defaults to "".
+        minimum (float, optional): Smallest value passing Range, or `None` for no lower limit. Defaults to None.
+        maximum (float, optional): Largest value passing Range, or `None` for no upper limit. Defaults to None.
+
+    Raises:
+        ValueError: If the regular expression is not valid, or the condition is not known.
+
+    Returns:
+        Optional[Callable[[Any], bool]]: The predicate taking a value, or `None` if any value passes.
+    """
+    match condition:
+        case ValueConditions.Any:
+            return None
+
+        case ValueConditions.Equals | ValueConditions.NotEquals:
+            return _compileValueComparison("==" if condition == ValueConditions.Equals else "!=", value)
+
+        case ValueConditions.Regex:
+            try:
+                matchValue = re.compile(value).fullmatch
+            except re.error as ex:
+                raise ValueError(f"Invalid value pattern '{value}': {ex}")
+
+            return lambda current: matchValue(str(current)) is not None
+
+        case ValueConditions.Range:
+            def inRange(current) -> bool:
+                if not isinstance(current, (int, float)) or isinstance(current, bool):
+                    # Only numbers have a range
+                    return False
+
+                return (minimum is None or current >= minimum) and (maximum is None or current <= maximum)
+
+            return inRange
+
+        case _:
+            raise ValueError(f"Unknown value condition {condition}")
+
+# Combine predicates --------------------------------------------------------------------------------------------------------------
+def combine(*predicates: Optional[Callable[[Any], bool]]) -> Optional[Callable[[Any], bool]]:
+    """
+    Combine predicates into one which is `True` if all of them are. Predicates specified as `None` are skipped.
+
+    Returns:
+        Optional[Callable[[Any], bool]]: The combined predicate, or `None` if all predicates are `None`.
+    """
+    predicates = [p for p in predicates if p is not None]
+
+    if not predicates:
+        return None
+
+    if len(predicates) == 1:
+        return predicates[0]
+
+    return lambda object: all(p(object) for p in predicates)
+
+# Private functions ###############################################################################################################
+
+# Compile a value comparison ------------------------------------------------------------------------------------------------------
+def _compileComparison(propertyName: str, comparison: str, value: Any) -> Callable[[Any], bool]:
+    """
+    Compile a comparison of a property value of objects to a value. Objects not having the property don't pass. Numeric 
+    property values are compared numerically if `value` can be converted to a number, other values are compared as text.
+
+    Args:
+        propertyName (str): Name of the property.
+        comparison (str): Symbol of the operator, one of the keys of `comparisonOperators`.
+        value (Any): The value to compare with.
+
+    Raises:
+        ValueError: If the comparison operator is not known.
+
+    Returns:
+        Callable[[Any], bool]: The predicate.
+    """
+    compareValue = _compileValueComparison(comparison, value)
+
+    def check(object) -> bool:
+        current = object.get(propertyName)
+
+        if current is None:
+            return False
+
+        return compareValue(current)
+
+    return check
+
+# Compile a comparison of values --------------------------------------------------------------------------------------------------
+def _compileValueComparison(comparison: str, value: Any) -> Callable[[Any], bool]:
+    """
+    Compile a comparison of values to a value. Numeric values are compared numerically if `value` can be converted to a 
+    number, other values are compared as text. Booleans are compared as 1 and 0, and so are true and false (or yes and no) 
+    with integers.
+
+    Args:
+        comparison (str): Symbol of the operator, one of the keys of `comparisonOperators`.
+        value (Any): The value to compare with.
+
+    Raises:
+        ValueError: If the comparison operator is not known.
+
+    Returns:
+        Callable[[Any], bool]: The predicate taking a value.
+    """
+    if comparison not in comparisonOperators:
+        raise ValueError(f"Unknown comparison operator '{comparison}'")
+
+    compare = comparisonOperators[comparison]
+
+    # Convert the value once
+    text = str(value)
+
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = None
+
+    # Booleans are stored as integers by Blender before 4.0, so compare them as 1 and 0, and take true and false as those
+    try:
+        flag = float(parseValue(text, ValueTypes.Bool))
+    except ValueError:
+        flag = None
+
+    def check(current) -> bool:
+        if isinstance(current, bool):
+            current = int(current)
+
+        if number is not None and isinstance(current, (int, float)):
+            return compare(current, number)
+
+        if flag is not None and isinstance(current, int):
+            return compare(current, flag)
+
+        return compare(str(current), text)
+
+    return check
@@ -0,0 +1,197 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module measures how long enabling the add-on takes, to keep Blender startup fast.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+# This module runs as a standalone script, and is also imported by the background Blender processes it starts, where it runs as 
+# part of the add-on package. Only the standard library is imported at module level.
+#
+# Usage: python startuptime.py [--blender PATH] [--runs N] [--budget MS]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Optional
+
+# Constants #######################################################################################################################
+
+resultMarker = "T1NKER_COPM_STARTUP "
+"""
+Prefix of the output line through which background Blender processes report measurements to the launcher.
+"""
+
+heavyModules = ["requests", "urllib3"]
+"""
+Modules that shall not be loaded by enabling the add-on, only when actually used.
+"""
+
+_packageAlias = "t1nker_custom_object_property_manager"
+"""
+Name to import the add-on package as in background Blender processes, as the folder name may not be a valid module name.
+"""
+
+# Functions: launcher #############################################################################################################
+
+# Measure once --------------------------------------------------------------------------------------------------------------------
+def measure(blender: str) -> dict:
+    """
+    Start a background Blender process with factory settings, and measure importing and registering the add-on in it.
+
+    Args:
+        blender (str): The Blender executable.
+
+    Raises:
+        RuntimeError: If Blender fails or does not report a measurement.
+
+    Returns:
+        dict: Milliseconds spent on importing (importMs) and registering (registerMs), and heavy modules loaded (heavyModules).
+    """
+    addonFolder = os.path.dirname(os.path.abspath(__file__))
+
+    script = \
+        "import sys\n" \
+        f"sys.path.insert(0, {addonFolder!r})\n" \
+        "import startuptime\n" \
+        f"startuptime.runInBlender({os.path.join(addonFolder, '__init__.py')!r}, {addonFolder!r})\n"
+
+    process = subprocess.run(
+        [blender, "--background", "--factory-startup", "--python-exit-code", "1", "--python-expr", script],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+
+    lines = process.stdout.splitlines()
+    reported = [line[len(resultMarker):] for line in lines if line.startswith(resultMarker)]
+
+    if process.returncode != 0 or not reported:
+        raise RuntimeError(f"Blender exited with code {process.returncode}: " + " | ".join(lines[-5:]))
+
+    return json.loads(reported[-1])
+
+# Run the launcher ----------------------------------------------------------------------------------------------------------------
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Measure enabling the add-on several times, print the median, and check it against the budget.
+
+    Args:
+        argv (list[str], optional): Command-line arguments without the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: Exit code, 0 if within budget and no heavy modules have been loaded, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="startuptime.py", description="Measure the time of importing and registering the add-on.")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or 'blender').")
+    parser.add_argument("--runs", type=int, default=5, help="Number of Blender processes to measure in (default: 5).")
+    parser.add_argument("--budget", type=float, default=150, help="Maximum median time of import and register (ms, default: 150).")
+    arguments = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    try:
+        results = [measure(arguments.blender) for _ in range(max(1, arguments.runs))]
+    except (OSError, RuntimeError) as ex:
+        print(f"Cannot measure: {ex}", file=sys.stderr)
+        return 1
+
+    importMs = statistics.median(result["importMs"] for result in results)
+    registerMs = statistics.median(result["registerMs"] for result in results)
+    loaded = sorted({module for result in results for module in result["heavyModules"]})
+
+    print(f"Import: {importMs:.1f} ms, register: {registerMs:.1f} ms, total: {importMs + registerMs:.1f} ms (budget: {arguments.budget:.0f} ms, median of {len(results)} runs)")
+
+    isPassed = True
+
+    if importMs + registerMs > arguments.budget:
+        print("FAILED: over budget")
+        isPassed = False
+
+    if loaded:
+        print(f"FAILED: heavy modules loaded on enabling the add-on: {', '.join(loaded)}")
+        isPassed = False
+
+    return 0 if isPassed else 1
+
+# Functions: background Blender process ###########################################################################################
+
+# Measure in Blender --------------------------------------------------------------------------------------------------------------
+def runInBlender(initFile: str, addonFolder: str):
+    """
+    Import and register the add-on, and print the measurements for the launcher. This runs in the background Blender processes
+    started by the launcher.
+
+    Args:
+        initFile (str): Path of the `__init__.py` of the add-on.
+        addonFolder (str): The folder of the add-on.
+    """
+    import importlib.util
+
+    alreadyLoaded = {module for module in heavyModules if module in sys.modules}
+
+    started = time.perf_counter()
+
+    spec = importlib.util.spec_from_file_location(_packageAlias, initFile, submodule_search_locations=[addonFolder])
+    package = importlib.util.module_from_spec(spec)
+    sys.modules[_packageAlias] = package
+    spec.loader.exec_module(package)
+
+    imported = time.perf_counter()
+
+    package.register()
+
+    registered = time.perf_counter()
+
+    package.unregister()
+
+    print(resultMarker + json.dumps({
+        "importMs": round((imported - started) * 1000, 3),
+        "registerMs": round((registered - imported) * 1000, 3),
+        "heavyModules": [module for module in heavyModules if module in sys.modules and module not in alreadyLoaded],
+    }), flush=True)
+
+# Run the launcher ################################################################################################################
+if __name__ == "__main__":
+    sys.exit(main())
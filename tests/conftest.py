@@ -0,0 +1,89 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Shared fixtures of the tests of the Blender independent modules. Run the tests with `python -m pytest tests`, no Blender needed.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# *********************************************************************************************************************************
+
+import importlib
+import itertools
+import os
+import sys
+import types
+import pytest
+
+packageAlias = "t1nker_custom_object_property_manager"
+"""
+Name to import the add-on package as, as the folder name may not be a valid module name, and its __init__.py needs Blender.
+"""
+
+# Import the package without running its __init__.py, before test modules import from it
+if packageAlias not in sys.modules:
+    package = types.ModuleType(packageAlias)
+    package.__path__ = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    sys.modules[packageAlias] = package
+
+importlib.import_module(f"{packageAlias}.decoratorengine")
+
+
+# Stand-in of a Blender object ####################################################################################################
+class FakeObject(dict):
+    """
+    Stand-in of a Blender object: a mapping of custom properties with a name and a session identifier, compared and hashed by
+    identity like Blender objects are. Reads of properties are counted, to check what an operation touches.
+    """
+    __hash__ = object.__hash__
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+
+    _uids = itertools.count()
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, name: str, **properties):
+        super().__init__(properties)
+        self.name = name
+        self.type = "MESH"
+        self.session_uid = next(FakeObject._uids)
+        self.reads = 0
+
+    def __contains__(self, name) -> bool:
+        self.reads += 1
+        return super().__contains__(name)
+
+    def __getitem__(self, name):
+        self.reads += 1
+        return super().__getitem__(name)
+
+    def get(self, name, default=None):
+        self.reads += 1
+        return super().get(name, default)
+
+    def keys(self):
+        self.reads += 1
+        return super().keys()
+
+
+# Fixtures ########################################################################################################################
+
+# Make objects --------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def makeObject():
+    """
+    Factory of stand-ins of Blender objects, taking a name and the custom properties as keyword arguments.
+    """
+    return FakeObject
+
+
+# Make a scene --------------------------------------------------------------------------------------------------------------------
+@pytest.fixture
+def makeScene():
+    """
+    Factory of lists of stand-ins of Blender objects, taking the number of objects and a function giving the properties of
+    the object of an index, such as `lambda i: {"LOD": 1} if i % 10 == 0 else {}`.
+    """
+    def make(size: int, propertiesOf=lambda i: {}) -> list:
+        return [FakeObject(f"Object.{i:05d}", **propertiesOf(i)) for i in range(size)]
+
+    return make
@@ -0,0 +1,65 @@
+# Tests of the Python API for scripts.
+
+import pytest
+from t1nker_custom_object_property_manager import api
+from t1nker_custom_object_property_manager.decoratorengine import DecoratorWorkerModes, RenameConflicts
+from t1nker_custom_object_property_manager.scopefilter import ValueConditions, compileValueCondition
+
+
+def test_apply_reports_changes(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=2), makeObject("Plane")]
+
+    result = api.apply(objects, "LOD", "2", "Add", valueType="Int")
+
+    assert (result.changes, result.added, result.set, result.removed, result.applied) == (2, 1, 1, 0, 2)
+    assert result.objectsScanned == 3
+    assert result.changedObjects == [objects[0], objects[2]]
+    assert [object["LOD"] for object in objects] == [2, 2, 2]
+
+
+def test_dry_run_then_apply_plan(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=1)]
+
+    preview = api.apply(objects, "LOD", mode="Remove", dryRun=True)
+    assert preview.isDryRun and preview.applied == 0 and all("LOD" in object for object in objects)
+
+    objects[1]["LOD"] = 5
+    result = api.applyPlan(preview.plan)
+
+    assert result.applied == 1
+    assert dict(objects[0]) == {} and dict(objects[1]) == {"LOD": 5}
+
+
+def test_apply_batch_with_condition_and_rename(makeObject):
+    objects = [makeObject("Cube", LOD=1, Old=1), makeObject("Cone", LOD=3)]
+
+    api.applyBatch(objects, [
+        api.spec("LOD", mode="Remove", where=compileValueCondition(ValueConditions.Range, minimum=2)),
+        api.spec("Old", "New", "Rename", onConflict="Overwrite"),
+        api.spec("Tag", api.template("{name}"), "Extend"),
+    ])
+
+    assert dict(objects[0]) == {"LOD": 1, "New": 1, "Tag": "Cube"}
+    assert dict(objects[1]) == {"Tag": "Cone"}
+
+
+def test_spec_accepts_enums_and_names():
+    assert api.spec("LOD", "1", DecoratorWorkerModes.Reset, "Int") == api.spec("LOD", 1, "Reset")
+    assert api.spec("LOD", "New", "Rename", onConflict=RenameConflicts.KeepExisting).conflictPolicy == RenameConflicts.KeepExisting
+
+
+@pytest.mark.parametrize("arguments", [
+    {"mode": "Move"},
+    {"propertyValue": "1", "valueType": "Complex"},
+    {"propertyValue": "New", "mode": "Rename", "onConflict": "Merge"},
+    {"mode": "Rename"},
+    {"mode": "Add"},
+])
+def test_spec_rejects_invalid_arguments(arguments):
+    with pytest.raises(ValueError):
+        api.spec("LOD", **arguments)
+
+
+def test_template_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        api.template("{name}", "Complex")
@@ -0,0 +1,73 @@
+# Tests of extending new objects automatically.
+
+import pytest
+from t1nker_custom_object_property_manager.autoextend import AutoExtender, AutoExtendRule, SeenObjects
+from t1nker_custom_object_property_manager.propertyindex import PropertyIndex
+
+
+def test_seen_objects():
+    seen = SeenObjects()
+
+    assert seen.add(3) and seen.add(1000)
+    assert not seen.add(3)
+    assert 3 in seen and 4 not in seen and 10**6 not in seen
+    assert len(seen) == 2
+
+    seen.clear()
+    assert 3 not in seen and len(seen) == 0
+
+
+def test_new_objects_are_extended_once(makeObject):
+    extender = AutoExtender()
+    extender.setRules([AutoExtendRule("LOD", "2", "Int"), AutoExtendRule("", "1", "Int")])
+    cube = makeObject("Cube", LOD=1)
+    cone = makeObject("Cone")
+
+    assert len(extender.extendNew([cube, cone])) == 1
+    assert dict(cube) == {"LOD": 1} and dict(cone) == {"LOD": 2}
+
+    del cone["LOD"]
+    assert len(extender.extendNew([cone])) == 0
+
+
+def test_objects_seen_without_rules_are_extended_later(makeObject):
+    extender = AutoExtender()
+    cube = makeObject("Cube")
+
+    extender.extendNew([cube])
+    extender.setRules([AutoExtendRule("LOD", "2", "Int")])
+    extender.extendNew([cube])
+
+    assert cube["LOD"] == 2
+
+
+def test_template_rules_are_rendered_for_each_object(makeObject):
+    extender = AutoExtender()
+    extender.setRules([AutoExtendRule("Tag", "{name}", "String", isValueTemplate=True)])
+    cube = makeObject("Cube")
+
+    extender.extend([cube])
+
+    assert cube["Tag"] == "Cube"
+
+
+def test_invalid_rules_leave_rules_unchanged():
+    extender = AutoExtender()
+    specs = extender.setRules([AutoExtendRule("LOD", "2", "Int")])
+
+    with pytest.raises(ValueError):
+        extender.setRules([AutoExtendRule("LOD", "two", "Int")])
+
+    assert extender.setRules([AutoExtendRule("LOD", "2", "Int")]) is specs
+
+
+def test_index_is_kept_current(makeObject):
+    cube = makeObject("Cube")
+    index = PropertyIndex()
+    index.build([cube])
+    extender = AutoExtender(index=index)
+    extender.setRules([AutoExtendRule("LOD", "2", "Int")])
+
+    extender.extendNew([cube])
+
+    assert index.objectsWith("LOD") == {cube}
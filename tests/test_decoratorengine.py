@@ -0,0 +1,299 @@
+# Tests of the property mutation engine: planning, applying, rolling back and journaling changes.
+
+import time
+import pytest
+from itertools import islice
+from t1nker_custom_object_property_manager.decoratorengine import (
+    ChangeJournal, ChangeKinds, DecoratorEngine, DecoratorWorkerModes, PropertySpec, RenameConflicts)
+from t1nker_custom_object_property_manager.propertyindex import PropertyIndex
+
+Add = DecoratorWorkerModes.Add
+Extend = DecoratorWorkerModes.Extend
+Reset = DecoratorWorkerModes.Reset
+Remove = DecoratorWorkerModes.Remove
+Rename = DecoratorWorkerModes.Rename
+
+
+# Planning ########################################################################################################################
+
+def test_plan_changes_nothing(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Plane")]
+
+    plan = DecoratorEngine().plan(objects, [PropertySpec("LOD", 2, Add)])
+
+    assert [(change.object.name, change.kind) for change in plan] == [("Cube", ChangeKinds.Set), ("Plane", ChangeKinds.Add)]
+    assert objects[0]["LOD"] == 1 and "LOD" not in objects[1]
+
+
+@pytest.mark.parametrize("action, kinds", [
+    (Add, [ChangeKinds.Add, ChangeKinds.Set]),
+    (Extend, [ChangeKinds.Add]),
+    (Reset, [ChangeKinds.Set]),
+    (Remove, [ChangeKinds.Remove, ChangeKinds.Remove]),
+])
+def test_plan_by_mode(makeObject, action, kinds):
+    objects = [makeObject("Plane"), makeObject("Cube", LOD=1), makeObject("Cone", LOD=2)]
+
+    plan = DecoratorEngine().plan(objects, [PropertySpec("LOD", 2, action)])
+
+    assert [change.kind for change in plan] == kinds
+
+
+def test_plan_leaves_out_writes_not_changing_value(makeObject):
+    plan = DecoratorEngine().plan([makeObject("Cube", LOD=2)], [PropertySpec("LOD", 2, Reset)])
+
+    assert len(plan) == 0
+    assert plan.operationsSkipped == 1
+
+
+def test_later_operation_sees_earlier_one(makeObject):
+    object = makeObject("Cube")
+
+    plan = DecoratorEngine().plan([object], [PropertySpec("LOD", 1, Add), PropertySpec("LOD", 2, Reset)])
+
+    assert [(change.oldValue, change.newValue) for change in plan] == [(None, 1), (1, 2)]
+
+
+def test_condition_selects_values_to_remove(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=3)]
+
+    plan = DecoratorEngine().plan(objects, [PropertySpec("LOD", None, Remove, condition=lambda value: value > 2)])
+
+    assert [change.object.name for change in plan] == ["Cone"]
+
+
+def test_invalid_mode_is_rejected_before_planning(makeObject):
+    object = makeObject("Cube")
+
+    with pytest.raises(ValueError):
+        DecoratorEngine().plan([object], [PropertySpec("LOD", 1, "Add")])
+
+    assert object.reads == 0
+
+
+# Renaming ########################################################################################################################
+
+@pytest.mark.parametrize("policy, expected", [
+    (RenameConflicts.Skip, {"Old": 1, "New": 2}),
+    (RenameConflicts.Overwrite, {"New": 1}),
+    (RenameConflicts.KeepExisting, {"New": 2}),
+])
+def test_rename_conflicts(makeObject, policy, expected):
+    object = makeObject("Cube", Old=1, New=2)
+    engine = DecoratorEngine()
+
+    engine.apply(engine.plan([object], [PropertySpec("Old", "New", Rename, policy)]))
+
+    assert dict(object) == expected
+
+
+def test_rename_to_same_name_is_rejected(makeObject):
+    with pytest.raises(ValueError):
+        DecoratorEngine().plan([makeObject("Cube", LOD=1)], [PropertySpec("LOD", "LOD", Rename)])
+
+
+# Applying and rolling back #######################################################################################################
+
+def test_apply_and_revert(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Plane")]
+    engine = DecoratorEngine()
+    plan = engine.plan(objects, [PropertySpec("LOD", 2, Add)])
+
+    assert engine.apply(plan) == 2
+    assert [object["LOD"] for object in objects] == [2, 2]
+
+    assert engine.revert(plan.changes) == 2
+    assert dict(objects[0]) == {"LOD": 1} and dict(objects[1]) == {}
+
+
+def test_apply_rolls_back_when_a_change_fails(makeObject):
+    class Locked(type(makeObject("Cube"))):
+        def __setitem__(self, name, value):
+            raise TypeError("read-only")
+
+    objects = [makeObject("Cube", LOD=1), Locked("Locked")]
+    engine = DecoratorEngine()
+    plan = engine.plan(objects, [PropertySpec("LOD", 2, Add)])
+
+    with pytest.raises(TypeError):
+        engine.apply(plan)
+
+    assert dict(objects[0]) == {"LOD": 1}
+
+
+def test_verify_skips_properties_changed_since_planning(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=1)]
+    engine = DecoratorEngine()
+    plan = engine.plan(objects, [PropertySpec("LOD", 2, Reset)])
+
+    objects[1]["LOD"] = 5
+
+    assert engine.apply(plan, verify=True) == 1
+    assert objects[1]["LOD"] == 5
+
+
+def test_verified_revert_keeps_later_edits(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=1)]
+    engine = DecoratorEngine()
+    plan = engine.plan(objects, [PropertySpec("LOD", 2, Reset)])
+    engine.apply(plan)
+
+    objects[1]["LOD"] = 5
+
+    assert engine.revert(plan.changes, verify=True) == 1
+    assert [object["LOD"] for object in objects] == [1, 5]
+
+
+def test_test_mode_changes_nothing(makeObject):
+    object = makeObject("Cube")
+
+    assert DecoratorEngine(isTestOnly=True).process([object], "LOD", 1, Add) == 1
+    assert dict(object) == {}
+
+
+# Journal #########################################################################################################################
+
+def test_journal_keeps_last_operations(makeObject):
+    object = makeObject("Cube")
+    engine = DecoratorEngine()
+    journal = ChangeJournal(maxOperations=2)
+
+    for value in range(1, 4):
+        engine.apply(engine.plan([object], [PropertySpec("LOD", value, Add)]), journal=journal, title=f"Set {value}")
+
+    assert [entry.title for entry in journal.entries] == ["Set 2", "Set 3"]
+
+    engine.revert(journal.pop().changes)
+    assert object["LOD"] == 2
+
+
+def test_journal_of_no_operations_records_nothing(makeObject):
+    object = makeObject("Cube")
+    engine = DecoratorEngine()
+    journal = ChangeJournal(maxOperations=0)
+
+    engine.apply(engine.plan([object], [PropertySpec("LOD", 1, Add)]), journal=journal)
+
+    assert len(journal) == 0 and journal.last is None
+
+
+def test_journal_skips_operations_changing_nothing(makeObject):
+    object = makeObject("Cube", LOD=1)
+    engine = DecoratorEngine()
+    journal = ChangeJournal()
+
+    engine.apply(engine.plan([object], [PropertySpec("LOD", 1, Reset)]), journal=journal)
+
+    assert len(journal) == 0
+
+
+# Using the index #################################################################################################################
+
+def test_index_limits_planning_to_objects_having_the_property(makeScene):
+    objects = makeScene(100, lambda i: {"LOD": 1} if i % 10 == 0 else {})
+    index = PropertyIndex()
+    index.build(objects)
+    engine = DecoratorEngine(index=index)
+
+    plan = engine.plan(objects, [PropertySpec("LOD", 2, Reset)], inScope=lambda object: True)
+
+    assert plan.objectsScanned == 10
+    assert len(plan) == 10
+
+
+def test_index_is_kept_current_when_applying(makeObject):
+    objects = [makeObject("Cube", LOD=1), makeObject("Plane")]
+    index = PropertyIndex()
+    index.build(objects)
+    engine = DecoratorEngine(index=index)
+
+    engine.apply(engine.plan(objects, [PropertySpec("LOD", None, Remove)], inScope=lambda object: True))
+    engine.apply(engine.plan(objects[1:], [PropertySpec("Hide", 1, Add)]))
+
+    assert index.objectsWith("LOD") == set()
+    assert index.objectsWith("Hide") == {objects[1]}
+
+
+def test_index_planning_doesnt_read_objects_without_the_property(makeScene):
+    objects = makeScene(1000, lambda i: {"LOD": 1} if i % 100 == 0 else {"Other": i})
+    index = PropertyIndex()
+    index.build(objects)
+    reads = {object: object.reads for object in objects}
+
+    DecoratorEngine(index=index).plan(objects, [PropertySpec("LOD", None, Remove)], inScope=lambda object: True)
+
+    assert [object for object in objects if object.reads != reads[object]] == [object for object in objects if "LOD" in object]
+
+
+def test_index_planning_drops_stale_candidates(makeObject):
+    cube, cone = makeObject("Cube", LOD=1), makeObject("Cone", LOD=1)
+    index = PropertyIndex()
+    index.build([cube, cone])
+
+    # Removed by a script, not reported to the index
+    del cone["LOD"]
+
+    plan = DecoratorEngine(index=index).plan([cube, cone], [PropertySpec("LOD", 2, Reset)], inScope=lambda object: True)
+
+    assert [change.object for change in plan] == [cube]
+    assert plan.objectsScanned == 1
+    assert index.objectsWith("LOD") == {cube}
+
+
+def test_index_planning_skips_objects_out_of_scope_or_deleted(makeObject):
+    class Deleted(type(makeObject("Cube"))):
+        def __contains__(self, name):
+            raise ReferenceError("StructRNA of type Object has been removed")
+
+    cube, cone, gone = makeObject("Cube", LOD=1), makeObject("Cone", LOD=1), Deleted("Gone", LOD=1)
+    index = PropertyIndex()
+    index.build([cube, cone, gone])
+
+    plan = DecoratorEngine(index=index).plan([cube, gone], [PropertySpec("LOD", None, Remove)], inScope=lambda object: object is not cone)
+
+    assert [change.object for change in plan] == [cube]
+    assert index.objectsWith("LOD") == {cube, cone}
+
+
+def test_value_condition_plans_only_objects_the_index_returns(makeScene):
+    objects = makeScene(1000, lambda i: {"LOD": i % 50})
+    index = PropertyIndex()
+    index.build(objects)
+    condition = lambda value: value == 7
+    expected = index.objectsWhere("LOD", condition)
+    reads = {object: object.reads for object in objects}
+
+    plan = DecoratorEngine(index=index).plan(objects, [PropertySpec("LOD", None, Remove, condition=condition)], inScope=lambda object: True)
+
+    assert {object for object in objects if object.reads != reads[object]} == expected
+    assert {change.object for change in plan} == expected and len(expected) == 20
+
+
+def test_first_planning_step_fits_a_frame_on_a_large_scope(makeScene):
+    objects = makeScene(100000, lambda i: {"LOD": 1} if i % 10 == 0 else {})
+    index = PropertyIndex()
+    index.build(objects)
+    engine = DecoratorEngine(index=index)
+    reads = sum(object.reads for object in objects)
+    plan = engine.startPlan([PropertySpec("LOD", 2, Reset)])
+
+    # Like the first step of the modal operator, which plans a chunk of 256 objects in a frame
+    started = time.perf_counter()
+    planned = sum(1 for _ in islice(engine.planObjects(plan, objects, inScope=lambda object: True), 256))
+    elapsed = time.perf_counter() - started
+
+    assert planned == 256
+    assert sum(object.reads for object in objects) - reads <= 256 * 3
+    assert elapsed < 1 / 60
+
+
+def test_booleans_stored_as_integers_are_not_rewritten(makeObject):
+    object = makeObject("Cube", Hide=1)
+    engine = DecoratorEngine()
+
+    plan = engine.plan([object], [PropertySpec("Hide", True, Reset)])
+    assert len(plan) == 0
+
+    plan = engine.plan([object], [PropertySpec("Hide", False, Reset)])
+    assert engine.apply(plan, verify=True) == 1
+    assert engine.revert(plan.changes, verify=True) == 1
@@ -0,0 +1,101 @@
+# Tests of the inverted index of custom property names and values.
+
+from t1nker_custom_object_property_manager.propertyindex import PropertyIndex
+
+
+def test_build_maps_names_to_objects(makeObject):
+    cube, plane = makeObject("Cube", LOD=1, Hide=0), makeObject("Plane", LOD=2)
+    index = PropertyIndex()
+    index.build([cube, plane])
+
+    assert index.isValid
+    assert index.objectsWith("LOD") == {cube, plane}
+    assert index.objectsWith("Hide") == {cube}
+    assert index.objectsWith("Missing") == set()
+
+
+def test_refresh_follows_changes_of_names(makeObject):
+    cube = makeObject("Cube", LOD=1)
+    index = PropertyIndex()
+    index.build([cube])
+
+    del cube["LOD"]
+    cube["Hide"] = 1
+    index.refresh(cube)
+
+    assert index.objectsWith("LOD") == set()
+    assert index.objectsWith("Hide") == {cube}
+
+
+def test_added_and_removed_dont_read_the_object(makeObject):
+    cube = makeObject("Cube")
+    index = PropertyIndex()
+    index.build([cube])
+    reads = cube.reads
+
+    index.added(cube, "LOD")
+    assert index.objectsWith("LOD") == {cube}
+
+    index.removed(cube, "LOD")
+    assert index.objectsWith("LOD") == set()
+    assert cube.reads == reads
+
+
+def test_discard_forgets_the_object(makeObject):
+    cube = makeObject("Cube", LOD=1)
+    index = PropertyIndex()
+    index.build([cube])
+    index.objectsWhere("LOD", lambda value: True)
+
+    index.discard(cube)
+
+    assert index.objectsWith("LOD") == set()
+    assert index.objectsWhere("LOD", lambda value: True) == set()
+
+
+def test_condition_is_checked_once_for_each_distinct_value(makeScene):
+    objects = makeScene(30, lambda i: {"LOD": i % 3})
+    index = PropertyIndex()
+    index.build(objects)
+    checked = []
+
+    def condition(value):
+        checked.append(value)
+        return value > 0
+
+    assert len(index.objectsWhere("LOD", condition)) == 20
+    assert sorted(checked) == [0, 1, 2]
+
+
+def test_values_are_kept_current(makeObject):
+    cube, cone = makeObject("Cube", LOD=1), makeObject("Cone", LOD=1)
+    index = PropertyIndex()
+    index.build([cube, cone])
+    index.objectsWhere("LOD", lambda value: True)
+
+    index.setValue(cube, "LOD", 3)
+    cone["LOD"] = [1, 2]
+    index.refresh(cone)
+
+    assert index.objectsWhere("LOD", lambda value: value == 3) == {cube}
+    assert index.objectsWhere("LOD", lambda value: value == [1, 2]) == {cone}
+    assert index.objectsWhere("LOD", lambda value: value == 1) == set()
+
+
+def test_invalid_index_ignores_updates(makeObject):
+    cube = makeObject("Cube", LOD=1)
+    index = PropertyIndex()
+
+    index.refresh(cube)
+    index.added(cube, "Hide")
+
+    assert not index.isValid
+    assert index.objectsWith("LOD") == set() and index.objectsWith("Hide") == set()
+
+
+def test_catalog_lists_most_used_names_first(makeObject):
+    index = PropertyIndex()
+    index.build([makeObject("Cube", LOD=1, Hide=0), makeObject("Cone", LOD=2), makeObject("Plane", lod_bias=1)])
+
+    assert index.catalog() == [("LOD", 2), ("Hide", 1), ("lod_bias", 1)]
+    assert index.catalog("lod", skipNames={"lod_bias"}) == [("LOD", 2)]
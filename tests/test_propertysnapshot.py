@@ -0,0 +1,78 @@
+# Tests of exporting and importing snapshots and value tables.
+
+import io
+import pytest
+from t1nker_custom_object_property_manager.decoratorengine import DecoratorEngine, DecoratorWorkerModes
+from t1nker_custom_object_property_manager.propertysnapshot import (
+    SnapshotFormats, exportSnapshot, planSnapshot, readSnapshot, readValueTable)
+from t1nker_custom_object_property_manager.propertyvalue import ValueTypes, isSameValue
+
+
+@pytest.mark.parametrize("format", [SnapshotFormats.JsonLines, SnapshotFormats.Csv])
+def test_snapshot_round_trip_keeps_types(makeObject, format):
+    properties = {"Name": "a,b", "LOD": 2, "Bias": 1.0, "Hide": True, "Ints": [1, 2], "Floats": [1.0, 2.5], "Group": {"a": 1}}
+    objects = [makeObject("Cube", **properties), makeObject("Empty")]
+    stream = io.StringIO(newline="")
+
+    assert exportSnapshot(objects, stream, format) == 1
+
+    stream.seek(0)
+    records = list(readSnapshot(stream, format))
+
+    assert [name for name, _ in records] == ["Cube"]
+    assert isSameValue(records[0][1], properties)
+
+
+def test_export_selected_names(makeObject):
+    stream = io.StringIO()
+
+    exportSnapshot([makeObject("Cube", LOD=1, Hide=0, _RNA_UI={})], stream, propertyNames=["LOD", "Missing"])
+
+    assert list(readSnapshot(io.StringIO(stream.getvalue()))) == [("Cube", {"LOD": 1})]
+
+
+@pytest.mark.parametrize("text", ['{"object": "Cube"}\n', '{"object": "Cube", "properties": {"LOD": null}}\n', "not json\n"])
+def test_invalid_snapshot_is_rejected_with_line(text):
+    with pytest.raises(ValueError, match="Line 1"):
+        list(readSnapshot(io.StringIO(text)))
+
+
+def test_read_csv_table_converts_cells():
+    table = io.StringIO("name,LOD,value\nCube,1,\nCone,,3\n")
+
+    records = list(readValueTable(table, valueType=ValueTypes.Int, propertyName="Hide"))
+
+    assert records == [("Cube", {"LOD": 1}), ("Cone", {"Hide": 3})]
+
+
+def test_read_json_table():
+    table = io.StringIO('{"Cube": {"LOD": 2}, "Cone": 5}')
+
+    assert list(readValueTable(table, SnapshotFormats.Json, propertyName="LOD")) == [("Cube", {"LOD": 2}), ("Cone", {"LOD": 5})]
+
+
+def test_unnamed_values_need_a_property_name():
+    with pytest.raises(ValueError):
+        list(readValueTable(io.StringIO('{"Cube": 1}'), SnapshotFormats.Json))
+
+
+def test_plan_snapshot_exactly(makeObject):
+    cube = makeObject("Cube", LOD=1, Extra=1, Keep=1)
+    unmatched = []
+    engine = DecoratorEngine()
+
+    plan = planSnapshot(
+        engine, [("Cube", {"LOD": 2}), ("Gone", {"LOD": 1})], {"Cube": cube}, isExact=True, unmatched=unmatched, skipNames={"Keep"})
+    engine.apply(plan)
+
+    assert dict(cube) == {"LOD": 2, "Keep": 1}
+    assert unmatched == ["Gone"]
+
+
+def test_plan_snapshot_extending_keeps_values(makeObject):
+    cube = makeObject("Cube", LOD=1)
+    engine = DecoratorEngine()
+
+    engine.apply(planSnapshot(engine, [("Cube", {"LOD": 2, "Hide": 0})], {"Cube": cube}, action=DecoratorWorkerModes.Extend))
+
+    assert dict(cube) == {"LOD": 1, "Hide": 0}
@@ -0,0 +1,65 @@
+# Tests of parsing and comparing property values.
+
+import pytest
+from t1nker_custom_object_property_manager.propertyvalue import ValueTypes, isSameValue, parseValue, plainValue
+
+
+@pytest.mark.parametrize("text, valueType, expected", [
+    ("abc", ValueTypes.String, "abc"),
+    (" 42 ", ValueTypes.Int, 42),
+    ("1.5", ValueTypes.Float, 1.5),
+    ("Yes", ValueTypes.Bool, True),
+    ("off", ValueTypes.Bool, False),
+    ("[1, 2, 3]", ValueTypes.IntArray, [1, 2, 3]),
+    ("1, 2.5", ValueTypes.FloatArray, [1.0, 2.5]),
+])
+def test_parse_value(text, valueType, expected):
+    value = parseValue(text, valueType)
+
+    assert value == expected and type(value) is type(expected)
+
+
+@pytest.mark.parametrize("text, valueType", [
+    ("1.5", ValueTypes.Int),
+    ("maybe", ValueTypes.Bool),
+    ("[]", ValueTypes.IntArray),
+])
+def test_parse_invalid_value(text, valueType):
+    with pytest.raises(ValueError):
+        parseValue(text, valueType)
+
+
+def test_plain_value_copies_blender_arrays_and_groups():
+    class Array:
+        def to_list(self):
+            return [1, 2]
+
+    class Group:
+        def to_dict(self):
+            return {"a": 1}
+
+    assert plainValue(Array()) == [1, 2]
+    assert plainValue(Group()) == {"a": 1}
+    assert plainValue("text") == "text"
+
+
+@pytest.mark.parametrize("value, other, expected", [
+    (1, 1, True),
+    (1, 1.0, False),
+    ("1", 1, False),
+    ([1, 2], [1, 2], True),
+    ([1, 2], [1.0, 2.0], False),
+    ([1, 2], [1, 2, 3], False),
+    ({"a": [1]}, {"a": [1]}, True),
+    ({"a": 1}, {"b": 1}, False),
+    # Blender before 4.0 stores booleans as integers
+    (1, True, True),
+    (0, False, True),
+    (2, True, False),
+    ([1, 0], [True, False], True),
+    (1.0, True, False),
+    ("1", True, False),
+])
+def test_is_same_value(value, other, expected):
+    assert isSameValue(value, other) is expected
+    assert isSameValue(other, value) is expected
@@ -0,0 +1,143 @@
+# Tests of getting and caching information on the latest release, against a local server.
+
+import json
+import threading
+import time
+import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from t1nker_custom_object_property_manager.releasecheck import (
+    fetchLatestRelease, isNewerVersion, loadReleaseCache, saveReleaseCache)
+
+requests = pytest.importorskip("requests")
+
+release = {"name": "Version 2", "tag_name": "v2.0.0", "body": "Notes"}
+
+
+# Stand-in of the release API #####################################################################################################
+class ReleaseHandler(BaseHTTPRequestHandler):
+    """
+    Serves the latest release the way the API does, with the behavior chosen by the path.
+    """
+
+    def do_GET(self):
+        match self.path:
+            case "/release":
+                if self.headers.get("If-None-Match") == '"2"':
+                    self._send(304, b"", {"ETag": '"2"'})
+                else:
+                    self._send(200, json.dumps(release).encode(), {"ETag": '"2"', "Last-Modified": "Sat, 17 Oct 2026 10:00:00 GMT"})
+            case "/unchanged":
+                self._send(304, b"")
+            case "/slow":
+                time.sleep(1)
+                self._send(200, json.dumps(release).encode())
+            case "/malformed":
+                self._send(200, b"<html>Rate limit exceeded</html>")
+            case "/incomplete":
+                self._send(200, b'{"name": "Version 2"}')
+            case _:
+                self._send(404, b"{}")
+
+    def _send(self, status: int, body: bytes, headers: dict = {}):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    """
+    Base URL of a release API running on localhost.
+    """
+    httpServer = ThreadingHTTPServer(("127.0.0.1", 0), ReleaseHandler)
+    thread = threading.Thread(target=httpServer.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{httpServer.server_address[1]}"
+
+    httpServer.shutdown()
+    httpServer.server_close()
+
+
+# Fetching ########################################################################################################################
+
+def test_new_release_is_cached_with_validators(server):
+    cache = {}
+
+    assert fetchLatestRelease(f"{server}/release", cache=cache) == {"name": "Version 2", "tag_name": "v2.0.0"}
+    assert cache["release"] == {"name": "Version 2", "tag_name": "v2.0.0"}
+    assert cache["etag"] == '"2"' and cache["lastModified"].startswith("Sat")
+    assert time.time() - cache["checkedAt"] < 60
+
+
+def test_unchanged_release_is_taken_from_cache(server):
+    cache = {"release": {"name": "Version 2", "tag_name": "v2.0.0"}, "etag": '"2"', "checkedAt": 0}
+
+    assert fetchLatestRelease(f"{server}/release", cache=cache) == cache["release"]
+    assert cache["checkedAt"] > 0
+
+
+@pytest.mark.parametrize("cache", [None, {}, {"etag": '"2"'}])
+def test_unchanged_without_cached_release_is_an_error(server, cache):
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetchLatestRelease(f"{server}/unchanged", cache=cache)
+
+
+def test_timeout(server):
+    with pytest.raises(requests.exceptions.Timeout):
+        fetchLatestRelease(f"{server}/slow", timeout=0.2)
+
+
+def test_malformed_body(server):
+    cache = {"release": {"name": "Version 1", "tag_name": "v1.0.0"}}
+
+    with pytest.raises(requests.exceptions.RequestException):
+        fetchLatestRelease(f"{server}/malformed", cache=cache)
+
+    with pytest.raises(KeyError):
+        fetchLatestRelease(f"{server}/incomplete", cache=cache)
+
+    assert cache == {"release": {"name": "Version 1", "tag_name": "v1.0.0"}}
+
+
+def test_server_error(server):
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetchLatestRelease(f"{server}/missing")
+
+
+# Caching and comparing ###########################################################################################################
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = {"release": {"name": "Version 2", "tag_name": "v2.0.0"}, "etag": '"2"', "checkedAt": 1.5}
+
+    saveReleaseCache(path, cache)
+
+    assert loadReleaseCache(path) == cache
+    assert list(tmp_path.iterdir()) == [tmp_path / "cache.json"]
+
+
+@pytest.mark.parametrize("content", ["", "[]", '{"etag": "x"}', "{broken"])
+def test_invalid_cache_is_ignored(tmp_path, content):
+    path = tmp_path / "cache.json"
+    path.write_text(content)
+
+    assert loadReleaseCache(str(path)) == {}
+    assert loadReleaseCache(str(tmp_path / "missing.json")) == {}
+
+
+@pytest.mark.parametrize("tag, expected", [("v1.2.4", True), ("1.3", True), ("v1.2.3-beta", False), ("v1.1.9", False)])
+def test_is_newer_version(tag, expected):
+    assert isNewerVersion(tag, (1, 2, 3)) is expected
+
+
+def test_tag_without_version_is_rejected():
+    with pytest.raises(ValueError):
+        isNewerVersion("latest", (1, 0, 0))
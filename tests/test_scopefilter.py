@@ -0,0 +1,80 @@
+# Tests of filters of objects in scope and conditions on values.
+
+import pytest
+from t1nker_custom_object_property_manager.scopefilter import (
+    PropertyConditions, ValueConditions, combine, compileFilter, compileValueCondition)
+
+
+def test_no_criteria_make_no_predicate():
+    assert compileFilter() is None
+    assert compileValueCondition(ValueConditions.Any) is None
+    assert combine(None, None) is None
+
+
+def test_filter_by_type_collection_and_name(makeObject):
+    cube, lamp, other = makeObject("Cube.001"), makeObject("Cube.002"), makeObject("Sphere")
+    lamp.type = "LIGHT"
+
+    check = compileFilter(objectTypes=["MESH"], collectionObjects=[cube, lamp, other], namePattern="Cube.*")
+
+    assert [check(object) for object in (cube, lamp, other)] == [True, False, False]
+
+
+def test_filter_by_regular_expression(makeObject):
+    check = compileFilter(namePattern=r"LOD\d$", nameIsRegex=True)
+
+    assert check(makeObject("LOD1")) and not check(makeObject("LOD10"))
+
+    with pytest.raises(ValueError):
+        compileFilter(namePattern="(", nameIsRegex=True)
+
+
+@pytest.mark.parametrize("condition, comparison, value, expected", [
+    (PropertyConditions.Has, "==", None, [True, True, False]),
+    (PropertyConditions.HasNot, "==", None, [False, False, True]),
+    (PropertyConditions.Compare, ">=", "2", [False, True, False]),
+    (PropertyConditions.Compare, "==", "high", [False, False, False]),
+])
+def test_filter_by_property(makeObject, condition, comparison, value, expected):
+    objects = [makeObject("Cube", LOD=1), makeObject("Cone", LOD=10), makeObject("Plane")]
+
+    check = compileFilter(propertyName="LOD", propertyCondition=condition, comparison=comparison, value=value)
+
+    assert [check(object) for object in objects] == expected
+
+
+def test_numbers_are_compared_numerically_text_as_text():
+    assert compileValueCondition(ValueConditions.Equals, "2")(2.0)
+    assert compileValueCondition(ValueConditions.NotEquals, "2")(10)
+    assert compileValueCondition(ValueConditions.Equals, "abc")("abc")
+
+
+def test_regex_matches_whole_value():
+    check = compileValueCondition(ValueConditions.Regex, "LOD[0-2]")
+
+    assert check("LOD1") and not check("LOD12")
+
+
+def test_range_only_passes_numbers():
+    check = compileValueCondition(ValueConditions.Range, minimum=1, maximum=3)
+
+    assert [check(value) for value in (0, 1, 2.5, 3, 4, "2", True)] == [False, True, True, True, False, False, False]
+
+
+def test_unknown_comparison_is_rejected():
+    with pytest.raises(ValueError):
+        compileFilter(propertyName="LOD", propertyCondition=PropertyConditions.Compare, comparison="=~", value=1)
+
+
+def test_combine_requires_all():
+    check = combine(lambda value: value > 0, None, lambda value: value < 10)
+
+    assert check(5) and not check(10)
+
+
+@pytest.mark.parametrize("value", ["true", "1", "yes"])
+def test_booleans_match_whether_stored_as_booleans_or_integers(value):
+    check = compileValueCondition(ValueConditions.Equals, value)
+
+    assert check(True) and check(1)
+    assert not check(False) and not check(0)
@@ -0,0 +1,40 @@
+# Tests of property values computed for each object from templates.
+
+import pytest
+from t1nker_custom_object_property_manager.propertyvalue import ValueTypes
+from t1nker_custom_object_property_manager.valuetemplate import ValueTemplate, isTemplate
+
+
+def test_render_fields(makeObject):
+    object = makeObject("Cube")
+    object.users_collection = [makeObject("Props")]
+
+    assert ValueTemplate("{collection}_{name}_{index:03d}").render(object, 7) == "Props_Cube_007"
+
+
+def test_render_without_collection_or_data(makeObject):
+    assert ValueTemplate("[{collection}{data}]").render(makeObject("Cube")) == "[]"
+
+
+def test_rendered_text_is_converted_to_type(makeObject):
+    assert ValueTemplate("{index}", ValueTypes.Int).render(makeObject("Cube"), 12) == 12
+
+
+def test_literal_braces_are_kept(makeObject):
+    assert ValueTemplate("{{{name}}}").render(makeObject("Cube")) == "{Cube}"
+
+
+@pytest.mark.parametrize("text", ["{unknown}", "{name!r}", "{name", "{index:{name}}"])
+def test_invalid_templates_are_rejected(text):
+    with pytest.raises(ValueError):
+        ValueTemplate(text)
+
+
+def test_conversion_error_is_raised_when_rendering(makeObject):
+    with pytest.raises(ValueError):
+        ValueTemplate("{name}", ValueTypes.Int).render(makeObject("Cube"))
+
+
+@pytest.mark.parametrize("text, expected", [("{name}", True), ("{{name}}", False), ("plain", False), ("{name", True)])
+def test_is_template(text, expected):
+    assert isTemplate(text) is expected
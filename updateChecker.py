@@ -49,9 +49,12 @@
 
 from __future__ import annotations
 from . import bl_info
-import requests
-import re
+import bpy
+import os
+import threading
+import time
 from datetime import datetime
+from .releasecheck import fetchLatestRelease, isNewerVersion, loadReleaseCache, saveReleaseCache
 from bpy.types import PropertyGroup, Operator, Context
 from bpy.props import StringProperty, BoolProperty, IntProperty
 
@@ -139,6 +142,186 @@ class T1nkerDecoratorUpdateInfo(PropertyGroup):
     Date and time of last successful check for updates.
     """
         
+# Background update checking ######################################################################################################
+
+_checkThread: threading.Thread = None
+"""
+The thread checking for updates, if any has been started.
+"""
+
+_checkResult: dict = None
+"""
+Result of the last check made by the thread, not yet published to the preferences.
+"""
+
+_cacheFileName = "t1nker-copm-update-cache.json"
+"""
+Name of the file in Blender's user config folder to cache the latest release information in. The file is shared by all Blender
+sessions and instances of the user on the machine.
+"""
+
+# Start checking for updates ------------------------------------------------------------------------------------------------------
+def startUpdateCheck(url: str = None, maxAgeDays: float = 0, cachePath: str = None) -> bool:
+    """
+    Start checking for updates on a background thread, unless a check is already running. The result is published to the
+    add-on preferences on the main thread by a timer, as Blender data shall not be changed from other threads.
+    
+    The check is served from the cache file shared by Blender sessions and instances if any of them checked in the last
+    `maxAgeDays` days, otherwise a conditional request is sent with the validators of the cached response.
+
+    Args:
+        url (str, optional): API URL to get latest release information from. Defaults to `RepoInfo.repoReleaseApiUrl`.
+        maxAgeDays (float, optional): Days cached information is served without contacting the server. Defaults to 0.
+        cachePath (str, optional): The cache file. Defaults to a file in Blender's user config folder.
+
+    Returns:
+        bool: `True` if a check has been started, `False` if one is already running.
+    """
+    global _checkThread
+    
+    if _checkThread is not None and _checkThread.is_alive():
+        return False
+    
+    # Resolve the path here, the thread shall not call Blender
+    if cachePath is None:
+        cachePath = _defaultCachePath()
+    
+    _checkThread = threading.Thread(target=_runUpdateCheck, args=(url, maxAgeDays, cachePath), name="T1nk-R update check", daemon=True)
+    _checkThread.start()
+    
+    if not bpy.app.timers.is_registered(_publishUpdateCheck):
+        bpy.app.timers.register(_publishUpdateCheck, first_interval=0.5, persistent=True)
+    
+    return True
+
+# Wait for the update check -------------------------------------------------------------------------------------------------------
+def waitForUpdateCheck(timeout: float = None) -> bool:
+    """
+    Wait for the background update check to finish. Meant for scripts and tests, never call it from operators.
+
+    Args:
+        timeout (float, optional): Seconds to wait at most. Defaults to None, meaning no limit.
+
+    Returns:
+        bool: `True` if no check is running anymore.
+    """
+    if _checkThread is not None:
+        _checkThread.join(timeout)
+    
+    return _checkThread is None or not _checkThread.is_alive()
+
+# Stop publishing update checks ---------------------------------------------------------------------------------------------------
+def unregister():
+    """
+    Stop the timer publishing the result of the background update check, upon disabling the add-on. A check still running
+    finishes in the background, and its result is dropped.
+    """
+    global _checkResult
+    
+    if bpy.app.timers.is_registered(_publishUpdateCheck):
+        bpy.app.timers.unregister(_publishUpdateCheck)
+    
+    _checkResult = None
+
+# Check for updates (background thread) -------------------------------------------------------------------------------------------
+def _runUpdateCheck(url: str, maxAgeDays: float, cachePath: str):
+    """
+    Get release information from the cache or the server, and store the result to be published. Runs on the background thread.
+
+    Args:
+        url (str): API URL to get latest release information from, or `None` for the default.
+        maxAgeDays (float): Days cached information is served without contacting the server.
+        cachePath (str): The cache file, or `None` not to use a cache file.
+    """
+    global _checkResult
+    
+    try:
+        import requests
+    except ImportError as ex:
+        # Report it like other errors instead of ending the thread silently
+        _checkResult = {"error": f"Error during version check: {ex}"}
+        return
+    
+    cache = loadReleaseCache(cachePath) if cachePath else {}
+    
+    # Another session or instance may have checked recently
+    if "release" in cache and time.time() - cache.get("checkedAt", 0) < maxAgeDays * 86400:
+        _checkResult = {**cache["release"], "checkedAt": cache["checkedAt"]}
+        return
+    
+    try: # if anything goes wrong we silently fail, no need to perform double-checks
+        release = fetchLatestRelease(url or RepoInfo.repoReleaseApiUrl, cache=cache, auth=(RepoInfo.username, RepoInfo.token))
+    except requests.exceptions.Timeout:
+        # Timeout, let's not bother the user
+        _checkResult = {"error": "Version checking timed out"}
+        return
+    except Exception as ex: 
+        _checkResult = {"error": f"Error during version check: {ex}"}
+        return
+    
+    if cachePath:
+        saveReleaseCache(cachePath, cache)
+    
+    _checkResult = {**release, "checkedAt": cache["checkedAt"]}
+
+# Get the default cache file ------------------------------------------------------------------------------------------------------
+def _defaultCachePath() -> str:
+    """
+    Get the path of the cache file in Blender's user config folder. Call it on the main thread.
+
+    Returns:
+        str: The cache file, or `None` if the config folder is not available.
+    """
+    try:
+        configFolder = bpy.utils.user_resource('CONFIG', create=True)
+    except Exception:
+        return None
+    
+    return os.path.join(configFolder, _cacheFileName) if configFolder else None
+
+# Publish the result of the update check (main thread) ----------------------------------------------------------------------------
+def _publishUpdateCheck():
+    """
+    Copy the result of the background update check to the add-on preferences. Runs on the main thread as a timer.
+
+    Returns:
+        float: Seconds to run again if the check is still running, `None` otherwise to stop the timer.
+    """
+    global _checkResult
+    
+    if _checkThread is not None and _checkThread.is_alive():
+        return 0.5
+    
+    result = _checkResult
+    _checkResult = None
+    
+    if result is None:
+        return None
+    
+    try:
+        updateInfo = bpy.context.preferences.addons[__package__].preferences.updateInfo
+        
+        if "error" in result:
+            print(result["error"])
+            updateInfo.updateAvailable = False
+            return None
+        
+        updateInfo.latestVersionName = result["name"]
+        updateInfo.latestVersion = result["tag_name"]
+        
+        # Get installed version (already stored as a list by Blender)
+        installedVersionTags = bl_info["version"]
+        updateInfo.currentVersion = ".".join([str(i) for i in installedVersionTags])
+        
+        updateInfo.updateAvailable = isNewerVersion(updateInfo.latestVersion, installedVersionTags)
+        
+        # Save timestamp of when the information was obtained from the server, maybe by another instance
+        updateInfo.lastCheckedTimestamp = f"{datetime.strftime(datetime.fromtimestamp(result['checkedAt']), '%Y-%m-%d %H:%M:%S')}"
+    except Exception as ex:
+        print(f"Error during version check: {ex}")
+    
+    return None
+
 # Operator for checking updates ###################################################################################################
 class T1NKER_OT_DecoratorUpdateChecker(Operator):    
     """
@@ -151,7 +334,7 @@ class T1NKER_OT_DecoratorUpdateChecker(Operator):
     bl_idname = "t1nker.decoratorupdatechecker"
     bl_label = "Check updates for T1nk-R Custom Object Property Manager"
     bl_description = "Check updates for T1nk-R Custom Object Property Manager"
-    bl_options = {'REGISTER', 'UNDO'}    
+    bl_options = {'REGISTER'}    
     bl_category = "T1nk-R Utils"
 
     # Other properties ------------------------------------------------------------------------------------------------------------
@@ -167,8 +350,8 @@ class T1NKER_OT_DecoratorUpdateChecker(Operator):
     def execute(self, context: Context):
         """
         Performs update check for the add-on and caches results. The cache expires in some days as specified in
-        `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`, and then new check is performed. Until that the
-        cached information is served.
+        `updateInfo.T1nkerDecoratorUpdateInfo.checkFrequencyDays`, and then new check is started on a background thread
+        (see `startUpdateCheck`). Until that the cached information is served. This never waits for the network.
 
         Args:
             context (bpy.types.Context): A context object passed on by Blender for the current context.
@@ -180,57 +363,25 @@ class T1NKER_OT_DecoratorUpdateChecker(Operator):
                 
         updateInfo = context.preferences.addons[__package__].preferences.updateInfo
         
+        forceCheck = self.forceUpdateCheck
+        
         # Check cache expiry only if update check is not forced
-        if not self.forceUpdateCheck:                    
+        if not forceCheck:                    
             # Check if update check shall be performed based on frequency
             try:                        
                 lastCheckDate = datetime.strptime(updateInfo.lastCheckedTimestamp, '%Y-%m-%d %H:%M:%S')
                 delta = datetime.now() - lastCheckDate
                 if delta.days < updateInfo.checkFrequencyDays: # Successfully checked for updates in the last checkFrequencyDays number of days
                     # Do not flood the repo API, use cached info
-                    return
+                    return {'FINISHED'}
             except: # For example, lastCheck is None as no update check was ever performed yet
                 # Could not determine when last update check was performed, do nothing (check it now)
                 pass
         else: # turn forcing check off to prevent accidental flooding                
             self.forceUpdateCheck = False
         
-        try: # if anything goes wrong we silently fail, no need to perform double-checks
-            response = requests.get(RepoInfo.repoReleaseApiUrl, timeout=5, auth=(RepoInfo.username, RepoInfo.token))            
+        # Check on a background thread, never block the operator calling this on network I/O. Information cached by other
+        # sessions is accepted for the same period, unless the check is forced.
+        startUpdateCheck(maxAgeDays=0 if forceCheck else updateInfo.checkFrequencyDays)
         
-            updateInfo.latestVersionName = response.json()["name"]
-            updateInfo.latestVersion = response.json()["tag_name"]
-            
-            # Trim leading v and eventual trailing qualifiers such as -alpha
-            latestVersionCleaned = re.match("[v]((\d+\.)*(\d+)).*", updateInfo.latestVersion)[1]
-            
-            # Parse into a list
-            latestVersionTags = [int(t) for t in latestVersionCleaned.split(".")]
-            
-            # Get installed version (already stored as a list by Blender)
-            installedVersionTags = bl_info["version"]
-            updateInfo.currentVersion = ".".join([str(i) for i in installedVersionTags])
-            
-            updateInfo.updateAvailable = False
-            
-            if latestVersionTags[0] > installedVersionTags[0]:
-                updateInfo.updateAvailable = True
-            else:
-                if latestVersionTags[1] > installedVersionTags[1]:
-                    updateInfo.updateAvailable = True
-                else:
-                    if len(installedVersionTags) > 2 and latestVersionTags[2] > installedVersionTags[2]:
-                        updateInfo.updateAvailable = True
-                        
-            # Save timestamp
-            updateInfo.lastCheckedTimestamp = f"{datetime.strftime(datetime.now(), '%Y-%m-%d %H:%M:%S')}"
-            
-        except requests.exceptions.Timeout as tex:
-            # Timeout, let's not bother the user
-            print("Version checking timed out")
-            updateInfo.updateAvailable = False
-        except Exception as ex: 
-            print(f"Error during version check: {ex}")
-            updateInfo.updateAvailable = False
-                
         return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,191 @@
+# T1nk-R's Custom Object Property Manager add-on for Blender
+# - part of T1nk-R Utilities for Blender
+#
+# Version: Please see the version tag under bl_info in __init__.py.
+#
+# This module contains templates of property values computed for each object.
+#
+# Module and add-on authored by T1nk-R (https://github.com/gusztavj/)
+#
+# PURPOSE & USAGE *****************************************************************************************************************
+# You can use this add-on to add, edit and remove custom object properties for specific objects or in batches.
+#
+# Help, support, updates and anything else: https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# COPYRIGHT ***********************************************************************************************************************
+#
+# ** MIT License **
+# 
+# Copyright (c) 2023-2024, T1nk-R (Gusztáv Jánvári)
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including without limitation the rights to use, copy, modify, 
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the Software is 
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE 
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT 
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, 
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# 
+# ** Commercial Use **
+# 
+# I would highly appreciate to get notified via [janvari.gusztav@imprestige.biz](mailto:janvari.gusztav@imprestige.biz) about 
+# any such usage. I would be happy to learn this work is of your interest, and to discuss options for commercial support and 
+# other services you may need.
+#
+# DISCLAIMER **********************************************************************************************************************
+# This add-on is provided as-is. Use at your own risk. No warranties, no guarantee, no liability,
+# no matter what happens. Still I tried to make sure no weird things happen:
+#   * This add-on may add and delete custom object properties based on your instructions.
+#   * This add-on is not intended to modify your objects and other Blender assets in any other way.
+#   * You shall be able to simply undo consequences made by this add-on.
+#
+# You may learn more about legal matters on page https://github.com/gusztavj/Custom-Object-Property-Manager
+#
+# *********************************************************************************************************************************
+
+from string import Formatter
+from typing import Any, Callable, Optional
+from .propertyvalue import ValueTypes, parseValue
+
+# Constants #######################################################################################################################
+
+templateFields: dict[str, Callable[[Any, int], Any]] = {
+    "name": lambda object, index: object.name,
+    "type": lambda object, index: getattr(object, "type", ""),
+    "parent": lambda object, index: _nameOf(getattr(object, "parent", None)),
+    "collection": lambda object, index: _nameOf(next(iter(getattr(object, "users_collection", ())), None)),
+    "data": lambda object, index: _nameOf(getattr(object, "data", None)),
+    "index": lambda object, index: index,
+}
+"""
+Fields templates can refer to, by name, with functions getting their values from an object and its position in the operation.
+Nothing else can be evaluated, so templates are safe to take from anyone.
+"""
+
+# Template of a property value ####################################################################################################
+class ValueTemplate:
+    """
+    A property value computed for each object from a template such as `{collection}_{name}`, using the syntax of Python format
+    strings limited to `templateFields`, with optional format specifications such as `{index:03d}`. Use `{{` and `}}` for
+    literal braces. The template is parsed once when made, rendering it for an object only joins strings.
+    """
+
+    # Lifecycle management ========================================================================================================
+
+    # Initialize object -----------------------------------------------------------------------------------------------------------
+    def __init__(self, text: str, valueType: ValueTypes = ValueTypes.String):
+        """
+        Parse a template.
+
+        Args:
+            text (str): The template.
+            valueType (ValueTypes, optional): The type to convert rendered text to. Defaults to ValueTypes.String.
+
+        Raises:
+            ValueError: If the template is not valid, or refers to a field not in `templateFields`.
+        """
+
+        self.text = text
+        """
+        The template as specified.
+        """
+
+        self.valueType = valueType
+        """
+        The type rendered text is converted to.
+        """
+
+        self.parts: list[tuple[str, Optional[Callable[[Any, int], Any]], str]] = []
+        """
+        Literal text, and the function getting the value of a field with its format specification (or `None` and "" after the
+        last field), in the order they are joined.
+        """
+
+        try:
+            parsed = list(Formatter().parse(text))
+        except ValueError as ex:
+            raise ValueError(f"Invalid value template '{text}': {ex}")
+
+        for literal, field, formatSpec, conversion in parsed:
+            if field is None:
+                self.parts.append((literal, None, ""))
+                continue
+
+            if field not in templateFields:
+                raise ValueError(f"Unknown field '{{{field}}}' in value template '{text}', use one of {', '.join(templateFields)}")
+
+            if conversion is not None or "{" in formatSpec:
+                raise ValueError(f"Only fields with plain format specifications are supported in value template '{text}'")
+
+            self.parts.append((literal, templateFields[field], formatSpec))
+
+    # Describe the template -------------------------------------------------------------------------------------------------------
+    def __str__(self) -> str:
+        """
+        Get the template as specified, such as to log it.
+
+        Returns:
+            str: The template.
+        """
+        return self.text
+
+    # Public functions ============================================================================================================
+
+    # Render the template for an object -------------------------------------------------------------------------------------------
+    def render(self, object: Any, index: int = 0) -> Any:
+        """
+        Compute the value for an object.
+
+        Args:
+            object (Any): The object, such as a Blender object.
+            index (int, optional): Position of the object in the operation, starting from 0. Defaults to 0.
+
+        Raises:
+            ValueError: If a value doesn't fit its format specification, or the text rendered cannot be converted to the type.
+
+        Returns:
+            Any: The value, converted to the type of the template.
+        """
+        text = "".join(
+            literal if field is None else literal + format(field(object, index), formatSpec)
+            for literal, field, formatSpec in self.parts)
+
+        return text if self.valueType == ValueTypes.String else parseValue(text, self.valueType)
+
+# Functions #######################################################################################################################
+
+# Tell if text is a template ------------------------------------------------------------------------------------------------------
+def isTemplate(text: str) -> bool:
+    """
+    Tell if a value refers to any field, that is, whether it shall be treated as a template, not as a constant.
+
+    Args:
+        text (str): The value as typed.
+
+    Returns:
+        bool: `True` if the value contains a field, `False` otherwise.
+    """
+    try:
+        return any(field is not None for _, field, _, _ in Formatter().parse(text))
+    except ValueError:
+        # Not valid as a template, making it one tells why
+        return "{" in text
+
+# Private functions ###############################################################################################################
+
+# Get the name of an object -------------------------------------------------------------------------------------------------------
+def _nameOf(object: Any) -> str:
+    """
+    Get the name of an object which may be missing.
+
+    Args:
+        object (Any): The object, or `None`.
+
+    Returns:
+        str: The name, or "" if there is no object.
+    """
+    return "" if object is None else object.name